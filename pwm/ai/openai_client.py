@@ -2,6 +2,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Tuple
+import functools
 import os
 import sys
 import httpx
@@ -36,12 +37,26 @@ class OpenAIClient:
         if not api_key:
             return None
 
+        return cls._shared(
+            openai.get("base_url", DEFAULT_OPENAI_API).rstrip("/"),
+            api_key,
+            openai.get("model", DEFAULT_MODEL),
+            openai.get("max_tokens", DEFAULT_MAX_TOKENS),
+            openai.get("temperature", DEFAULT_TEMPERATURE),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _shared(
+        cls, base_url: str, api_key: str, model: str, max_tokens: int, temperature: float
+    ) -> "OpenAIClient":
+        """One client per settings combination, reused across lookups."""
         return cls(
-            base_url=openai.get("base_url", DEFAULT_OPENAI_API).rstrip("/"),
+            base_url=base_url,
             api_key=api_key,
-            model=openai.get("model", DEFAULT_MODEL),
-            max_tokens=openai.get("max_tokens", DEFAULT_MAX_TOKENS),
-            temperature=openai.get("temperature", DEFAULT_TEMPERATURE)
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
         )
 
     def _headers(self) -> dict:
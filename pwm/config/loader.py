@@ -10,6 +10,16 @@ import tomllib as _toml
 
 USER_CONFIG_PATH = Path.home() / ".config" / "pwm" / "config.toml"
 PROJECT_CONFIG_BASENAME = ".pwm.toml"
+# Environment variables that load_merged_config layers over the config files
+ENV_OVERRIDE_VARS = (
+    "PWM_JIRA_TOKEN",
+    "PWM_JIRA_BASE_URL",
+    "PWM_JIRA_EMAIL",
+    "GITHUB_TOKEN",
+    "PWM_GITHUB_TOKEN",
+    "PWM_OPENAI_API_KEY",
+    "OPENAI_API_KEY",
+)
 
 def _load_toml(path: Path) -> Dict[str, Any]:
     with path.open("rb") as f:
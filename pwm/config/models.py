@@ -55,6 +55,9 @@ class DailySummaryConfig(BaseModel):
     include_own_prs_only: bool = True
     include_own_issues_only: bool = True
 
+    # Query options
+    page_size: int = 100  # Results requested per GitHub/Jira search call
+
     # Display options
     default_format: str = "markdown"  # "text" or "markdown"
     show_commit_details: bool = True
@@ -1,9 +1,13 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+import os
+import re
 import subprocess
 
+from pwm.config import loader
 from pwm.config.loader import load_merged_config
 from pwm.context.types import ContextMeta
 from pwm.vcs.remote_url import parse_repo_from_remote_url
@@ -22,8 +26,34 @@ class Context:
         return pattern.format(issue_key=issue_key, slug=slug)
 
 def resolve_context(cwd: Path | None = None) -> Context:
+    """
+    Resolve the repo, merged config and GitHub repo for cwd.
+
+    Results are cached per repo root and reused until a config file or a
+    config environment variable changes, so callers must not mutate the
+    returned Context.
+    """
     cwd = cwd or Path.cwd()
     repo_root = find_git_root(cwd)
+    return _resolve_for_root(repo_root, _config_stamp(repo_root))
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+def _config_stamp(repo_root: Path) -> tuple:
+    """Change-detection key covering the config files, remotes and env overrides."""
+    return (
+        _mtime_ns(loader.USER_CONFIG_PATH),
+        _mtime_ns(repo_root / loader.PROJECT_CONFIG_BASENAME),
+        _mtime_ns(repo_root / ".git" / "config"),  # remotes for infer_github_repo
+        tuple(os.getenv(name) for name in loader.ENV_OVERRIDE_VARS),
+    )
+
+@lru_cache(maxsize=8)
+def _resolve_for_root(repo_root: Path, config_stamp: tuple) -> Context:
     config, meta = load_merged_config(repo_root)
     github_repo = infer_github_repo(repo_root, config)
     jira_project_key = config.get("jira", {}).get("project_key") or None
@@ -46,8 +76,8 @@ def infer_github_repo(repo_root: Path, config: dict) -> str | None:
         return None
     return parse_repo_from_remote_url(url)
 
+_NON_SLUG_CHARS = re.compile(r"[^a-z0-9]+")
+
 def slugify(s: str) -> str:
-    import re
-    s = s.lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
+    s = _NON_SLUG_CHARS.sub("-", s.lower()).strip("-")
     return s[:50]
@@ -1,18 +1,218 @@
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional, Tuple
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+import functools
+import importlib.util
 import os
+import random
+import re
 import sys
+import threading
+import time
 import httpx
 
+from pwm.shared_http import SharedHTTPClient
+
 DEFAULT_GH_API = "https://api.github.com"
+# Enough keep-alive connections for the concurrent work-end / summary calls
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+_CONNECT_RETRIES = 2  # transport-level retries of failed connection attempts
+# HTTP/2 multiplexes concurrent requests over one connection; it needs the
+# optional h2 package (pip install "httpx[http2]")
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_ETAG_CACHE_SIZE = 256
+_DETAIL_WORKERS = 8  # concurrent PR detail fetches, within the pool limits
+_MAX_RETRIES = 3
+_BACKOFF_BASE = 0.5  # seconds; doubled per retry of a 5xx GET
+_LIST_PAGE_SIZE = 100  # GitHub's maximum; its default is 30
+_MAX_LIST_PAGES = 10
+_MAX_RATE_LIMIT_WAIT = 60.0  # longer waits fail fast instead of stalling the CLI
+PWM_COMMENT_MARKER = "<!-- pwm:work-end -->"
+# Matches the marker even if an editor reflowed the whitespace inside it
+_PWM_MARKER_RE = re.compile(r"<!--\s*pwm:work-end\s*-->")
+
+# PR for a head branch with its pending review requests and latest comments,
+# covering what work-end needs in a single request. The page infos say whether
+# older comments or further same-named PRs were left out.
+_PR_FOR_BRANCH_QUERY = """
+query($owner: String!, $name: String!, $branch: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(headRefName: $branch, first: 10, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage }
+      nodes {
+        number
+        title
+        url
+        headRepositoryOwner { login }
+        reviewRequests(first: 20) {
+          nodes { requestedReviewer { ... on User { login } ... on Team { slug } } }
+        }
+        comments(last: 100) { pageInfo { hasPreviousPage } nodes { body createdAt } }
+      }
+    }
+  }
+}
+"""
+
+# Fields fetched per PR by get_pr_details_batch, mapped back to REST names
+_PR_DETAIL_FIELDS = (
+    "number title url state merged mergedAt closedAt createdAt updatedAt "
+    "author { login } additions deletions changedFiles"
+)
+# REST pulls keys returned for each detailed PR by get_closed_prs, whichever
+# API supplied the details
+_PR_DETAIL_KEYS = (
+    "number", "title", "html_url", "state", "merged", "merged_at", "closed_at",
+    "created_at", "updated_at", "user", "additions", "deletions", "changed_files",
+)
+
+
+def _rest_pr_details(node: dict) -> dict:
+    """Reshape a GraphQL PullRequest node into the REST pulls payload keys."""
+    state = (node.get("state") or "").lower()
+    author = node.get("author")
+    return {
+        "number": node.get("number"),
+        "title": node.get("title"),
+        "html_url": node.get("url"),
+        # REST has no merged state: merged PRs are closed with merged_at set
+        "state": "closed" if state == "merged" else state,
+        "merged": node.get("merged"),
+        "merged_at": node.get("mergedAt"),
+        "closed_at": node.get("closedAt"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "user": {"login": author.get("login")} if author else None,
+        "additions": node.get("additions"),
+        "deletions": node.get("deletions"),
+        "changed_files": node.get("changedFiles"),
+    }
+
+
+def _pr_detail_subset(pr: dict) -> dict:
+    """Trim a REST pulls payload to the keys _rest_pr_details produces."""
+    details = {key: pr.get(key) for key in _PR_DETAIL_KEYS}
+    user = pr.get("user")
+    details["user"] = {"login": user.get("login")} if user else None
+    return details
+
+
+def _search_time(value: datetime) -> str:
+    """
+    Format a timestamp for a search qualifier with an explicit UTC offset.
+
+    GitHub reads offset-less search times as UTC, so naive (local) datetimes
+    are converted first; otherwise the window shifts by the local offset.
+    """
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+
+def _date_range(since: datetime, until: Optional[datetime] = None) -> str:
+    """Format a search date range, bounded on both ends when until is given."""
+    if until is None:
+        return f">={_search_time(since)}"
+    return f"{_search_time(since)}..{_search_time(until)}"
+
+
+def _header_number(headers, name: str) -> Optional[float]:
+    value = headers.get(name) if headers is not None else None
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _RateLimiter:
+    """
+    Pause window shared by every request from one GitHubClient.
+
+    Fed from GitHub's Retry-After and X-RateLimit-* headers, so concurrent
+    callers back off together instead of each tripping the limit.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def _rate_limit_wait(headers) -> Optional[float]:
+    """Seconds until the primary rate limit resets, when it is exhausted."""
+    if _header_number(headers, "X-RateLimit-Remaining") != 0:
+        return None
+    reset = _header_number(headers, "X-RateLimit-Reset")
+    return None if reset is None else max(reset - time.time(), 0.0)
+
+
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
+def _next_link(headers) -> Optional[str]:
+    """URL of the next page from a Link response header, if any."""
+    link = headers.get("Link") if headers is not None else None
+    if not isinstance(link, str):
+        return None
+    match = _NEXT_LINK_RE.search(link)
+    return match.group(1) if match else None
+
+
+def _parse_github_time(value: Optional[str]) -> Optional[datetime]:
+    # GitHub returns ISO 8601 format: "2024-01-15T10:30:45Z"; since Python 3.11
+    # fromisoformat reads the Z suffix itself, in C
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _latest_pwm_comment_time(
+    comments: list[dict], created_key: str = "created_at"
+) -> Optional[datetime]:
+    """Timestamp of the newest comment carrying PWM_COMMENT_MARKER, if any."""
+    # Only marked comments have their timestamps parsed; the rest are skipped
+    # after a single regex search.
+    times = (
+        _parse_github_time(comment.get(created_key))
+        for comment in comments
+        if _PWM_MARKER_RE.search(comment.get("body") or "")
+    )
+    return max((t for t in times if t is not None), default=None)
+
 
 @dataclass
 class GitHubClient:
     base_url: str
     token: str
+    _current_user: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _http: SharedHTTPClient = field(
+        default_factory=SharedHTTPClient, init=False, repr=False, compare=False
+    )
+    _base_headers: Optional[Mapping[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _rate_limiter: _RateLimiter = field(
+        default_factory=_RateLimiter, init=False, repr=False, compare=False
+    )
+    # URL (with query) -> (ETag, parsed body) for conditional GETs
+    _etag_cache: dict[str, tuple[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def _debug(self, message: str) -> None:
         """Emit debug diagnostics when PWM_DEBUG is enabled."""
@@ -26,16 +226,137 @@ class GitHubClient:
         base_url = gh.get("base_url") or DEFAULT_GH_API
         if not token:
             return None
-        return cls(base_url=base_url.rstrip("/"), token=token)
+        return cls._shared(base_url.rstrip("/"), token)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _shared(cls, base_url: str, token: str) -> 'GitHubClient':
+        """One client per (base_url, token), so helpers share its caches."""
+        return cls(base_url=base_url, token=token)
+
+    def _client(self) -> httpx.Client:
+        return self._http.get(self._open_http)
+
+    def _open_http(self) -> httpx.Client:
+        # Connection failures are retried inside the transport; HTTP-level
+        # throttling and 5xx responses are handled by _send
+        transport = httpx.HTTPTransport(
+            retries=_CONNECT_RETRIES, limits=_POOL_LIMITS, http2=_HTTP2
+        )
+        return httpx.Client(timeout=10.0, transport=transport)
+
+    def close(self) -> None:
+        self._http.close()
 
-    def _headers(self) -> dict:
-        return {"Authorization": f"Bearer {self.token}", "Accept": "application/vnd.github+json"}
+    def __enter__(self) -> 'GitHubClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _send(self, c: httpx.Client, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Issue a request, honouring GitHub rate limits.
+
+        Waits out any pause set by earlier responses, retries rate-limited
+        requests (403/429 with Retry-After or an exhausted quota) and, for
+        GETs only, 5xx responses with exponential backoff.
+        """
+        for attempt in range(_MAX_RETRIES + 1):
+            self._rate_limiter.wait()
+            r = getattr(c, method)(url, **kwargs)
+            delay = self._retry_delay(r, attempt, idempotent=method == "get")
+            if delay is None or attempt == _MAX_RETRIES:
+                return r
+            self._debug(f"{method.upper()} {url} returned HTTP {r.status_code}; retrying in {delay:.1f}s")
+            self._rate_limiter.pause(delay)
+        return r
+
+    def _retry_delay(self, r: httpx.Response, attempt: int, idempotent: bool) -> Optional[float]:
+        headers = getattr(r, "headers", None)
+        status = r.status_code
+        if not isinstance(status, int):
+            return None
+        if status in (403, 429):
+            wait = _header_number(headers, "Retry-After")
+            if wait is None:
+                wait = _rate_limit_wait(headers)
+            return wait if wait is not None and wait <= _MAX_RATE_LIMIT_WAIT else None
+
+        # Quota just ran out: hold later requests until it resets
+        wait = _rate_limit_wait(headers)
+        if wait is not None and wait <= _MAX_RATE_LIMIT_WAIT:
+            self._rate_limiter.pause(wait)
+        if status >= 500 and idempotent:
+            # Jittered so concurrent detail fetches do not retry in lockstep
+            return _BACKOFF_BASE * 2 ** attempt * random.uniform(0.5, 1.0)
+        return None
+
+    def _conditional_get(
+        self, c: httpx.Client, url: str, params: Optional[dict] = None, **kwargs
+    ) -> httpx.Response:
+        """
+        GET that revalidates against the ETag cache with If-None-Match.
+
+        A 304 is answered from the cached body as a 200 response, so callers
+        handle fresh and revalidated results the same way.
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        headers = self._headers()
+        cached = self._etag_cache.get(key)
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+        if params is not None:
+            kwargs["params"] = params
+
+        r = self._send(c, "get", url, headers=headers, **kwargs)
+        if r.status_code == 304 and cached:
+            return httpx.Response(200, json=cached[1])
+        if r.status_code == 200:
+            etag = r.headers.get("ETag")
+            if isinstance(etag, str):
+                if len(self._etag_cache) >= _ETAG_CACHE_SIZE:
+                    # Drop the oldest entry; dicts keep insertion order
+                    self._etag_cache.pop(next(iter(self._etag_cache)), None)
+                self._etag_cache[key] = (etag, r.json())
+        return r
+
+    def _get_pages(
+        self, c: httpx.Client, url: str, params: Optional[dict] = None
+    ) -> Tuple[int, list]:
+        """
+        GET a list endpoint at the maximum page size, following Link rel="next".
+
+        Returns the status of the first failing page (or 200) and the items
+        collected before it; at most _MAX_LIST_PAGES pages are fetched.
+        """
+        params = {**(params or {}), "per_page": _LIST_PAGE_SIZE}
+        items: list = []
+        for _ in range(_MAX_LIST_PAGES):
+            r = self._conditional_get(c, url, params=params)
+            if r.status_code != 200:
+                return r.status_code, items
+            items.extend(r.json())
+            # The next URL already carries the query string
+            url, params = _next_link(getattr(r, "headers", None)), None
+            if url is None:
+                break
+        return 200, items
+
+    def _headers(self) -> Mapping[str, str]:
+        # Built once per client and shared read-only by every request;
+        # callers that add headers copy it first
+        if self._base_headers is None:
+            self._base_headers = MappingProxyType(
+                {"Authorization": f"Bearer {self.token}", "Accept": "application/vnd.github+json"}
+            )
+        return self._base_headers
 
     def ping(self) -> Tuple[bool, str]:
         url = f"{self.base_url}/user"
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.get(url, headers=self._headers())
+            c = self._client()
+            r = self._send(c, "get", url, headers=self._headers())
         except Exception as e:
             self._debug(f"ping network error: {type(e).__name__}")
             return False, f"network error: {e}"
@@ -53,15 +374,21 @@ class GitHubClient:
         """
         Get the current authenticated user's login (username).
 
+        The login is cached on the client after the first successful lookup;
+        failures are not cached so a later call can retry.
+
         Returns the GitHub username or None on failure.
         """
+        if self._current_user is not None:
+            return self._current_user
         url = f"{self.base_url}/user"
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.get(url, headers=self._headers())
-                if r.status_code == 200:
-                    return r.json().get("login")
-                self._debug(f"get_current_user returned HTTP {r.status_code}")
+            c = self._client()
+            r = self._send(c, "get", url, headers=self._headers())
+            if r.status_code == 200:
+                self._current_user = r.json().get("login")
+                return self._current_user
+            self._debug(f"get_current_user returned HTTP {r.status_code}")
         except Exception:
             self._debug("get_current_user request raised exception")
         return None
@@ -83,11 +410,11 @@ class GitHubClient:
             params["head"] = head
 
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.get(url, headers=self._headers(), params=params)
-                if r.status_code == 200:
-                    return r.json()
-                self._debug(f"list_prs returned HTTP {r.status_code}")
+            c = self._client()
+            status, prs = self._get_pages(c, url, params)
+            if status == 200:
+                return prs
+            self._debug(f"list_prs returned HTTP {status}")
         except Exception:
             self._debug("list_prs request raised exception")
         return []
@@ -122,11 +449,11 @@ class GitHubClient:
             payload["body"] = body
 
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.post(url, headers=self._headers(), json=payload)
-                if r.status_code == 201:
-                    return r.json()
-                self._debug(f"create_pr returned HTTP {r.status_code}")
+            c = self._client()
+            r = self._send(c, "post", url, headers=self._headers(), json=payload)
+            if r.status_code == 201:
+                return r.json()
+            self._debug(f"create_pr returned HTTP {r.status_code}")
         except Exception:
             self._debug("create_pr request raised exception")
         return None
@@ -150,6 +477,97 @@ class GitHubClient:
         prs = self.list_prs(repo, head=head, state=state)
         return prs[0] if prs else None
 
+    def _graphql_url(self) -> str:
+        # GitHub Enterprise serves REST under /api/v3 and GraphQL at /api/graphql
+        if self.base_url.endswith("/api/v3"):
+            return self.base_url[: -len("/v3")] + "/graphql"
+        return f"{self.base_url}/graphql"
+
+    def graphql(
+        self, query: str, variables: Optional[dict] = None, allow_partial: bool = True
+    ) -> Optional[dict]:
+        """
+        Run a GraphQL v4 query and return its data.
+
+        Partial results are returned with the errors logged under PWM_DEBUG,
+        unless allow_partial is False; None means the request failed, produced
+        no data at all, or (with allow_partial=False) reported any error.
+        """
+        payload = {"query": query, "variables": variables or {}}
+        try:
+            c = self._client()
+            r = self._send(c, "post", self._graphql_url(), headers=self._headers(), json=payload)
+            if r.status_code != 200:
+                self._debug(f"graphql returned HTTP {r.status_code}")
+                return None
+            body = r.json()
+        except Exception:
+            self._debug("graphql request raised exception")
+            return None
+
+        if body.get("errors"):
+            self._debug(f"graphql returned {len(body['errors'])} error(s)")
+            if not allow_partial:
+                return None
+        return body.get("data")
+
+    def get_pr_for_branch_graphql(self, repo: str, branch: str) -> Optional[dict]:
+        """
+        Get the PR for a branch (any state) with review requests and the last
+        pwm comment time in one GraphQL request.
+
+        Returns a dict with number, title, html_url, requested_reviewers,
+        requested_teams and last_pwm_comment_time. last_pwm_comment_time is
+        left out when the newest 100 comments carry no marker but older ones
+        exist; callers then use get_last_pwm_comment_time.
+
+        Returns an empty dict when GraphQL answered that no PR matches, and
+        None when it could not answer (API unavailable, any GraphQL error, a
+        null repository, or more same-named fork PRs than one page holds), so
+        callers know when to fall back to REST.
+        """
+        if "/" not in repo:
+            return None
+        owner, name = repo.split("/", 1)
+        # Errors can null out any part of the answer, so partial data is not trusted
+        data = self.graphql(
+            _PR_FOR_BRANCH_QUERY, {"owner": owner, "name": name, "branch": branch},
+            allow_partial=False,
+        )
+        if data is None:
+            return None
+
+        # A null repository or pull request list (FORBIDDEN, NOT_FOUND, SAML
+        # enforcement) is not an answer; leave the lookup to REST
+        repository = data.get("repository")
+        pull_requests = repository.get("pullRequests") if repository else None
+        if pull_requests is None:
+            return None
+        for node in pull_requests.get("nodes") or []:
+            # Match REST's head=owner:branch filter, ignoring same-named fork branches
+            if ((node.get("headRepositoryOwner") or {}).get("login") or "").lower() != owner.lower():
+                continue
+            requested = [
+                (request.get("requestedReviewer") or {})
+                for request in (node.get("reviewRequests") or {}).get("nodes") or []
+            ]
+            pr = {
+                "number": node["number"],
+                "title": node.get("title", ""),
+                "html_url": node.get("url", ""),
+                "requested_reviewers": [r["login"] for r in requested if "login" in r],
+                "requested_teams": [r["slug"] for r in requested if "slug" in r],
+            }
+            # Comments come oldest first, so a marker in this page is the newest one
+            comments = node.get("comments") or {}
+            last_time = _latest_pwm_comment_time(comments.get("nodes") or [], "createdAt")
+            if last_time or not (comments.get("pageInfo") or {}).get("hasPreviousPage"):
+                pr["last_pwm_comment_time"] = last_time
+            return pr
+        if (pull_requests.get("pageInfo") or {}).get("hasNextPage"):
+            return None
+        return {}
+
     def get_pr_details(self, repo: str, pr_number: int) -> Optional[dict]:
         """
         Get detailed PR information including file stats.
@@ -163,15 +581,63 @@ class GitHubClient:
         url = f"{self.base_url}/repos/{repo}/pulls/{pr_number}"
 
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.get(url, headers=self._headers())
-                if r.status_code == 200:
-                    return r.json()
-                self._debug(f"get_pr_details #{pr_number} returned HTTP {r.status_code}")
+            c = self._client()
+            r = self._conditional_get(c, url)
+            if r.status_code == 200:
+                return r.json()
+            self._debug(f"get_pr_details #{pr_number} returned HTTP {r.status_code}")
         except Exception:
             self._debug(f"get_pr_details #{pr_number} request raised exception")
         return None
 
+    def get_pr_details_batch(
+        self, targets: list[tuple[str, int]]
+    ) -> Optional[dict[tuple[str, int], dict]]:
+        """
+        Get details for many PRs in one GraphQL request.
+
+        Args:
+            targets: (repo, pr_number) pairs, repo in "owner/repo" format
+
+        Returns {(repo, pr_number): details} using the REST field names for the
+        PRs that resolved, or None when the GraphQL API is unavailable.
+        """
+        by_repo: dict[str, list[int]] = {}
+        for repo, pr_number in targets:
+            by_repo.setdefault(repo, []).append(pr_number)
+        if not by_repo:
+            return {}
+
+        # One aliased repository block per repo and one aliased pullRequest per
+        # PR, so the whole page costs a single request
+        params = []
+        blocks = []
+        variables = {}
+        for i, (repo, numbers) in enumerate(by_repo.items()):
+            owner, _, name = repo.partition("/")
+            params.append(f"$o{i}: String!, $n{i}: String!")
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
+            prs = " ".join(
+                f"p{number}: pullRequest(number: {int(number)}) {{ {_PR_DETAIL_FIELDS} }}"
+                for number in dict.fromkeys(numbers)
+            )
+            blocks.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {prs} }}")
+        query = f"query({', '.join(params)}) {{ {' '.join(blocks)} }}"
+
+        data = self.graphql(query, variables)
+        if data is None:
+            return None
+
+        details = {}
+        for i, (repo, numbers) in enumerate(by_repo.items()):
+            repository = data.get(f"r{i}") or {}
+            for number in numbers:
+                node = repository.get(f"p{number}")
+                if node:
+                    details[(repo, number)] = _rest_pr_details(node)
+        return details
+
     def get_pr_reviews(self, repo: str, pr_number: int) -> list[dict]:
         """
         Get reviews for a pull request.
@@ -185,11 +651,11 @@ class GitHubClient:
         url = f"{self.base_url}/repos/{repo}/pulls/{pr_number}/reviews"
 
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.get(url, headers=self._headers())
-                if r.status_code == 200:
-                    return r.json()
-                self._debug(f"get_pr_reviews #{pr_number} returned HTTP {r.status_code}")
+            c = self._client()
+            status, items = self._get_pages(c, url)
+            if status == 200:
+                return items
+            self._debug(f"get_pr_reviews #{pr_number} returned HTTP {status}")
         except Exception:
             self._debug(f"get_pr_reviews #{pr_number} request raised exception")
         return []
@@ -207,11 +673,11 @@ class GitHubClient:
         url = f"{self.base_url}/repos/{repo}/issues/{pr_number}/comments"
 
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.get(url, headers=self._headers())
-                if r.status_code == 200:
-                    return r.json()
-                self._debug(f"get_pr_comments #{pr_number} returned HTTP {r.status_code}")
+            c = self._client()
+            status, items = self._get_pages(c, url)
+            if status == 200:
+                return items
+            self._debug(f"get_pr_comments #{pr_number} returned HTTP {status}")
         except Exception:
             self._debug(f"get_pr_comments #{pr_number} request raised exception")
         return []
@@ -230,11 +696,11 @@ class GitHubClient:
         url = f"{self.base_url}/repos/{repo}/issues/{pr_number}/comments"
 
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.post(url, headers=self._headers(), json={"body": body})
-                if r.status_code == 201:
-                    return r.json()
-                self._debug(f"add_pr_comment #{pr_number} returned HTTP {r.status_code}")
+            c = self._client()
+            r = self._send(c, "post", url, headers=self._headers(), json={"body": body})
+            if r.status_code == 201:
+                return r.json()
+            self._debug(f"add_pr_comment #{pr_number} returned HTTP {r.status_code}")
         except Exception:
             self._debug(f"add_pr_comment #{pr_number} request raised exception")
         return None
@@ -268,9 +734,9 @@ class GitHubClient:
             return False
 
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.post(url, headers=self._headers(), json=payload)
-                return r.status_code in (201, 200)
+            c = self._client()
+            r = self._send(c, "post", url, headers=self._headers(), json=payload)
+            return r.status_code in (201, 200)
         except Exception:
             self._debug(f"request_reviewers #{pr_number} request raised exception")
         return False
@@ -286,13 +752,13 @@ class GitHubClient:
         payload = {"labels": labels}
 
         try:
-            with httpx.Client(timeout=10.0) as c:
-                r = c.post(url, headers=self._headers(), json=payload)
-                if r.status_code in (200, 201):
-                    return True
-                self._debug(
-                    f"add_issue_labels #{issue_number} returned HTTP {r.status_code}"
-                )
+            c = self._client()
+            r = self._send(c, "post", url, headers=self._headers(), json=payload)
+            if r.status_code in (200, 201):
+                return True
+            self._debug(
+                f"add_issue_labels #{issue_number} returned HTTP {r.status_code}"
+            )
         except Exception:
             self._debug(f"add_issue_labels #{issue_number} request raised exception")
         return False
@@ -310,23 +776,7 @@ class GitHubClient:
 
         Returns datetime of the most recent pwm comment, or None if no pwm comments found.
         """
-        comments = self.get_pr_comments(repo, pr_number)
-
-        pwm_comments = []
-        for comment in comments:
-            body = comment.get("body", "")
-            if "<!-- pwm:work-end -->" in body:
-                created_at_str = comment.get("created_at")
-                if created_at_str:
-                    try:
-                        # GitHub returns ISO 8601 format: "2024-01-15T10:30:45Z"
-                        created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-                        pwm_comments.append(created_at)
-                    except Exception:
-                        self._debug("invalid created_at timestamp in PR comment")
-                        continue
-
-        return max(pwm_comments) if pwm_comments else None
+        return _latest_pwm_comment_time(self.get_pr_comments(repo, pr_number))
 
     def search_prs_by_date(
         self,
@@ -334,7 +784,9 @@ class GitHubClient:
         since: datetime,
         author: Optional[str] = None,
         state: str = "all",
-        org: Optional[str] = None
+        org: Optional[str] = None,
+        until: Optional[datetime] = None,
+        per_page: int = 100
     ) -> list[dict]:
         """
         Search for PRs created since a given date.
@@ -345,18 +797,21 @@ class GitHubClient:
             author: Filter by PR author (GitHub username)
             state: PR state - "open", "closed", or "all"
             org: Organization to search across (searches all repos if provided instead of repo)
+            until: Only return PRs created before this timestamp (unbounded if None)
+            per_page: Results per search page (GitHub caps this at 100)
 
         Returns list of PR objects.
         """
         # Use GitHub Search API: GET /search/issues
-        # Query: repo:owner/repo is:pr created:>=YYYY-MM-DDTHH:MM:SS
-        # Or:    org:owner is:pr created:>=YYYY-MM-DDTHH:MM:SS
+        # Query: repo:owner/repo is:pr created:>=YYYY-MM-DDTHH:MM:SS+00:00
+        # Or:    org:owner is:pr created:>=YYYY-MM-DDTHH:MM:SS+00:00
+        # With until, the qualifier becomes a closed range (created:A..B) so
+        # the result set, and therefore the page count, stays within the window.
         url = f"{self.base_url}/search/issues"
-        since_str = since.strftime("%Y-%m-%dT%H:%M:%S")
 
         query_parts = [
             "is:pr",
-            f"created:>={since_str}"
+            f"created:{_date_range(since, until)}"
         ]
 
         # Either search by org or by specific repo
@@ -378,38 +833,38 @@ class GitHubClient:
             "q": " ".join(query_parts),
             "sort": "created",
             "order": "desc",
-            "per_page": 100
+            "per_page": per_page
         }
 
         results = []
         try:
-            with httpx.Client(timeout=30.0) as c:
-                # Handle pagination
-                page = 1
-                while True:
-                    params["page"] = page
-                    r = c.get(url, headers=self._headers(), params=params)
+            c = self._client()
+            # Handle pagination
+            page = 1
+            while True:
+                params["page"] = page
+                r = self._conditional_get(c, url, params=params, timeout=30.0)
 
-                    if r.status_code != 200:
-                        break
+                if r.status_code != 200:
+                    break
 
-                    data = r.json()
-                    items = data.get("items", [])
+                data = r.json()
+                items = data.get("items", [])
 
-                    if not items:
-                        break
+                if not items:
+                    break
 
-                    results.extend(items)
+                results.extend(items)
 
-                    # Check if there are more pages
-                    if len(items) < params["per_page"]:
-                        break
+                # Check if there are more pages
+                if len(items) < params["per_page"]:
+                    break
 
-                    page += 1
+                page += 1
 
-                    # Safety limit: max 10 pages (1000 results)
-                    if page > 10:
-                        break
+                # Safety limit: max 10 pages (1000 results)
+                if page > 10:
+                    break
         except Exception:
             self._debug("search_prs_by_date request raised exception")
 
@@ -420,7 +875,9 @@ class GitHubClient:
         repo: Optional[str],
         since: datetime,
         author: Optional[str] = None,
-        org: Optional[str] = None
+        org: Optional[str] = None,
+        until: Optional[datetime] = None,
+        per_page: int = 100
     ) -> list[dict]:
         """
         Get PRs closed/merged since a given date.
@@ -430,21 +887,29 @@ class GitHubClient:
             since: Only return PRs closed after this timestamp
             author: Filter by PR author (GitHub username)
             org: Organization to search across (searches all repos if provided instead of repo)
-
-        Returns list of closed/merged PR objects.
+            until: Only return PRs closed before this timestamp (unbounded if None)
+            per_page: Results per search page (GitHub caps this at 100)
+
+        Returns list of closed/merged PR objects, merged first. Each PR whose
+        details could be fetched is a dict with exactly the _PR_DETAIL_KEYS
+        REST pulls keys, whether GraphQL or REST supplied them: state is
+        "closed" for merged PRs too (merged_at tells them apart) and user only
+        carries login. A PR whose details could not be fetched is returned as
+        its raw search item.
         """
         # Use GitHub Search API with merged filter for merged PRs
-        # Query: repo:owner/repo is:pr is:merged merged:>=YYYY-MM-DDTHH:MM:SS
-        # Or:    org:owner is:pr is:merged merged:>=YYYY-MM-DDTHH:MM:SS
+        # Query: repo:owner/repo is:pr is:merged merged:>=YYYY-MM-DDTHH:MM:SS+00:00
+        # Or:    org:owner is:pr is:merged merged:>=YYYY-MM-DDTHH:MM:SS+00:00
         # Then do a second search for closed-but-not-merged
         url = f"{self.base_url}/search/issues"
-        since_str = since.strftime("%Y-%m-%dT%H:%M:%S")
+        # Both searches share one formatted range
+        date_range = _date_range(since, until)
 
         # First search: merged PRs
         query_parts_merged = [
             "is:pr",
             "is:merged",
-            f"merged:>={since_str}"
+            f"merged:{date_range}"
         ]
 
         # Second search: closed but not merged PRs
@@ -452,7 +917,7 @@ class GitHubClient:
             "is:pr",
             "is:closed",
             "is:unmerged",
-            f"closed:>={since_str}"
+            f"closed:{date_range}"
         ]
 
         # Add scope (org or repo) to both queries
@@ -480,56 +945,69 @@ class GitHubClient:
                 "q": query,
                 "sort": "updated",
                 "order": "desc",
-                "per_page": 100
+                "per_page": per_page
             }
             prs = []
             try:
-                with httpx.Client(timeout=30.0) as c:
-                    page = 1
-                    while True:
-                        params["page"] = page
-                        r = c.get(url, headers=self._headers(), params=params)
-
-                        if r.status_code != 200:
-                            break
-
-                        data = r.json()
-                        items = data.get("items", [])
-
-                        if not items:
-                            break
-
-                        # Extract repo from html_url for cross-repo searches
-                        for item in items:
-                            html_url = item.get("html_url", "")
-                            if html_url:
-                                # Parse repo from URL: https://github.com/org/repo/pull/123
-                                parts = html_url.split("/")
-                                if len(parts) >= 7:
-                                    item_repo = f"{parts[3]}/{parts[4]}"
-                                    pr_number = item.get("number")
-                                    if pr_number:
-                                        pr_details = self.get_pr_details(item_repo, pr_number)
-                                        if pr_details:
-                                            prs.append(pr_details)
-                                        else:
-                                            prs.append(item)
-
-                        # Check if there are more pages
-                        if len(items) < params["per_page"]:
-                            break
-
-                        page += 1
-
-                        # Safety limit: max 10 pages (1000 results)
-                        if page > 10:
-                            break
+                c = self._client()
+                page = 1
+                while True:
+                    params["page"] = page
+                    r = self._conditional_get(c, url, params=params, timeout=30.0)
+
+                    if r.status_code != 200:
+                        break
+
+                    data = r.json()
+                    items = data.get("items", [])
+
+                    if not items:
+                        break
+
+                    # Extract repo from html_url for cross-repo searches
+                    targets = []
+                    for item in items:
+                        html_url = item.get("html_url", "")
+                        if html_url:
+                            # Parse repo from URL: https://github.com/org/repo/pull/123
+                            parts = html_url.split("/")
+                            if len(parts) >= 7:
+                                item_repo = f"{parts[3]}/{parts[4]}"
+                                pr_number = item.get("number")
+                                if pr_number:
+                                    targets.append((item, item_repo, pr_number))
+
+                    # One GraphQL request covers the whole page; without
+                    # GraphQL, fall back to concurrent REST detail fetches
+                    batch = self.get_pr_details_batch([(t[1], t[2]) for t in targets])
+                    if batch is not None:
+                        for item, item_repo, pr_number in targets:
+                            prs.append(batch.get((item_repo, pr_number)) or item)
+                    else:
+                        with ThreadPoolExecutor(max_workers=_DETAIL_WORKERS) as pool:
+                            details = pool.map(
+                                lambda t: self.get_pr_details(t[1], t[2]), targets
+                            )
+                            for (item, _, _), pr_details in zip(targets, details):
+                                prs.append(_pr_detail_subset(pr_details) if pr_details else item)
+
+                    # Check if there are more pages
+                    if len(items) < params["per_page"]:
+                        break
+
+                    page += 1
+
+                    # Safety limit: max 10 pages (1000 results)
+                    if page > 10:
+                        break
             except Exception:
                 self._debug("get_closed_prs query request raised exception")
             return prs
 
-        # Fetch both merged and closed PRs
-        results.extend(fetch_prs_for_query(query_merged))
-        results.extend(fetch_prs_for_query(query_closed))
+        # The merged and closed-unmerged searches are independent; run them
+        # side by side and keep merged results first
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            for prs in pool.map(fetch_prs_for_query, (query_merged, query_closed)):
+                results.extend(prs)
 
         return results
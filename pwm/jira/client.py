@@ -1,17 +1,59 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
+import functools
+import importlib.util
+import json
 import os
 import sys
+import threading
+import time
 import httpx
 
+from pwm.shared_http import SharedHTTPClient
+
+# Create metadata (issue types + fields) changes rarely, so it is cached on disk
+CREATEMETA_CACHE_DIR = Path.home() / ".cache" / "pwm" / "jira-meta"
+CREATEMETA_CACHE_TTL = 24 * 60 * 60  # 24 hours
+
+# Issue summaries are shared by every client in the process, keyed by
+# (base_url, issue key), and kept briefly so repeated lookups skip the API
+ISSUE_SUMMARY_TTL = 300  # 5 minutes
+_summary_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_summary_lock = threading.Lock()
+
+# HTTP/2 is used when the optional h2 package is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _adf_text(text: str, link_url: Optional[str] = None) -> dict:
+    node = {"type": "text", "text": text}
+    if link_url:
+        node["marks"] = [{"type": "link", "attrs": {"href": link_url}}]
+    return node
+
+
+def _adf_doc(*paragraphs: dict) -> dict:
+    """Jira API v3 requires Atlassian Document Format (ADF) comment bodies."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [node]} for node in paragraphs],
+    }
+
 
 @dataclass
 class JiraClient:
     base_url: str
     email: str
     token: str
+    _createmeta_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _http: SharedHTTPClient = field(
+        default_factory=SharedHTTPClient, init=False, repr=False, compare=False
+    )
 
     def _debug(self, message: str) -> None:
         """Emit debug diagnostics when PWM_DEBUG is enabled."""
@@ -28,16 +70,28 @@ class JiraClient:
         )
         if not (base_url and email and token):
             return None
-        return cls(base_url=base_url.rstrip("/"), email=email, token=token)
+        return cls._shared(base_url.rstrip("/"), email, token)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _shared(cls, base_url: str, email: str, token: str) -> "JiraClient":
+        """One client per credential set, so helpers share its caches."""
+        return cls(base_url=base_url, email=email, token=token)
 
     def _client(self) -> httpx.Client:
-        return httpx.Client(auth=(self.email, self.token), timeout=20.0)
+        return self._http.get(self._open_http)
+
+    def _open_http(self) -> httpx.Client:
+        return httpx.Client(auth=(self.email, self.token), timeout=20.0, http2=_HTTP2)
+
+    def close(self) -> None:
+        self._http.close()
 
     def ping(self) -> tuple[bool, str]:
         url = f"{self.base_url}/rest/api/3/myself"
         try:
-            with self._client() as c:
-                r = c.get(url)
+            c = self._client()
+            r = c.get(url)
         except Exception as e:
             self._debug(f"ping network error: {type(e).__name__}")
             return False, f"network error: {e}"
@@ -61,11 +115,11 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/3/myself"
         try:
-            with self._client() as c:
-                r = c.get(url)
-                if r.status_code == 200:
-                    return r.json().get("accountId")
-                self._debug(f"get_current_account_id returned HTTP {r.status_code}")
+            c = self._client()
+            r = c.get(url)
+            if r.status_code == 200:
+                return r.json().get("accountId")
+            self._debug(f"get_current_account_id returned HTTP {r.status_code}")
         except Exception:
             self._debug("get_current_account_id request raised exception")
         return None
@@ -73,30 +127,40 @@ class JiraClient:
     def get_issue(self, key: str) -> Optional[dict]:
         url = f"{self.base_url}/rest/api/3/issue/{key}"
         try:
-            with self._client() as c:
-                r = c.get(url)
-                if r.status_code == 200:
-                    return r.json()
-                self._debug(f"get_issue {key} returned HTTP {r.status_code}")
+            c = self._client()
+            r = c.get(url)
+            if r.status_code == 200:
+                return r.json()
+            self._debug(f"get_issue {key} returned HTTP {r.status_code}")
         except Exception:
             self._debug(f"get_issue {key} request raised exception")
         return None
 
     def get_issue_summary(self, key: str) -> Optional[str]:
+        cache_key = (self.base_url, key)
+        with _summary_lock:
+            cached = _summary_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ISSUE_SUMMARY_TTL:
+            return cached[1]
+
         data = self.get_issue(key)
         if not data:
             return None
         fields = data.get("fields") or {}
-        return fields.get("summary")
+        summary = fields.get("summary")
+        if summary:
+            with _summary_lock:
+                _summary_cache[cache_key] = (time.monotonic(), summary)
+        return summary
 
     def _transitions(self, key: str) -> list[dict]:
         url = f"{self.base_url}/rest/api/3/issue/{key}/transitions"
         try:
-            with self._client() as c:
-                r = c.get(url)
-                if r.status_code == 200:
-                    return r.json().get("transitions", [])
-                self._debug(f"_transitions for {key} returned HTTP {r.status_code}")
+            c = self._client()
+            r = c.get(url)
+            if r.status_code == 200:
+                return r.json().get("transitions", [])
+            self._debug(f"_transitions for {key} returned HTTP {r.status_code}")
         except Exception:
             self._debug(f"_transitions for {key} request raised exception")
         return []
@@ -113,9 +177,9 @@ class JiraClient:
             return False
         url = f"{self.base_url}/rest/api/3/issue/{key}/transitions"
         try:
-            with self._client() as c:
-                r = c.post(url, json={"transition": {"id": tid}})
-                return r.status_code in (204, 200)
+            c = self._client()
+            r = c.post(url, json={"transition": {"id": tid}})
+            return r.status_code in (204, 200)
         except Exception:
             self._debug(f"transition_by_name {key} request raised exception")
         return False
@@ -132,27 +196,20 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/3/issue/{key}/assignee"
         try:
-            with self._client() as c:
-                r = c.put(url, json={"accountId": account_id})
-                return r.status_code in (204, 200)
+            c = self._client()
+            r = c.put(url, json={"accountId": account_id})
+            return r.status_code in (204, 200)
         except Exception:
             self._debug(f"assign_issue {key} request raised exception")
         return False
 
     def add_comment(self, key: str, body: str) -> bool:
         url = f"{self.base_url}/rest/api/3/issue/{key}/comment"
-        # Jira API v3 requires Atlassian Document Format (ADF)
-        adf_body = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {"type": "paragraph", "content": [{"type": "text", "text": body}]}
-            ],
-        }
+        adf_body = _adf_doc(_adf_text(body))
         try:
-            with self._client() as c:
-                r = c.post(url, json={"body": adf_body})
-                return r.status_code in (201, 200)
+            c = self._client()
+            r = c.post(url, json={"body": adf_body})
+            return r.status_code in (201, 200)
         except Exception:
             self._debug(f"add_comment {key} request raised exception")
         return False
@@ -172,71 +229,148 @@ class JiraClient:
         Returns True if successful, False otherwise.
         """
         url = f"{self.base_url}/rest/api/3/issue/{key}/comment"
-        # Build ADF with text and clickable link
-        adf_body = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {"type": "paragraph", "content": [{"type": "text", "text": text}]},
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": link_text,
-                            "marks": [{"type": "link", "attrs": {"href": link_url}}],
-                        }
-                    ],
-                },
-            ],
-        }
+        # Text paragraph followed by a clickable link paragraph
+        adf_body = _adf_doc(_adf_text(text), _adf_text(link_text, link_url))
         try:
-            with self._client() as c:
-                r = c.post(url, json={"body": adf_body})
-                return r.status_code in (201, 200)
+            c = self._client()
+            r = c.post(url, json={"body": adf_body})
+            return r.status_code in (201, 200)
         except Exception:
             self._debug(f"add_comment_with_link {key} request raised exception")
         return False
 
+    def _createmeta_cache_file(self, project_key: str) -> Path:
+        host = urlparse(self.base_url).netloc or "jira"
+        return CREATEMETA_CACHE_DIR / f"{host}-{project_key}.json"
+
+    def _cached_createmeta(self, project_key: str) -> Optional[dict[str, dict]]:
+        """Return the createmeta bundle from memory or a fresh disk cache entry."""
+        if project_key in self._createmeta_cache:
+            return self._createmeta_cache[project_key]
+        path = self._createmeta_cache_file(project_key)
+        try:
+            if time.time() - path.stat().st_mtime >= CREATEMETA_CACHE_TTL:
+                return None
+            with path.open("r", encoding="utf-8") as f:
+                bundle = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(bundle, dict) or not bundle:
+            return None
+        self._createmeta_cache[project_key] = bundle
+        return bundle
+
+    def _store_createmeta(self, project_key: str, bundle: dict[str, dict]) -> None:
+        self._createmeta_cache[project_key] = bundle
+        path = self._createmeta_cache_file(project_key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as f:
+                json.dump(bundle, f)
+        except OSError:
+            self._debug(f"could not write createmeta cache for {project_key}")
+
+    def invalidate_createmeta(self, project_key: str) -> None:
+        """Drop cached create metadata for a project (memory and disk)."""
+        self._createmeta_cache.pop(project_key, None)
+        try:
+            self._createmeta_cache_file(project_key).unlink(missing_ok=True)
+        except OSError:
+            pass
+
     def get_issue_types(self, project_key: str) -> list[dict]:
         """
         Get available issue types for a project.
 
+        Served from the cached createmeta bundle when available.
+
         Returns a list of dicts with 'id', 'name', and 'description'.
         """
+        cached = self._cached_createmeta(project_key)
+        if cached:
+            return [
+                {"id": it["id"], "name": name, "description": it.get("description", "")}
+                for name, it in cached.items()
+            ]
         url = f"{self.base_url}/rest/api/3/issue/createmeta"
         params = {"projectKeys": project_key, "expand": "projects.issuetypes"}
         try:
-            with self._client() as c:
-                r = c.get(url, params=params)
-                if r.status_code != 200:
-                    self._debug(
-                        f"get_issue_types for {project_key} returned HTTP {r.status_code}"
-                    )
-                    return []
-                data = r.json()
-                projects = data.get("projects", [])
-                if not projects:
-                    return []
-                issue_types = projects[0].get("issuetypes", [])
-                return [
-                    {
-                        "id": it.get("id"),
-                        "name": it.get("name"),
-                        "description": it.get("description", ""),
-                    }
-                    for it in issue_types
-                ]
+            c = self._client()
+            r = c.get(url, params=params)
+            if r.status_code != 200:
+                self._debug(
+                    f"get_issue_types for {project_key} returned HTTP {r.status_code}"
+                )
+                return []
+            data = r.json()
+            projects = data.get("projects", [])
+            if not projects:
+                return []
+            issue_types = projects[0].get("issuetypes", [])
+            return [
+                {
+                    "id": it.get("id"),
+                    "name": it.get("name"),
+                    "description": it.get("description", ""),
+                }
+                for it in issue_types
+            ]
         except Exception:
             self._debug(f"get_issue_types for {project_key} request raised exception")
         return []
 
+    def get_createmeta_bundle(self, project_key: str) -> dict[str, dict]:
+        """
+        Get issue types and their create field metadata in one request.
+
+        Returns a dict keyed by issue type name, each value holding 'id',
+        'description', and 'fields' (as returned by get_create_metadata).
+        Non-empty results are cached per project on the client and on disk
+        under CREATEMETA_CACHE_DIR for CREATEMETA_CACHE_TTL seconds.
+        """
+        cached = self._cached_createmeta(project_key)
+        if cached is not None:
+            return cached
+        url = f"{self.base_url}/rest/api/3/issue/createmeta"
+        params = {"projectKeys": project_key, "expand": "projects.issuetypes.fields"}
+        try:
+            c = self._client()
+            r = c.get(url, params=params)
+            if r.status_code != 200:
+                self._debug(
+                    f"get_createmeta_bundle for {project_key} returned HTTP {r.status_code}"
+                )
+                return {}
+            projects = r.json().get("projects", [])
+            if not projects:
+                return {}
+            bundle = {
+                it.get("name"): {
+                    "id": it.get("id"),
+                    "description": it.get("description", ""),
+                    "fields": it.get("fields", {}),
+                }
+                for it in projects[0].get("issuetypes", [])
+            }
+            if bundle:
+                self._store_createmeta(project_key, bundle)
+            return bundle
+        except Exception:
+            self._debug(f"get_createmeta_bundle for {project_key} request raised exception")
+        return {}
+
     def get_create_metadata(self, project_key: str, issue_type_name: str) -> dict:
         """
         Get field metadata for creating an issue.
 
+        Served from the cached createmeta bundle when that project was
+        already fetched.
+
         Returns a dict with field information including required fields and allowed values.
         """
+        cached = (self._cached_createmeta(project_key) or {}).get(issue_type_name)
+        if cached is not None:
+            return cached["fields"]
         url = f"{self.base_url}/rest/api/3/issue/createmeta"
         params = {
             "projectKeys": project_key,
@@ -244,22 +378,22 @@ class JiraClient:
             "expand": "projects.issuetypes.fields",
         }
         try:
-            with self._client() as c:
-                r = c.get(url, params=params)
-                if r.status_code != 200:
-                    self._debug(
-                        "get_create_metadata for "
-                        f"{project_key}/{issue_type_name} returned HTTP {r.status_code}"
-                    )
-                    return {}
-                data = r.json()
-                projects = data.get("projects", [])
-                if not projects:
-                    return {}
-                issue_types = projects[0].get("issuetypes", [])
-                if not issue_types:
-                    return {}
-                return issue_types[0].get("fields", {})
+            c = self._client()
+            r = c.get(url, params=params)
+            if r.status_code != 200:
+                self._debug(
+                    "get_create_metadata for "
+                    f"{project_key}/{issue_type_name} returned HTTP {r.status_code}"
+                )
+                return {}
+            data = r.json()
+            projects = data.get("projects", [])
+            if not projects:
+                return {}
+            issue_types = projects[0].get("issuetypes", [])
+            if not issue_types:
+                return {}
+            return issue_types[0].get("fields", {})
         except Exception:
             self._debug(
                 f"get_create_metadata for {project_key}/{issue_type_name} request raised exception"
@@ -341,18 +475,21 @@ class JiraClient:
         payload = {"fields": fields}
 
         try:
-            with self._client() as c:
-                r = c.post(url, json=payload)
-                if r.status_code in (201, 200):
-                    data = r.json()
-                    return data.get("key")
-                else:
-                    # Keep logs concise and avoid leaking response bodies.
-                    self._debug(
-                        f"create_issue for {project_key} returned HTTP {r.status_code}"
-                    )
-                    print(f"[DEBUG] Jira API error {r.status_code}", file=sys.stderr)
-                    return None
+            c = self._client()
+            r = c.post(url, json=payload)
+            if r.status_code in (201, 200):
+                data = r.json()
+                return data.get("key")
+            else:
+                # Keep logs concise and avoid leaking response bodies.
+                self._debug(
+                    f"create_issue for {project_key} returned HTTP {r.status_code}"
+                )
+                if r.status_code == 400:
+                    # Field errors may mean the cached create metadata is stale
+                    self.invalidate_createmeta(project_key)
+                print(f"[DEBUG] Jira API error {r.status_code}", file=sys.stderr)
+                return None
         except Exception as e:
             self._debug(
                 f"create_issue for {project_key} raised {type(e).__name__}"
@@ -407,27 +544,27 @@ class JiraClient:
         }
 
         try:
-            with self._client() as c:
-                r = c.get(url, params=params)
-                if r.status_code == 200:
-                    data = r.json()
-                    issues = data.get("issues", [])
-                    # Flatten the structure for easier use
-                    result = []
-                    for issue in issues:
-                        fields = issue.get("fields", {})
-                        result.append(
-                            {
-                                "key": issue.get("key"),
-                                "summary": fields.get("summary"),
-                                "status": fields.get("status"),
-                                "created": fields.get("created"),
-                                "updated": fields.get("updated"),
-                                "assignee": fields.get("assignee"),
-                            }
-                        )
-                    return result
-                self._debug(f"search_issues_by_date returned HTTP {r.status_code}")
+            c = self._client()
+            r = c.get(url, params=params)
+            if r.status_code == 200:
+                data = r.json()
+                issues = data.get("issues", [])
+                # Flatten the structure for easier use
+                result = []
+                for issue in issues:
+                    fields = issue.get("fields", {})
+                    result.append(
+                        {
+                            "key": issue.get("key"),
+                            "summary": fields.get("summary"),
+                            "status": fields.get("status"),
+                            "created": fields.get("created"),
+                            "updated": fields.get("updated"),
+                            "assignee": fields.get("assignee"),
+                        }
+                    )
+                return result
+            self._debug(f"search_issues_by_date returned HTTP {r.status_code}")
         except Exception:
             self._debug("search_issues_by_date request raised exception")
 
@@ -438,6 +575,7 @@ class JiraClient:
         project_keys: str | list[str],
         since: datetime,
         assignee: Optional[str] = "currentUser()",
+        max_results: int = 100,
     ) -> list[dict]:
         """
         Get issues created since a given date.
@@ -446,6 +584,7 @@ class JiraClient:
             project_keys: Jira project key(s) (e.g., "ABC" or ["ABC", "XYZ"])
             since: Only return issues created after this timestamp
             assignee: Filter by assignee (default: "currentUser()") - use None for all users
+            max_results: Maximum number of issues to return (default: 100)
 
         Returns list of issue objects.
         """
@@ -463,13 +602,14 @@ class JiraClient:
         if assignee:
             jql += f" AND assignee = {assignee}"
 
-        return self.search_issues_by_date(jql)
+        return self.search_issues_by_date(jql, max_results=max_results)
 
     def get_issues_updated_since(
         self,
         project_keys: str | list[str],
         since: datetime,
         assignee: Optional[str] = "currentUser()",
+        max_results: int = 100,
     ) -> list[dict]:
         """
         Get issues updated since a given date (excluding newly created).
@@ -478,6 +618,7 @@ class JiraClient:
             project_keys: Jira project key(s) (e.g., "ABC" or ["ABC", "XYZ"])
             since: Only return issues updated after this timestamp
             assignee: Filter by assignee (default: "currentUser()") - use None for all users
+            max_results: Maximum number of issues to return (default: 100)
 
         Returns list of issue objects.
         """
@@ -497,4 +638,4 @@ class JiraClient:
         if assignee:
             jql += f" AND assignee = {assignee}"
 
-        return self.search_issues_by_date(jql)
+        return self.search_issues_by_date(jql, max_results=max_results)
@@ -12,7 +12,7 @@ from pwm.vcs.git_cli import (
     current_branch,
     get_default_branch,
     get_commits_since_base,
-    get_diff_since_base,
+    get_commits_and_diff_since_base,
     push_branch,
 )
 from pwm.github.client import GitHubClient
@@ -329,8 +329,12 @@ def open_pr(
         base_branch_ref.split("/")[-1] if "/" in base_branch_ref else base_branch_ref
     )
 
-    # Get commits
-    commits = get_commits_since_base(repo_root, base_branch_ref, remote)
+    # Get commits, plus the diff for AI summarization when it will be used
+    diff = None
+    if use_ai:
+        commits, diff = get_commits_and_diff_since_base(repo_root, base_branch_ref, remote)
+    else:
+        commits = get_commits_since_base(repo_root, base_branch_ref, remote)
     if event_details is not None:
         event_details["commit_count"] = len(commits)
     if not commits:
@@ -351,11 +355,6 @@ def open_pr(
         if not create_anyway:
             return 1
 
-    # Get diff (for AI summarization)
-    diff = None
-    if use_ai:
-        diff = get_diff_since_base(repo_root, base_branch_ref, remote)
-
     # Ensure branch is pushed
     rprint(f"[cyan]Pushing branch '{branch}' to remote...[/cyan]")
     if not push_branch(repo_root, branch, remote):
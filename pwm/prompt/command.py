@@ -3,6 +3,7 @@ from pathlib import Path
 import re
 import sys
 from enum import Enum
+import functools
 from typing import Optional
 import time
 import json
@@ -35,6 +36,9 @@ CACHE_DIR = Path.home() / ".cache" / "pwm"
 CACHE_FILE = CACHE_DIR / "prompt_cache.json"
 CACHE_TTL = 300  # 5 minutes
 
+# Jira issue key: leading letter, then alnum project key, dash, number
+ISSUE_KEY_RE = re.compile(r"[A-Z][A-Z0-9]*-\d+")
+
 
 def extract_issue_key_from_branch(branch_name: str) -> Optional[str]:
     """
@@ -46,8 +50,10 @@ def extract_issue_key_from_branch(branch_name: str) -> Optional[str]:
     - ABC-123-description
     - bugfix/ABC-123
     """
-    # Match Jira issue key pattern: leading letter, then alnum project key.
-    match = re.search(r"([A-Z][A-Z0-9]*)-(\d+)", branch_name)
+    # Branches like main/develop can't contain a key; skip the regex
+    if "-" not in branch_name:
+        return None
+    match = ISSUE_KEY_RE.search(branch_name)
     if match:
         return match.group(0)
     return None
@@ -55,9 +61,7 @@ def extract_issue_key_from_branch(branch_name: str) -> Optional[str]:
 
 def get_cached_status(issue_key: str) -> Optional[str]:
     """Get cached Jira status if available and not expired."""
-    if not CACHE_FILE.exists():
-        return None
-
+    # A missing file surfaces as OSError, saving a separate exists() stat
     try:
         with CACHE_FILE.open("r") as f:
             cache = json.load(f)
@@ -77,12 +81,11 @@ def set_cached_status(issue_key: str, status: str) -> None:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     cache = {}
-    if CACHE_FILE.exists():
-        try:
-            with CACHE_FILE.open("r") as f:
-                cache = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        with CACHE_FILE.open("r") as f:
+            cache = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        pass
 
     cache[issue_key] = {"status": status, "timestamp": time.time()}
 
@@ -93,42 +96,36 @@ def set_cached_status(issue_key: str, status: str) -> None:
         pass  # Silent fail if we can't write cache
 
 
+# Status keyword groups, checked in order; the first group with a keyword
+# in the normalized status picks the emoji and color
+_STATUS_STYLES = (
+    (("progress", "doing"), "🎯", Colors.YELLOW),
+    (("review", "testing"), "👀", Colors.CYAN),
+    (("done", "closed", "resolved"), "✅", Colors.GREEN),
+    (("blocked",), "🚫", Colors.RED),
+    (("todo", "backlog", "open"), "📝", Colors.BLUE),
+)
+_DEFAULT_STATUS_STYLE = ("🔹", Colors.GRAY)
+
+
+@functools.lru_cache(maxsize=64)
+def _status_style(status: str) -> tuple[str, str]:
+    """(emoji, color) for a Jira status; a project only has a handful."""
+    status_lower = status.lower().replace(" ", "")
+    for keywords, emoji, color in _STATUS_STYLES:
+        if any(keyword in status_lower for keyword in keywords):
+            return emoji, color
+    return _DEFAULT_STATUS_STYLE
+
+
 def get_status_emoji(status: str) -> str:
     """Get emoji for Jira status."""
-    status_lower = status.lower().replace(" ", "")
-    if "progress" in status_lower or "doing" in status_lower:
-        return "🎯"
-    elif "review" in status_lower or "testing" in status_lower:
-        return "👀"
-    elif (
-        "done" in status_lower or "closed" in status_lower or "resolved" in status_lower
-    ):
-        return "✅"
-    elif "blocked" in status_lower:
-        return "🚫"
-    elif "todo" in status_lower or "backlog" in status_lower or "open" in status_lower:
-        return "📝"
-    else:
-        return "🔹"
+    return _status_style(status)[0]
 
 
 def get_status_color(status: str) -> str:
     """Get ANSI color code for Jira status."""
-    status_lower = status.lower().replace(" ", "")
-    if "progress" in status_lower or "doing" in status_lower:
-        return Colors.YELLOW
-    elif "review" in status_lower or "testing" in status_lower:
-        return Colors.CYAN
-    elif (
-        "done" in status_lower or "closed" in status_lower or "resolved" in status_lower
-    ):
-        return Colors.GREEN
-    elif "blocked" in status_lower:
-        return Colors.RED
-    elif "todo" in status_lower or "backlog" in status_lower or "open" in status_lower:
-        return Colors.BLUE
-    else:
-        return Colors.GRAY
+    return _status_style(status)[1]
 
 
 def fetch_jira_status(issue_key: str) -> Optional[str]:
@@ -0,0 +1,35 @@
+from __future__ import annotations
+import threading
+from typing import Callable, Optional
+import httpx
+
+
+class SharedHTTPClient:
+    """
+    One httpx.Client per API client, opened on first use and kept open.
+
+    Keeping the client lets requests reuse its pooled connections and TLS
+    sessions; the GitHub and Jira clients each hold one of these.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    def get(self, open_client: Callable[[], httpx.Client]) -> httpx.Client:
+        """Return the shared client, calling open_client to create it once."""
+        # Lock-free once the client exists; the lock only guards creation
+        client = self._client
+        if client is not None:
+            return client
+        with self._lock:
+            if self._client is None:
+                self._client = open_client()
+            return self._client
+
+    def close(self) -> None:
+        """Close the shared client, if one was opened."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
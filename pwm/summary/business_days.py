@@ -1,6 +1,16 @@
 """Business day calculation utilities for work summaries."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+import functools
+
+# Step back indexed by weekday (0=Monday ... 6=Sunday); always lands on the
+# previous weekday, i.e. Friday for Monday and the weekend.
+_DAYS_BACK = tuple(timedelta(days=n) for n in (3, 1, 1, 1, 1, 1, 2))
+
+# Names for "%A, %b %d %Y %H:%M" in the C locale the CLI runs under, so
+# timestamps can be formatted without going through strftime
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
 
 def get_previous_business_day(current_time: datetime) -> datetime:
@@ -28,21 +38,19 @@ def get_previous_business_day(current_time: datetime) -> datetime:
         >>> get_previous_business_day(datetime(2025, 1, 14, 12, 0))
         datetime(2025, 1, 13, 0, 0, 0)  # Monday
     """
-    weekday = current_time.weekday()  # 0=Monday, 6=Sunday
+    today = current_time.date()
+    previous = today - _DAYS_BACK[today.weekday()]
+    return datetime.combine(previous, time.min, tzinfo=current_time.tzinfo)
 
-    if weekday == 0:  # Monday
-        days_back = 3  # Go back to Friday
-    elif weekday == 5:  # Saturday
-        days_back = 1  # Go back to Friday
-    elif weekday == 6:  # Sunday
-        days_back = 2  # Go back to Friday
-    else:  # Tuesday-Friday (1-4)
-        days_back = 1  # Go back one day
 
-    previous_day = current_time - timedelta(days=days_back)
-    return previous_day.replace(hour=0, minute=0, second=0, microsecond=0)
+def _format_timestamp(dt: datetime) -> str:
+    return (
+        f"{_DAY_NAMES[dt.weekday()]}, {_MONTH_ABBR[dt.month]} {dt.day:02d} "
+        f"{dt.year} {dt.hour:02d}:{dt.minute:02d}"
+    )
 
 
+@functools.lru_cache(maxsize=32)
 def format_date_range(start: datetime, end: datetime) -> str:
     """
     Format a date range for display.
@@ -60,6 +68,4 @@ def format_date_range(start: datetime, end: datetime) -> str:
         >>> format_date_range(start, end)
         'Monday, Jan 13 2025 00:00 - Monday, Jan 13 2025 12:00'
     """
-    start_str = start.strftime("%A, %b %d %Y %H:%M")
-    end_str = end.strftime("%A, %b %d %Y %H:%M")
-    return f"{start_str} - {end_str}"
+    return f"{_format_timestamp(start)} - {_format_timestamp(end)}"
@@ -8,17 +8,71 @@ from pwm.github.client import GitHubClient
 from pwm.jira.client import JiraClient
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class PRRow:
+    """Pull request fields needed to render a summary line."""
+    title: str
+    number: Optional[int]
+    html_url: str = ""
+
+    @classmethod
+    def from_api(cls, pr: dict) -> "PRRow":
+        """Build a row from a GitHub API pull request/search item."""
+        return cls(
+            title=pr.get("title", "Untitled"),
+            number=pr.get("number"),
+            html_url=pr.get("html_url") or "",
+        )
+
+    def as_dict(self) -> dict:
+        """Return the row as a dict shaped like the GitHub API payload."""
+        return {"title": self.title, "number": self.number, "html_url": self.html_url}
+
+
+@dataclass(slots=True, frozen=True)
+class JiraRow:
+    """Jira issue fields needed to render a summary line."""
+    key: str
+    summary: str
+    status_name: str = "Unknown"
+
+    @classmethod
+    def from_api(cls, issue: dict) -> "JiraRow":
+        """Build a row from a flattened Jira search result."""
+        status = issue.get("status")
+        return cls(
+            key=issue.get("key", "Unknown"),
+            summary=issue.get("summary", "No summary"),
+            status_name=status.get("name", "Unknown") if isinstance(status, dict) else "Unknown",
+        )
+
+    def as_dict(self) -> dict:
+        """Return the row as a dict shaped like the Jira search result."""
+        return {"key": self.key, "summary": self.summary, "status": {"name": self.status_name}}
+
+
+@dataclass(slots=True, frozen=True)
 class WorkSummaryData:
     """Container for collected work summary data."""
-    prs_opened: list[dict]
-    prs_closed: list[dict]
-    prs_merged: list[dict]
-    jira_created: list[dict]
-    jira_updated: list[dict]
+    prs_opened: list[PRRow]
+    prs_closed: list[PRRow]
+    prs_merged: list[PRRow]
+    jira_created: list[JiraRow]
+    jira_updated: list[JiraRow]
     start_time: datetime
     end_time: datetime
 
+    @property
+    def has_work(self) -> bool:
+        """Whether any PR or Jira activity was collected."""
+        return any((
+            self.prs_opened,
+            self.prs_closed,
+            self.prs_merged,
+            self.jira_created,
+            self.jira_updated,
+        ))
+
 
 def collect_work_data(
     github_repo: Optional[str],
@@ -26,7 +80,8 @@ def collect_work_data(
     since: datetime,
     github_client: Optional[GitHubClient],
     jira_client: Optional[JiraClient],
-    config: dict
+    config: dict,
+    end_time: Optional[datetime] = None
 ) -> WorkSummaryData:
     """
     Collect all work data from GitHub and Jira.
@@ -40,11 +95,12 @@ def collect_work_data(
         github_client: GitHub client instance (None if not configured)
         jira_client: Jira client instance (None if not configured)
         config: PWM configuration dict
+        end_time: End datetime for the summary period (defaults to now)
 
     Returns:
         WorkSummaryData with all collected information
     """
-    end_time = datetime.now()
+    end_time = end_time or datetime.now()
 
     # Get configuration
     summary_config = config.get("daily_summary", {})
@@ -52,6 +108,7 @@ def collect_work_data(
     include_own_issues = summary_config.get("include_own_issues_only", True)
     github_org = summary_config.get("github_org")
     jira_projects = summary_config.get("jira_projects")
+    page_size = summary_config.get("page_size", 100)
 
     # Collect GitHub PRs
     prs_opened = []
@@ -72,14 +129,18 @@ def collect_work_data(
                 since=since,
                 author=github_user,
                 state="all",
-                org=github_org
+                org=github_org,
+                until=end_time,
+                per_page=page_size
             )
 
             all_closed = github_client.get_closed_prs(
                 repo=None,
                 since=since,
                 author=github_user,
-                org=github_org
+                org=github_org,
+                until=end_time,
+                per_page=page_size
             )
         elif github_repo:
             # Search specific repo
@@ -87,23 +148,29 @@ def collect_work_data(
                 repo=github_repo,
                 since=since,
                 author=github_user,
-                state="all"
+                state="all",
+                until=end_time,
+                per_page=page_size
             )
 
             all_closed = github_client.get_closed_prs(
                 repo=github_repo,
                 since=since,
-                author=github_user
+                author=github_user,
+                until=end_time,
+                per_page=page_size
             )
         else:
             all_closed = []
 
+        prs_opened = [PRRow.from_api(pr) for pr in prs_opened]
+
         # Separate closed vs merged
         for pr in all_closed:
             if pr.get("merged_at"):
-                prs_merged.append(pr)
+                prs_merged.append(PRRow.from_api(pr))
             else:
-                prs_closed.append(pr)
+                prs_closed.append(PRRow.from_api(pr))
 
     # Collect Jira issues
     jira_created = []
@@ -117,17 +184,25 @@ def collect_work_data(
         projects_to_search = jira_projects if jira_projects else (jira_project if jira_project else None)
 
         if projects_to_search:
-            jira_created = jira_client.get_issues_created_since(
-                projects_to_search,
-                since,
-                assignee=assignee
-            )
-
-            jira_updated = jira_client.get_issues_updated_since(
-                projects_to_search,
-                since,
-                assignee=assignee
-            )
+            jira_created = [
+                JiraRow.from_api(issue)
+                for issue in jira_client.get_issues_created_since(
+                    projects_to_search,
+                    since,
+                    assignee=assignee,
+                    max_results=page_size
+                )
+            ]
+
+            jira_updated = [
+                JiraRow.from_api(issue)
+                for issue in jira_client.get_issues_updated_since(
+                    projects_to_search,
+                    since,
+                    assignee=assignee,
+                    max_results=page_size
+                )
+            ]
 
     return WorkSummaryData(
         prs_opened=prs_opened,
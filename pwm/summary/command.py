@@ -52,9 +52,12 @@ def daily_summary(
 
     repo_root = ctx.repo_root
 
+    # Snapshot the end of the period once so the header matches the query window
+    end_time = datetime.now()
+
     # Determine start time
     if since is None:
-        since = get_previous_business_day(datetime.now())
+        since = get_previous_business_day(end_time)
         rprint(f"[cyan]Generating summary from previous business day...[/cyan]")
     else:
         rprint(f"[cyan]Generating summary from {since.strftime('%Y-%m-%d %H:%M')}...[/cyan]")
@@ -82,7 +85,8 @@ def daily_summary(
         since=since,
         github_client=github_client,
         jira_client=jira_client,
-        config=ctx.config
+        config=ctx.config,
+        end_time=end_time
     )
     _debug(
         "collected "
@@ -93,16 +97,16 @@ def daily_summary(
 
     # Generate AI summary
     ai_summary = None
-    if openai_client:
+    if openai_client and data.has_work:
         rprint("[cyan]Generating AI summary...[/cyan]")
         prs_dict = {
-            'opened': data.prs_opened,
-            'closed': data.prs_closed,
-            'merged': data.prs_merged
+            'opened': [pr.as_dict() for pr in data.prs_opened],
+            'closed': [pr.as_dict() for pr in data.prs_closed],
+            'merged': [pr.as_dict() for pr in data.prs_merged]
         }
         jira_dict = {
-            'created': data.jira_created,
-            'updated': data.jira_updated
+            'created': [issue.as_dict() for issue in data.jira_created],
+            'updated': [issue.as_dict() for issue in data.jira_updated]
         }
         ai_summary = summarize_daily_work(prs_dict, jira_dict, openai_client)
 
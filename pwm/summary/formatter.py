@@ -1,11 +1,55 @@
 """Output formatting for work summaries."""
 
+import io
 from typing import Optional
 
-from pwm.summary.collector import WorkSummaryData
+from pwm.summary.collector import PRRow, WorkSummaryData
 from pwm.summary.business_days import format_date_range
 
 
+# Line templates are bound str.format methods built once at import; rows are
+# passed positionally and read via attribute fields ({0.title}), which avoids
+# converting slotted rows to dicts for format_map.
+_PR_MD = "- #{0.number} {0.title}\n".format
+_PR_MD_LINK = "- [#{0.number}]({0.html_url}) {0.title}\n".format
+_PR_TEXT = "  • #{0.number} {0.title}\n".format
+_PR_TEXT_LINK = "  • #{0.number} {0.title} ({0.html_url})\n".format
+
+_JIRA_CREATED_MD = "- {0.key}: {0.summary}\n".format
+_JIRA_CREATED_MD_LINK = "- [{0.key}]({1}/browse/{0.key}): {0.summary}\n".format
+_JIRA_UPDATED_MD = "- {0.key}: {0.summary} → {0.status_name}\n".format
+_JIRA_UPDATED_MD_LINK = "- [{0.key}]({1}/browse/{0.key}): {0.summary} → {0.status_name}\n".format
+_JIRA_CREATED_TEXT = "  • {0.key}: {0.summary}\n".format
+_JIRA_CREATED_TEXT_LINK = "  • {0.key}: {0.summary} ({1}/browse/{0.key})\n".format
+_JIRA_UPDATED_TEXT = "  • {0.key}: {0.summary} → {0.status_name}\n".format
+_JIRA_UPDATED_TEXT_LINK = "  • {0.key}: {0.summary} → {0.status_name} ({1}/browse/{0.key})\n".format
+
+
+def _pr_sections(data: WorkSummaryData) -> tuple[tuple[str, list[PRRow]], ...]:
+    """Return (section title, PRs) pairs in display order."""
+    return (
+        ("Opened", data.prs_opened),
+        ("Merged", data.prs_merged),
+        ("Closed", data.prs_closed),
+    )
+
+
+def _write_pr_section(buf: io.StringIO, title: str, prs: list[PRRow], show_links: bool) -> None:
+    """Write a markdown PR subsection: heading, one line per PR, blank line."""
+    buf.write(f"### {title} ({len(prs)})\n")
+    for pr in prs:
+        buf.write(_PR_MD_LINK(pr) if show_links and pr.html_url else _PR_MD(pr))
+    buf.write("\n")
+
+
+def _write_pr_section_text(buf: io.StringIO, title: str, prs: list[PRRow], show_links: bool) -> None:
+    """Write a plain text PR subsection: heading, one bullet per PR, blank line."""
+    buf.write(f"{title} ({len(prs)}):\n")
+    for pr in prs:
+        buf.write(_PR_TEXT_LINK(pr) if show_links and pr.html_url else _PR_TEXT(pr))
+    buf.write("\n")
+
+
 def format_markdown(data: WorkSummaryData, ai_summary: Optional[str] = None, show_links: bool = False, jira_base_url: Optional[str] = None) -> str:
     """
     Format work summary data as markdown.
@@ -19,99 +63,55 @@ def format_markdown(data: WorkSummaryData, ai_summary: Optional[str] = None, sho
     Returns:
         Formatted markdown string
     """
-    lines = []
+    buf = io.StringIO()
 
     # Header
-    lines.append("# Daily Work Summary")
+    buf.write("# Daily Work Summary\n")
     date_range = format_date_range(data.start_time, data.end_time)
-    lines.append(f"**Period:** {date_range}")
-    lines.append("")
+    buf.write(f"**Period:** {date_range}\n")
+    buf.write("\n")
 
     # AI Summary (at the top if present)
     if ai_summary:
-        lines.append("## Summary")
-        lines.append(ai_summary)
-        lines.append("")
+        buf.write("## Summary\n")
+        buf.write(f"{ai_summary}\n")
+        buf.write("\n")
 
     # Pull Requests section
     if data.prs_opened or data.prs_closed or data.prs_merged:
-        lines.append("## Pull Requests")
-        lines.append("")
-
-        if data.prs_opened:
-            lines.append(f"### Opened ({len(data.prs_opened)})")
-            for pr in data.prs_opened:
-                title = pr.get('title', 'Untitled')
-                number = pr.get('number')
-                html_url = pr.get('html_url', '')
-                if show_links and html_url:
-                    lines.append(f"- [#{number}]({html_url}) {title}")
-                else:
-                    lines.append(f"- #{number} {title}")
-            lines.append("")
-
-        if data.prs_merged:
-            lines.append(f"### Merged ({len(data.prs_merged)})")
-            for pr in data.prs_merged:
-                title = pr.get('title', 'Untitled')
-                number = pr.get('number')
-                html_url = pr.get('html_url', '')
-                if show_links and html_url:
-                    lines.append(f"- [#{number}]({html_url}) {title}")
-                else:
-                    lines.append(f"- #{number} {title}")
-            lines.append("")
-
-        if data.prs_closed:
-            lines.append(f"### Closed ({len(data.prs_closed)})")
-            for pr in data.prs_closed:
-                title = pr.get('title', 'Untitled')
-                number = pr.get('number')
-                html_url = pr.get('html_url', '')
-                if show_links and html_url:
-                    lines.append(f"- [#{number}]({html_url}) {title}")
-                else:
-                    lines.append(f"- #{number} {title}")
-            lines.append("")
+        buf.write("## Pull Requests\n")
+        buf.write("\n")
+
+        for title, prs in _pr_sections(data):
+            if prs:
+                _write_pr_section(buf, title, prs, show_links)
 
     # Jira section
     if data.jira_created or data.jira_updated:
-        lines.append("## Jira Issues")
-        lines.append("")
+        link_issues = bool(show_links and jira_base_url)
+        buf.write("## Jira Issues\n")
+        buf.write("\n")
 
         if data.jira_created:
-            lines.append(f"### Created ({len(data.jira_created)})")
+            buf.write(f"### Created ({len(data.jira_created)})\n")
             for issue in data.jira_created:
-                key = issue.get('key', 'Unknown')
-                summary = issue.get('summary', 'No summary')
-                if show_links and jira_base_url:
-                    issue_url = f"{jira_base_url}/browse/{key}"
-                    lines.append(f"- [{key}]({issue_url}): {summary}")
-                else:
-                    lines.append(f"- {key}: {summary}")
-            lines.append("")
+                buf.write(_JIRA_CREATED_MD_LINK(issue, jira_base_url) if link_issues else _JIRA_CREATED_MD(issue))
+            buf.write("\n")
 
         if data.jira_updated:
-            lines.append(f"### Updated ({len(data.jira_updated)})")
+            buf.write(f"### Updated ({len(data.jira_updated)})\n")
             for issue in data.jira_updated:
-                key = issue.get('key', 'Unknown')
-                summary = issue.get('summary', 'No summary')
-                status = issue.get('status', {})
-                status_name = status.get('name', 'Unknown') if isinstance(status, dict) else 'Unknown'
-                if show_links and jira_base_url:
-                    issue_url = f"{jira_base_url}/browse/{key}"
-                    lines.append(f"- [{key}]({issue_url}): {summary} → {status_name}")
-                else:
-                    lines.append(f"- {key}: {summary} → {status_name}")
-            lines.append("")
+                buf.write(_JIRA_UPDATED_MD_LINK(issue, jira_base_url) if link_issues else _JIRA_UPDATED_MD(issue))
+            buf.write("\n")
 
     # Handle empty case
-    if not (data.prs_opened or data.prs_closed or data.prs_merged or
-            data.jira_created or data.jira_updated):
-        lines.append("No work activity found for this period.")
-        lines.append("")
+    if not data.has_work:
+        buf.write("No work activity found for this period.\n")
+        buf.write("\n")
 
-    return "\n".join(lines)
+    # Every section ends with a blank line; drop its terminator so the
+    # output ends with a single newline.
+    return buf.getvalue()[:-1]
 
 
 def format_text(data: WorkSummaryData, ai_summary: Optional[str] = None, show_links: bool = False, jira_base_url: Optional[str] = None) -> str:
@@ -127,100 +127,56 @@ def format_text(data: WorkSummaryData, ai_summary: Optional[str] = None, show_li
     Returns:
         Formatted plain text string
     """
-    lines = []
+    buf = io.StringIO()
+    rule = "=" * 60
+    divider = "-" * 60
 
     # Header
-    lines.append("=" * 60)
-    lines.append("DAILY WORK SUMMARY")
-    lines.append("=" * 60)
+    buf.write(f"{rule}\n")
+    buf.write("DAILY WORK SUMMARY\n")
+    buf.write(f"{rule}\n")
     date_range = format_date_range(data.start_time, data.end_time)
-    lines.append(f"Period: {date_range}")
-    lines.append("")
+    buf.write(f"Period: {date_range}\n")
+    buf.write("\n")
 
     # AI Summary (at the top if present)
     if ai_summary:
-        lines.append("SUMMARY")
-        lines.append("-" * 60)
-        lines.append(ai_summary)
-        lines.append("")
+        buf.write("SUMMARY\n")
+        buf.write(f"{divider}\n")
+        buf.write(f"{ai_summary}\n")
+        buf.write("\n")
 
     # Pull Requests section
     if data.prs_opened or data.prs_closed or data.prs_merged:
-        lines.append("PULL REQUESTS")
-        lines.append("-" * 60)
-
-        if data.prs_opened:
-            lines.append(f"Opened ({len(data.prs_opened)}):")
-            for pr in data.prs_opened:
-                title = pr.get('title', 'Untitled')
-                number = pr.get('number')
-                html_url = pr.get('html_url', '')
-                if show_links and html_url:
-                    lines.append(f"  • #{number} {title} ({html_url})")
-                else:
-                    lines.append(f"  • #{number} {title}")
-            lines.append("")
-
-        if data.prs_merged:
-            lines.append(f"Merged ({len(data.prs_merged)}):")
-            for pr in data.prs_merged:
-                title = pr.get('title', 'Untitled')
-                number = pr.get('number')
-                html_url = pr.get('html_url', '')
-                if show_links and html_url:
-                    lines.append(f"  • #{number} {title} ({html_url})")
-                else:
-                    lines.append(f"  • #{number} {title}")
-            lines.append("")
-
-        if data.prs_closed:
-            lines.append(f"Closed ({len(data.prs_closed)}):")
-            for pr in data.prs_closed:
-                title = pr.get('title', 'Untitled')
-                number = pr.get('number')
-                html_url = pr.get('html_url', '')
-                if show_links and html_url:
-                    lines.append(f"  • #{number} {title} ({html_url})")
-                else:
-                    lines.append(f"  • #{number} {title}")
-            lines.append("")
+        buf.write("PULL REQUESTS\n")
+        buf.write(f"{divider}\n")
+
+        for title, prs in _pr_sections(data):
+            if prs:
+                _write_pr_section_text(buf, title, prs, show_links)
 
     # Jira section
     if data.jira_created or data.jira_updated:
-        lines.append("JIRA ISSUES")
-        lines.append("-" * 60)
+        link_issues = bool(show_links and jira_base_url)
+        buf.write("JIRA ISSUES\n")
+        buf.write(f"{divider}\n")
 
         if data.jira_created:
-            lines.append(f"Created ({len(data.jira_created)}):")
+            buf.write(f"Created ({len(data.jira_created)}):\n")
             for issue in data.jira_created:
-                key = issue.get('key', 'Unknown')
-                summary = issue.get('summary', 'No summary')
-                if show_links and jira_base_url:
-                    issue_url = f"{jira_base_url}/browse/{key}"
-                    lines.append(f"  • {key}: {summary} ({issue_url})")
-                else:
-                    lines.append(f"  • {key}: {summary}")
-            lines.append("")
+                buf.write(_JIRA_CREATED_TEXT_LINK(issue, jira_base_url) if link_issues else _JIRA_CREATED_TEXT(issue))
+            buf.write("\n")
 
         if data.jira_updated:
-            lines.append(f"Updated ({len(data.jira_updated)}):")
+            buf.write(f"Updated ({len(data.jira_updated)}):\n")
             for issue in data.jira_updated:
-                key = issue.get('key', 'Unknown')
-                summary = issue.get('summary', 'No summary')
-                status = issue.get('status', {})
-                status_name = status.get('name', 'Unknown') if isinstance(status, dict) else 'Unknown'
-                if show_links and jira_base_url:
-                    issue_url = f"{jira_base_url}/browse/{key}"
-                    lines.append(f"  • {key}: {summary} → {status_name} ({issue_url})")
-                else:
-                    lines.append(f"  • {key}: {summary} → {status_name}")
-            lines.append("")
+                buf.write(_JIRA_UPDATED_TEXT_LINK(issue, jira_base_url) if link_issues else _JIRA_UPDATED_TEXT(issue))
+            buf.write("\n")
 
     # Handle empty case
-    if not (data.prs_opened or data.prs_closed or data.prs_merged or
-            data.jira_created or data.jira_updated):
-        lines.append("No work activity found for this period.")
-        lines.append("")
+    if not data.has_work:
+        buf.write("No work activity found for this period.\n")
+        buf.write("\n")
 
-    lines.append("=" * 60)
-    return "\n".join(lines)
+    buf.write(rule)
+    return buf.getvalue()
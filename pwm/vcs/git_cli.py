@@ -1,16 +1,176 @@
 from __future__ import annotations
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import IO, Iterator, Optional
+import atexit
+import contextlib
+import functools
+import itertools
+import shutil
 import subprocess
+import sys
+import threading
 
 from pwm.vcs.remote_url import parse_repo_from_remote_url
 
 
-def _run(args: list[str], repo_root: Path, capture: bool = True):
+@functools.lru_cache(maxsize=1)
+def _git_executable() -> str:
+    """Resolve the absolute path to git once per process."""
+    return shutil.which("git") or "git"
+
+
+def _run(
+    args: list[str],
+    repo_root: Path,
+    capture: bool = True,
+    input: str | None = None,
+    text: bool = True,
+):
+    # An absolute executable path, close_fds=False and no cwd/preexec_fn let
+    # subprocess use posix_spawn instead of fork+exec. Python's own descriptors
+    # are non-inheritable by default, so nothing extra leaks into git.
+    # text=False returns raw bytes so large outputs can be decoded once by the
+    # caller (and stderr is never decoded).
     return subprocess.run(
-        ["git", "-C", str(repo_root), *args], capture_output=capture, text=True
+        [_git_executable(), "-C", str(repo_root), *args],
+        capture_output=capture,
+        text=text,
+        input=input,
+        close_fds=False,
+    )
+
+
+@contextlib.contextmanager
+def _stream(args: list[str], repo_root: Path) -> Iterator[IO[str]]:
+    """
+    Run git with stdout as a pipe so output can be consumed incrementally.
+
+    If the caller stops reading early, git is terminated on exit.
+    """
+    proc = subprocess.Popen(
+        [_git_executable(), "-C", str(repo_root), *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        close_fds=False,
     )
+    try:
+        yield proc.stdout
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+        proc.stdout.close()
+        proc.wait()
+
+
+def _batch_check_found(line: str) -> bool:
+    """Whether a ``cat-file --batch-check`` output line describes a resolved object."""
+    # Resolved: "<sha> <type> <size>"; unresolved: "<name> missing" / "<name> ambiguous"
+    parts = line.split()
+    return len(parts) == 3 and parts[2].isdigit()
+
+
+class GitSession:
+    """
+    Long-running ``git cat-file --batch-check`` process for one repository.
+
+    Ref lookups are written to the process's stdin and answered one line at a
+    time, so repeated existence checks reuse a single git process instead of
+    spawning one per call. The process is started lazily and restarted if it
+    exits.
+    """
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [_git_executable(), "-C", str(self.repo_root), "cat-file", "--batch-check"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                close_fds=False,
+            )
+        return self._proc
+
+    def refs_exist(self, names: list[str]) -> dict[str, bool]:
+        """Check whether each name resolves to an object in the repository."""
+        # A newline would split one query into two and desync the replies
+        queries = [name for name in names if name and "\n" not in name]
+        found = dict.fromkeys(names, False)
+        if not queries:
+            return found
+        with self._lock:
+            proc = self._process()
+            try:
+                proc.stdin.write("".join(f"{name}\n" for name in queries))
+                proc.stdin.flush()
+                for name in queries:
+                    found[name] = _batch_check_found(proc.stdout.readline())
+            except (BrokenPipeError, OSError):
+                # git exited (e.g. not a repository); report the refs as missing
+                self._close_locked()
+                return dict.fromkeys(names, False)
+        return found
+
+    def ref_exists(self, name: str) -> bool:
+        """Check whether a single name resolves to an object in the repository."""
+        return self.refs_exist([name])[name]
+
+    def _close_locked(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def close(self) -> None:
+        """Stop the background git process, if running."""
+        with self._lock:
+            self._close_locked()
+
+
+_sessions: dict[str, GitSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def _session(repo_root: Path) -> GitSession:
+    """Return the shared GitSession for repo_root, creating it on first use."""
+    key = str(repo_root)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = GitSession(repo_root)
+        return session
+
+
+@atexit.register
+def _close_sessions() -> None:
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def _invalidate_git_cache() -> None:
+    """Drop cached remote lookups after commands that change refs or remotes."""
+    get_default_branch.cache_clear()
+    infer_github_repo_from_remote.cache_clear()
 
 
 def current_branch(repo_root: Path) -> str | None:
@@ -27,6 +187,7 @@ def create_branch(
     if from_ref is None:
         from_ref = get_default_branch(repo_root, remote)
     r = _run(["checkout", "-b", branch_name, from_ref], repo_root, capture=False)
+    _invalidate_git_cache()
     return r.returncode == 0
 
 
@@ -36,10 +197,75 @@ def switch_branch(repo_root: Path, branch_name: str) -> bool:
 
 
 def branch_exists(repo_root: Path, branch_name: str) -> bool:
-    r = _run(["rev-parse", "--verify", branch_name], repo_root)
-    return r.returncode == 0
+    return _session(repo_root).ref_exists(branch_name)
 
 
+def _git_state_from_files(
+    repo_root: Path, branch_name: str
+) -> tuple[str | None, bool] | None:
+    """
+    Read git_state straight from .git/HEAD, loose refs and packed-refs.
+
+    Returns None when the layout can't be read this way (worktrees and
+    submodules, where .git is a file, or the reftable ref backend).
+    """
+    git_dir = repo_root / ".git"
+    if not git_dir.is_dir() or (git_dir / "reftable").exists():
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        current = None
+        if head.startswith("ref: refs/heads/"):
+            current = head[len("ref: refs/heads/"):]
+
+        exists = (git_dir / "refs" / "heads" / branch_name).is_file()
+        packed = git_dir / "packed-refs"
+        if not exists and packed.exists():
+            wanted = f"refs/heads/{branch_name}"
+            with packed.open(encoding="utf-8") as f:
+                # Lines are "<sha> <refname>"; '#' headers and '^' peel lines are skipped
+                exists = any(
+                    line.rstrip("\n").partition(" ")[2] == wanted
+                    for line in f
+                    if line[:1] not in ("#", "^")
+                )
+    except (OSError, UnicodeDecodeError):
+        return None
+    return current, exists
+
+
+def git_state(repo_root: Path, branch_name: str) -> tuple[str | None, bool]:
+    """
+    Return (current branch, whether branch_name exists locally).
+
+    Plain repositories are answered from the files under .git without
+    spawning git; otherwise one git for-each-ref call is used. The current
+    branch is None when HEAD is detached or cannot be read.
+    """
+    state = _git_state_from_files(repo_root, branch_name)
+    if state is not None:
+        return state
+
+    r = _run(
+        ["for-each-ref", "--format=%(HEAD) %(refname:short)", "refs/heads/"],
+        repo_root,
+    )
+    if r.returncode != 0:
+        return current_branch(repo_root), branch_exists(repo_root, branch_name)
+
+    current = None
+    exists = False
+    for line in r.stdout.splitlines():
+        # Each line is "* <name>" for the checked-out branch, "  <name>" otherwise
+        marker, name = line[:1], line[2:]
+        if marker == "*":
+            current = name
+        if name == branch_name:
+            exists = True
+    return current, exists
+
+
+@functools.lru_cache(maxsize=32)
 def infer_github_repo_from_remote(
     repo_root: Path, remote: str = "origin"
 ) -> str | None:
@@ -49,52 +275,123 @@ def infer_github_repo_from_remote(
     return parse_repo_from_remote_url(r.stdout.strip())
 
 
+@functools.lru_cache(maxsize=32)
 def get_default_branch(repo_root: Path, remote: str = "origin") -> str:
     """
     Determine the default branch for the repository.
 
+    Results are cached per (repo_root, remote) for the life of the process;
+    see _invalidate_git_cache.
+
     Strategy:
-    1. Try to read from remote HEAD reference (git symbolic-ref)
-    2. If not set, automatically configure it (git remote set-head)
-    3. Fall back to checking common branch names that exist remotely
+    1. Read the remote HEAD reference and the common branch names that exist
+       remotely in a single git for-each-ref call
+    2. If remote HEAD is not set, automatically configure it (git remote set-head)
+    3. Fall back to the first common branch name found in step 1
     4. Default to "main" if all else fails
 
     Returns the default branch name with remote prefix (e.g., "origin/main")
     """
-    # Try to get the default branch from remote HEAD
-    r = _run(["symbolic-ref", f"refs/remotes/{remote}/HEAD"], repo_root)
-    if r.returncode == 0 and r.stdout.strip():
-        # Output is like "refs/remotes/origin/main"
-        ref = r.stdout.strip()
-        if ref.startswith(f"refs/remotes/{remote}/"):
-            branch = ref[len(f"refs/remotes/{remote}/") :]
-            return f"{remote}/{branch}"
+    prefix = f"refs/remotes/{remote}/"
+    names = ["main", "master", "develop"]
+
+    # Each line is "<refname> <symref target>"; the target is empty unless the
+    # ref is symbolic (remote HEAD)
+    r = _run(
+        [
+            "for-each-ref",
+            "--format=%(refname) %(symref)",
+            f"{prefix}HEAD",
+            *(f"{prefix}{name}" for name in names),
+        ],
+        repo_root,
+    )
+    existing: set[str] = set()
+    if r.returncode == 0:
+        for line in r.stdout.splitlines():
+            refname, _, target = line.partition(" ")
+            if refname == f"{prefix}HEAD":
+                if target.startswith(prefix):
+                    return f"{remote}/{target[len(prefix):]}"
+            elif refname.startswith(prefix):
+                existing.add(refname[len(prefix):])
 
     # If remote HEAD is not set, try to set it by fetching remote info (suppress stderr)
     r = _run(["remote", "set-head", remote, "-a"], repo_root, capture=True)
     if r.returncode == 0:
-        r = _run(["symbolic-ref", f"refs/remotes/{remote}/HEAD"], repo_root)
+        r = _run(["symbolic-ref", f"{prefix}HEAD"], repo_root)
         if r.returncode == 0 and r.stdout.strip():
             ref = r.stdout.strip()
-            if ref.startswith(f"refs/remotes/{remote}/"):
-                branch = ref[len(f"refs/remotes/{remote}/") :]
-                return f"{remote}/{branch}"
+            if ref.startswith(prefix):
+                return f"{remote}/{ref[len(prefix):]}"
 
-    # Fall back to checking for common default branches
-    for candidate in ["main", "master", "develop"]:
-        r = _run(["rev-parse", "--verify", f"{remote}/{candidate}"], repo_root)
-        if r.returncode == 0:
-            return f"{remote}/{candidate}"
+    # Fall back to the common default branches found above
+    for name in names:
+        if name in existing:
+            return f"{remote}/{name}"
 
     # Ultimate fallback
     return f"{remote}/main"
 
 
+_COMMIT_FIELDS = 4  # hash, subject, body, committer timestamp
+
+
+def _commit_from_fields(fields: list[str]) -> dict:
+    """Build a commit dict from the NUL-separated fields of one git log record."""
+    commit_hash, subject, body, timestamp = fields
+    commit_dict = {"hash": commit_hash, "subject": subject, "body": body}
+    try:
+        commit_dict["timestamp"] = datetime.fromtimestamp(int(timestamp))
+    except (ValueError, OSError):
+        pass
+    return commit_dict
+
+
+def iter_commits_since_base(
+    repo_root: Path,
+    base_branch: Optional[str] = None,
+    remote: str = "origin",
+    since: Optional[datetime] = None,
+) -> Iterator[dict]:
+    """
+    Yield commits on current branch since it diverged from base branch.
+
+    Records are parsed as git log streams them, so the first commit is
+    available before the log finishes. Closing the generator early stops git.
+    Takes the same arguments as get_commits_since_base.
+    """
+    if base_branch is None:
+        base_branch = get_default_branch(repo_root, remote)
+
+    # Get commits between base and HEAD
+    # Format: %H = full hash, %s = subject, %b = body, %ct = committer timestamp (Unix).
+    # With -z every field, including the last of each record, ends in NUL.
+    args = ["log", "-z", f"{base_branch}..HEAD", "--format=%H%x00%s%x00%b%x00%ct"]
+
+    # Add --since filter if timestamp provided
+    if since:
+        # Convert datetime to Unix timestamp for git log --since
+        args.append(f"--since={int(since.timestamp())}")
+
+    with _stream(args, repo_root) as out:
+        pending = ""
+        fields: list[str] = []
+        for chunk in iter(lambda: out.read(8192), ""):
+            *complete, pending = (pending + chunk).split("\0")
+            for value in complete:
+                fields.append(value)
+                if len(fields) == _COMMIT_FIELDS:
+                    yield _commit_from_fields(fields)
+                    fields = []
+
+
 def get_commits_since_base(
     repo_root: Path,
     base_branch: Optional[str] = None,
     remote: str = "origin",
     since: Optional[datetime] = None,
+    limit: Optional[int] = None,
 ) -> list[dict]:
     """
     Get list of commits on current branch since it diverged from base branch.
@@ -104,47 +401,45 @@ def get_commits_since_base(
         base_branch: Base branch to compare against (default: uses default branch)
         remote: Remote name (default: "origin")
         since: Only include commits after this timestamp (default: all commits)
+        limit: Stop after this many commits (default: no limit)
 
     Returns list of dicts with 'hash', 'subject', 'body', 'timestamp' keys.
     """
+    with contextlib.closing(
+        iter_commits_since_base(repo_root, base_branch, remote, since)
+    ) as commits:
+        return list(itertools.islice(commits, limit))
+
+
+def get_commit_count_and_latest_subject(
+    repo_root: Path,
+    base_branch: Optional[str] = None,
+    remote: str = "origin",
+    since: Optional[datetime] = None,
+) -> tuple[int, Optional[str]]:
+    """
+    Count commits since base branch and read the newest commit's subject.
+
+    A cheaper alternative to get_commits_since_base for callers that only need
+    the count and latest subject: git counts the commits itself and only one
+    log record is read, whatever the branch size.
+
+    Returns (count, subject); subject is None when there are no commits.
+    """
     if base_branch is None:
         base_branch = get_default_branch(repo_root, remote)
 
-    # Get commits between base and HEAD
-    # Format: %H = full hash, %s = subject, %b = body, %ct = committer timestamp (Unix), separated by special markers
-    args = ["log", f"{base_branch}..HEAD", "--format=%H%x00%s%x00%b%x00%ct%x1e"]
-
-    # Add --since filter if timestamp provided
+    revs = [f"{base_branch}..HEAD"]
     if since:
-        # Convert datetime to Unix timestamp for git log --since
-        args.append(f"--since={int(since.timestamp())}")
+        revs.append(f"--since={int(since.timestamp())}")
 
-    r = _run(args, repo_root)
+    r = _run(["rev-list", "--count", *revs], repo_root)
+    count = int(r.stdout.strip()) if r.returncode == 0 and r.stdout.strip().isdigit() else 0
+    if not count:
+        return 0, None
 
-    if r.returncode != 0:
-        return []
-
-    commits = []
-    for entry in r.stdout.strip().split("\x1e"):
-        entry = entry.strip()
-        if not entry:
-            continue
-        parts = entry.split("\x00", 3)
-        if len(parts) >= 2:
-            commit_dict = {
-                "hash": parts[0],
-                "subject": parts[1],
-                "body": parts[2] if len(parts) > 2 else "",
-            }
-            # Add timestamp if available
-            if len(parts) > 3:
-                try:
-                    commit_dict["timestamp"] = datetime.fromtimestamp(int(parts[3]))
-                except (ValueError, OSError):
-                    pass
-            commits.append(commit_dict)
-
-    return commits
+    r = _run(["log", "-1", "--format=%s", *revs], repo_root)
+    return count, (r.stdout.rstrip("\n") if r.returncode == 0 else None)
 
 
 def get_diff_since_base(
@@ -152,12 +447,41 @@ def get_diff_since_base(
 ) -> str:
     """
     Get the full diff of changes since base branch.
+
+    Callers that also need the commits should use
+    get_commits_and_diff_since_base, or resolve base_branch once and pass it
+    to both helpers.
+    """
+    if base_branch is None:
+        base_branch = get_default_branch(repo_root, remote)
+
+    # Capture bytes and decode only stdout; diffs may contain non-UTF-8 content
+    r = _run(["diff", f"{base_branch}...HEAD"], repo_root, text=False)
+    if r.returncode != 0:
+        return ""
+    return r.stdout.decode("utf-8", errors="replace")
+
+
+def get_commits_and_diff_since_base(
+    repo_root: Path, base_branch: Optional[str] = None, remote: str = "origin"
+) -> tuple[list[dict], str]:
+    """
+    Get commits and the full diff since base branch, running git log and
+    git diff concurrently.
+
+    The base branch is resolved once and shared by both commands. Each runs
+    in its own git subprocess, so the threads only wait on I/O.
+
+    Returns (commits, diff) as from get_commits_since_base and
+    get_diff_since_base.
     """
     if base_branch is None:
         base_branch = get_default_branch(repo_root, remote)
 
-    r = _run(["diff", f"{base_branch}...HEAD"], repo_root)
-    return r.stdout if r.returncode == 0 else ""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        commits = pool.submit(get_commits_since_base, repo_root, base_branch, remote)
+        diff = pool.submit(get_diff_since_base, repo_root, base_branch, remote)
+        return commits.result(), diff.result()
 
 
 def push_branch(
@@ -172,6 +496,9 @@ def push_branch(
         remote: Remote name (default: origin)
         set_upstream: Set upstream tracking (default: True)
 
+    Git's progress output goes to the terminal when stdout is a TTY; otherwise
+    the push runs with --quiet --no-progress and only errors are reported.
+
     Returns True if successful, False otherwise.
     """
     args = ["push"]
@@ -180,5 +507,11 @@ def push_branch(
     else:
         args.extend([remote, branch])
 
-    r = _run(args, repo_root, capture=False)
+    if sys.stdout.isatty():
+        r = _run(args, repo_root, capture=False)
+    else:
+        r = _run([*args, "--quiet", "--no-progress"], repo_root)
+        if r.returncode != 0 and r.stderr:
+            sys.stderr.write(r.stderr)
+    _invalidate_git_cache()
     return r.returncode == 0
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
+import re
+
+# Matches SSH (git@host:owner/repo.git) and HTTP(S) (https://host/owner/repo.git)
+# remotes, capturing the repository path without a trailing ".git".
+_GIT_REMOTE_RE = re.compile(r"^(?:git@[^:]*:|https?://[^/]*/)(?P<path>.*?)(?:\.git)?$")
+
 
 def parse_repo_from_remote_url(url: str) -> str | None:
     """Extract owner/repo from a git remote URL."""
-    if url.startswith("git@") and ":" in url:
-        path = url.split(":", 1)[1]
-    elif url.startswith("http://") or url.startswith("https://"):
-        part = url.split("//", 1)[1]
-        path = "/".join(part.split("/", 1)[1:])
-    else:
+    m = _GIT_REMOTE_RE.match(url)
+    if not m:
         return None
-
-    if path.endswith(".git"):
-        path = path[:-4]
-
+    path = m.group("path")
     return path if "/" in path else None
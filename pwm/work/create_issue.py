@@ -2,7 +2,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 import re
+import tomllib
 from typing import Optional
+import toml  # For writing TOML
 from rich.prompt import Prompt, Confirm
 from rich import print as rprint
 
@@ -20,6 +22,7 @@ STANDARD_CREATE_FIELDS = {
 }
 
 PARENT_COMPATIBLE_ISSUE_TYPES = {"story", "bug", "spike", "task", "incident"}
+STORY_POINTS_FIELD_NAMES = {"story points", "storypoints", "story point estimate"}
 ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9]*-\d+$")
 
 
@@ -28,6 +31,17 @@ def _is_parent_compatible_issue_type(issue_type: str) -> bool:
     return issue_type.strip().lower() in PARENT_COMPATIBLE_ISSUE_TYPES
 
 
+def _find_story_points_field(metadata: Optional[dict]) -> Optional[str]:
+    """Return the id of the numeric story points field in create metadata, if any."""
+    for field_id, field_info in (metadata or {}).items():
+        if (
+            field_info.get("schema", {}).get("type") == "number"
+            and field_info.get("name", "").lower() in STORY_POINTS_FIELD_NAMES
+        ):
+            return field_id
+    return None
+
+
 def record_epic_in_history(epic_key: str, title: str, project_key: str) -> None:
     """Store or refresh an epic entry in history."""
     upsert_epic_history(epic_key, title, project_key)
@@ -202,19 +216,7 @@ def build_non_interactive_issue_details(
 
     # Map story points into the proper custom field if available.
     if story_points is not None and metadata:
-        story_points_field_id = None
-        for field_id, field_info in metadata.items():
-            field_name = field_info.get("name", "")
-            field_schema = field_info.get("schema", {})
-            field_type = field_schema.get("type", "")
-            if field_type == "number" and field_name.lower() in {
-                "story points",
-                "storypoints",
-                "story point estimate",
-            }:
-                story_points_field_id = field_id
-                break
-
+        story_points_field_id = _find_story_points_field(metadata)
         if story_points_field_id:
             resolved_custom_fields[story_points_field_id] = story_points
         else:
@@ -339,6 +341,33 @@ def _required_field_cli_example(field_id: str, field_info: dict) -> str:
     return f"{field_id}=<value>"
 
 
+def _value_fits_field(field_info: dict, value) -> bool:
+    """Return True when a provided value is usable for a Jira create field as-is."""
+    schema = field_info.get("schema", {})
+    field_type = schema.get("type", "")
+    allowed = {
+        av.get("value") or av.get("name")
+        for av in field_info.get("allowedValues", [])
+    }
+
+    if field_type == "string":
+        return isinstance(value, str) and bool(value.strip())
+    if field_type == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if field_type == "option":
+        return isinstance(value, dict) and (not allowed or value.get("value") in allowed)
+    if field_type == "array" and schema.get("items") == "option":
+        return (
+            isinstance(value, list)
+            and bool(value)
+            and all(
+                isinstance(v, dict) and (not allowed or v.get("value") in allowed)
+                for v in value
+            )
+        )
+    return value is not None
+
+
 def prompt_for_issue_details(
     jira: JiraClient,
     project_key: str,
@@ -346,33 +375,45 @@ def prompt_for_issue_details(
     default_labels: Optional[list[str]] = None,
     default_parent_epic_key: Optional[str] = None,
     default_custom_fields: Optional[dict] = None,
+    *,
+    summary: Optional[str] = None,
+    description: Optional[str] = None,
+    issue_type: Optional[str] = None,
+    labels: Optional[list[str]] = None,
+    story_points: Optional[float] = None,
+    parent_epic_key: Optional[str] = None,
+    custom_fields: Optional[dict] = None,
 ) -> Optional[dict]:
     """
     Interactively prompt for issue details.
 
+    Values passed as keyword arguments (e.g. from command-line flags) are used
+    as-is and their prompts are skipped; only missing or invalid values are
+    asked for.
+
     Returns issue details dict or None if cancelled.
     """
+    provided_custom_fields = dict(custom_fields or {})
+
     with ensure_backspace_support():
         rprint("[bold cyan]Create new Jira issue[/bold cyan]")
 
-        # Get available issue types
-        issue_types = jira.get_issue_types(project_key)
-        issue_type_names = (
-            [it["name"] for it in issue_types]
-            if issue_types
-            else ["Story", "Task", "Bug"]
-        )
+        # Get available issue types along with their field metadata
+        createmeta = jira.get_createmeta_bundle(project_key)
+        issue_type_names = list(createmeta) if createmeta else ["Story", "Task", "Bug"]
 
         # Summary (required)
-        summary = Prompt.ask("[yellow]Summary[/yellow] (required)")
+        if not (summary and summary.strip()):
+            summary = Prompt.ask("[yellow]Summary[/yellow] (required)")
         if not summary.strip():
             rprint("[red]Summary is required. Cancelled.[/red]")
             return None
 
         # Description (optional)
-        description = Prompt.ask(
-            "[yellow]Description[/yellow] (optional, press Enter to skip)", default=""
-        )
+        if description is None:
+            description = Prompt.ask(
+                "[yellow]Description[/yellow] (optional, press Enter to skip)", default=""
+            )
 
         # Issue type
         if default_issue_type in issue_type_names:
@@ -382,30 +423,36 @@ def prompt_for_issue_details(
         else:
             default_type = "Story"
 
-        if len(issue_type_names) > 1:
+        if issue_type:
+            rprint(f"[dim]Using issue type: {issue_type}[/dim]")
+        elif len(issue_type_names) > 1:
             rprint(f"[dim]Available types: {', '.join(issue_type_names)}[/dim]")
             issue_type = Prompt.ask("[yellow]Issue type[/yellow]", default=default_type)
         else:
             issue_type = default_type
             rprint(f"[dim]Using issue type: {issue_type}[/dim]")
 
-        parent_epic_key = _prompt_for_parent_epic(
-            issue_type,
-            project_key,
-            default_parent_epic_key,
-        )
+        if parent_epic_key and _is_parent_compatible_issue_type(issue_type):
+            parent_epic_key = parent_epic_key.strip() or None
+        else:
+            parent_epic_key = _prompt_for_parent_epic(
+                issue_type,
+                project_key,
+                default_parent_epic_key,
+            )
 
         # Labels (optional, comma-separated)
-        default_labels_str = ",".join(default_labels) if default_labels else ""
-        labels_input = Prompt.ask(
-            "[yellow]Labels[/yellow] (comma-separated, optional)",
-            default=default_labels_str,
-        )
-        labels = (
-            [l.strip() for l in labels_input.split(",") if l.strip()]
-            if labels_input
-            else []
-        )
+        if labels is None:
+            default_labels_str = ",".join(default_labels) if default_labels else ""
+            labels_input = Prompt.ask(
+                "[yellow]Labels[/yellow] (comma-separated, optional)",
+                default=default_labels_str,
+            )
+            labels = (
+                [l.strip() for l in labels_input.split(",") if l.strip()]
+                if labels_input
+                else []
+            )
 
         # Story points (optional, numeric)
         # Check if we have a story points field in defaults
@@ -418,52 +465,39 @@ def prompt_for_issue_details(
                 default_story_points = value
                 break
 
-        story_points_str = str(default_story_points) if default_story_points else ""
-        story_points_input = Prompt.ask(
-            "[yellow]Story points[/yellow] (optional, press Enter to skip)",
-            default=story_points_str,
-        )
-        story_points = None
-        if story_points_input.strip():
-            try:
-                story_points = float(story_points_input)
-            except ValueError:
-                rprint("[yellow]Invalid story points value, skipping.[/yellow]")
+        if story_points is None:
+            story_points_str = str(default_story_points) if default_story_points else ""
+            story_points_input = Prompt.ask(
+                "[yellow]Story points[/yellow] (optional, press Enter to skip)",
+                default=story_points_str,
+            )
+            if story_points_input.strip():
+                try:
+                    story_points = float(story_points_input)
+                except ValueError:
+                    rprint("[yellow]Invalid story points value, skipping.[/yellow]")
 
         # Get field metadata to discover required custom fields
         rprint("[dim]Checking for required fields...[/dim]")
-        metadata = jira.get_create_metadata(project_key, issue_type)
+        if issue_type in createmeta:
+            metadata = createmeta[issue_type]["fields"]
+        else:
+            metadata = jira.get_create_metadata(project_key, issue_type)
 
-        custom_fields = {}
+        custom_fields = provided_custom_fields
         default_custom_fields = default_custom_fields or {}
 
         # Find story points field in metadata and add it if user provided
         if story_points is not None and metadata:
-            for field_id, field_info in metadata.items():
-                field_name = field_info.get("name", "")
-                field_schema = field_info.get("schema", {})
-                field_type = field_schema.get("type", "")
-
-                # Look for story points field (common names and numeric type)
-                if field_type == "number" and field_name.lower() in [
-                    "story points",
-                    "storypoints",
-                    "story point estimate",
-                ]:
-                    custom_fields[field_id] = story_points
-                    story_points_field_id = field_id
-                    break
+            found_field_id = _find_story_points_field(metadata)
+            if found_field_id:
+                custom_fields[found_field_id] = story_points
+                story_points_field_id = found_field_id
 
         if metadata:
             for field_id, field_info in metadata.items():
                 # Skip standard fields we already handle
-                if field_id in [
-                    "summary",
-                    "description",
-                    "issuetype",
-                    "project",
-                    "labels",
-                ]:
+                if field_id in STANDARD_CREATE_FIELDS:
                     continue
 
                 # Skip story points field if we already processed it
@@ -474,6 +508,12 @@ def prompt_for_issue_details(
                 if not field_info.get("required", False):
                     continue
 
+                # Keep values provided up front when they fit the field
+                if field_id in provided_custom_fields and _value_fits_field(
+                    field_info, provided_custom_fields[field_id]
+                ):
+                    continue
+
                 field_name = field_info.get("name", field_id)
                 field_schema = field_info.get("schema", {})
                 field_type = field_schema.get("type", "")
@@ -603,9 +643,6 @@ def save_issue_defaults(
 
     Updates the .pwm.toml file with the new defaults.
     """
-    import tomllib
-    import toml  # For writing TOML
-
     config_path = repo_root / ".pwm.toml"
 
     # Read existing config as dict
@@ -614,25 +651,16 @@ def save_issue_defaults(
         with config_path.open("rb") as f:
             existing_config = tomllib.load(f)
 
-    # Update jira.issue_defaults section
-    if "jira" not in existing_config:
-        existing_config["jira"] = {}
-
-    existing_config["jira"]["issue_defaults"] = {"issue_type": issue_type}
-
+    # Build the new jira.issue_defaults section, then swap it in
+    issue_defaults: dict = {"issue_type": issue_type}
     if labels:
-        existing_config["jira"]["issue_defaults"]["labels"] = labels
-
+        issue_defaults["labels"] = labels
     if parent_epic_key:
-        existing_config["jira"]["issue_defaults"]["parent_epic_key"] = (
-            parent_epic_key
-        )
-
-    # Add custom fields if provided
+        issue_defaults["parent_epic_key"] = parent_epic_key
     if custom_fields:
-        existing_config["jira"]["issue_defaults"]["custom_fields"] = {}
-        for field_id, value in custom_fields.items():
-            existing_config["jira"]["issue_defaults"]["custom_fields"][field_id] = value
+        issue_defaults["custom_fields"] = dict(custom_fields)
+
+    existing_config.setdefault("jira", {})["issue_defaults"] = issue_defaults
 
     # Write back to file
     with config_path.open("w") as f:
@@ -689,7 +717,7 @@ def create_new_issue(
             custom_fields=custom_fields,
         )
     else:
-        # Prompt for details
+        # Prompt for details not already provided
         details = prompt_for_issue_details(
             jira,
             project_key,
@@ -697,6 +725,13 @@ def create_new_issue(
             default_labels,
             default_parent_epic_key,
             default_custom_fields,
+            summary=summary,
+            description=description,
+            issue_type=issue_type,
+            labels=labels,
+            story_points=story_points,
+            parent_epic_key=epic,
+            custom_fields=custom_fields,
         )
 
     if not details:
@@ -765,6 +800,7 @@ def create_new_issue(
             resolved_save_defaults = save_defaults
 
         if resolved_save_defaults:
+            # Written before returning: work start checks out a branch next
             save_issue_defaults(
                 repo_root,
                 details["issue_type"],
@@ -1,5 +1,6 @@
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -8,8 +9,12 @@ import sys
 from rich import print as rprint
 
 from pwm.context.resolver import resolve_context
-from pwm.vcs.git_cli import current_branch, get_commits_since_base
-from pwm.github.client import GitHubClient
+from pwm.vcs.git_cli import (
+    current_branch,
+    get_commit_count_and_latest_subject,
+    get_commits_since_base,
+)
+from pwm.github.client import PWM_COMMENT_MARKER, GitHubClient
 from pwm.jira.client import JiraClient
 from pwm.prompt.command import extract_issue_key_from_branch
 
@@ -46,18 +51,19 @@ def generate_work_summary(commits: list[dict]) -> str:
     """
     if not commits:
         return "No new changes since last update."
+    return _summarize_commit_count(len(commits), commits[0]["subject"])
 
-    commit_count = len(commits)
 
-    # Extract key topics from commit messages
-    subjects = [c["subject"] for c in commits]
+def _summarize_commit_count(commit_count: int, first_subject: Optional[str]) -> str:
+    """Summary text from the commit count and the newest commit's subject."""
+    if not commit_count:
+        return "No new changes since last update."
 
     # Simple heuristic: take first commit subject as main change
     if commit_count == 1:
-        return f"{subjects[0]}."
+        return f"{first_subject}."
 
     # For multiple commits, provide count and first subject
-    first_subject = subjects[0]
     return f"{first_subject} and {commit_count - 1} other change{'s' if commit_count > 2 else ''}."
 
 
@@ -116,8 +122,12 @@ def work_end(
         rprint("[cyan]Set GITHUB_TOKEN or PWM_GITHUB_TOKEN environment variable.[/cyan]")
         return 1
 
-    # Check if PR exists (check both open and closed)
-    pr = github.get_pr_for_branch(github_repo, branch, state="all")
+    # Check if PR exists (check both open and closed). GraphQL also returns the
+    # pending review requests and last pwm comment time in the same request;
+    # fall back to REST only when it could not answer (None, not an empty "no PR").
+    pr = github.get_pr_for_branch_graphql(github_repo, branch)
+    if pr is None:
+        pr = github.get_pr_for_branch(github_repo, branch, state="all")
     if not pr:
         _debug(f"no PR found for branch '{branch}' in {github_repo}")
         rprint(f"[yellow]Error: No pull request found for branch '{branch}'.[/yellow]")
@@ -135,14 +145,20 @@ def work_end(
     remote = ctx.config.get("git", {}).get("default_remote", "origin")
 
     # Get last pwm comment timestamp for smart commit tracking
-    last_comment_time = github.get_last_pwm_comment_time(github_repo, pr_number)
+    if "last_pwm_comment_time" in pr:
+        last_comment_time = pr["last_pwm_comment_time"]
+    else:
+        last_comment_time = github.get_last_pwm_comment_time(github_repo, pr_number)
     if last_comment_time:
         rprint(f"[dim]Last update: {last_comment_time.strftime('%Y-%m-%d %H:%M:%S UTC')}[/dim]")
 
-    # Get commits since last comment (or all commits if no previous comment)
-    commits = get_commits_since_base(repo_root, remote=remote, since=last_comment_time)
+    # Count commits since last comment (or all commits if no previous comment);
+    # the summary only needs the count and the newest subject
+    commit_count, latest_subject = get_commit_count_and_latest_subject(
+        repo_root, remote=remote, since=last_comment_time
+    )
 
-    if not commits:
+    if not commit_count:
         _debug("no commits found since last tracked timestamp")
         if last_comment_time:
             rprint("[yellow]No new commits since last update.[/yellow]")
@@ -153,57 +169,85 @@ def work_end(
     if message:
         summary = message
     else:
-        summary = generate_work_summary(commits)
+        summary = _summarize_commit_count(commit_count, latest_subject)
 
     rprint(f"[cyan]Summary:[/cyan] {summary}")
 
-    # Comment on PR
+    # The PR comment, Jira comment and reviewer request are independent API
+    # calls, so they run concurrently. Results are printed from this thread in
+    # a fixed order once each call returns.
     pr_commented = False
-    if not no_comment and not no_pr_comment:
-        rprint(f"[cyan]Adding comment to PR #{pr_number}...[/cyan]")
-        # Add hidden marker for smart commit tracking
-        comment_body = f"<!-- pwm:work-end -->\n**Status Update**\n\n{summary}"
-
-        if github.add_pr_comment(github_repo, pr_number, comment_body):
-            pr_commented = True
-            rprint("[green]✓ Commented on PR[/green]")
-        else:
-            _debug(f"failed to add PR comment to #{pr_number}")
-            rprint("[yellow]⚠ Failed to comment on PR[/yellow]")
-
-    # Comment on Jira
     jira_commented = False
-    if not no_comment and not no_jira_comment:
-        jira = JiraClient.from_config(ctx.config)
-        if jira:
-            rprint(f"[cyan]Adding comment to Jira {issue_key}...[/cyan]")
-
-            # Add comment with clickable link
-            if jira.add_comment_with_link(
-                issue_key,
-                f"Status update: {summary}",
-                f"View PR #{pr_number}",
-                pr_url
-            ):
+    reviewers_requested = False
+    reviewers: list[str] = []
+    team_reviewers: list[str] = []
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        pr_future = None
+        if not no_comment and not no_pr_comment:
+            rprint(f"[cyan]Adding comment to PR #{pr_number}...[/cyan]")
+            # Add hidden marker for smart commit tracking
+            comment_body = f"{PWM_COMMENT_MARKER}\n**Status Update**\n\n{summary}"
+            pr_future = pool.submit(github.add_pr_comment, github_repo, pr_number, comment_body)
+
+        jira_future = None
+        if not no_comment and not no_jira_comment:
+            jira = JiraClient.from_config(ctx.config)
+            if jira:
+                rprint(f"[cyan]Adding comment to Jira {issue_key}...[/cyan]")
+                # Add comment with clickable link
+                jira_future = pool.submit(
+                    jira.add_comment_with_link,
+                    issue_key,
+                    f"Status update: {summary}",
+                    f"View PR #{pr_number}",
+                    pr_url,
+                )
+            else:
+                _debug("JiraClient.from_config returned None; skipping Jira comment")
+                rprint("[dim]Skipping Jira comment (not configured)[/dim]")
+
+        review_future = None
+        if request_review:
+            pr_defaults = ctx.config.get("github", {}).get("pr_defaults", {})
+            reviewers = pr_defaults.get("reviewers", [])
+            team_reviewers = pr_defaults.get("team_reviewers", [])
+            if reviewers or team_reviewers:
+                # Skip reviewers the PR already has pending requests for
+                requested = set(pr.get("requested_reviewers", ()))
+                requested_teams = set(pr.get("requested_teams", ()))
+                reviewers = [r for r in reviewers if r not in requested]
+                team_reviewers = [t for t in team_reviewers if t not in requested_teams]
+                if reviewers or team_reviewers:
+                    rprint("[cyan]Requesting reviewers...[/cyan]")
+                    review_future = pool.submit(
+                        github.request_reviewers, github_repo, pr_number, reviewers, team_reviewers
+                    )
+                else:
+                    rprint("[dim]Configured reviewers are already requested[/dim]")
+            else:
+                _debug("request_review enabled but no reviewers configured")
+                rprint("[yellow]No reviewers configured in .pwm.toml[/yellow]")
+                rprint("[dim]Add [github.pr_defaults] section with reviewers/team_reviewers[/dim]")
+
+        if pr_future is not None:
+            if pr_future.result():
+                pr_commented = True
+                rprint("[green]✓ Commented on PR[/green]")
+            else:
+                _debug(f"failed to add PR comment to #{pr_number}")
+                rprint("[yellow]⚠ Failed to comment on PR[/yellow]")
+
+        if jira_future is not None:
+            if jira_future.result():
                 jira_commented = True
                 rprint("[green]✓ Commented on Jira[/green]")
             else:
                 _debug(f"failed to add Jira comment to {issue_key}")
                 rprint("[yellow]⚠ Failed to comment on Jira[/yellow]")
-        else:
-            _debug("JiraClient.from_config returned None; skipping Jira comment")
-            rprint("[dim]Skipping Jira comment (not configured)[/dim]")
 
-    # Request reviewers if requested
-    reviewers_requested = False
-    if request_review:
-        pr_defaults = ctx.config.get("github", {}).get("pr_defaults", {})
-        reviewers = pr_defaults.get("reviewers", [])
-        team_reviewers = pr_defaults.get("team_reviewers", [])
-
-        if reviewers or team_reviewers:
-            rprint("[cyan]Requesting reviewers...[/cyan]")
-            if github.request_reviewers(github_repo, pr_number, reviewers, team_reviewers):
+        if review_future is not None:
+            if review_future.result():
                 reviewers_requested = True
                 if reviewers:
                     rprint(f"[green]✓ Requested reviewers: {', '.join(reviewers)}[/green]")
@@ -212,10 +256,6 @@ def work_end(
             else:
                 _debug(f"failed to request reviewers for PR #{pr_number}")
                 rprint("[yellow]⚠ Failed to request reviewers[/yellow]")
-        else:
-            _debug("request_review enabled but no reviewers configured")
-            rprint("[yellow]No reviewers configured in .pwm.toml[/yellow]")
-            rprint("[dim]Add [github.pr_defaults] section with reviewers/team_reviewers[/dim]")
 
     # Summary
     rprint()
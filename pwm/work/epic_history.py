@@ -4,8 +4,11 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 import re
+import tomllib
 from typing import Optional
 
+import toml
+
 from rich import print as rprint
 from rich.prompt import Confirm
 from rich.table import Table
@@ -109,8 +112,6 @@ def _get_repo_default_parent_epic_key() -> Optional[str]:
     if not config_path.exists():
         return None
 
-    import tomllib
-
     try:
         with config_path.open("rb") as file_obj:
             data = tomllib.load(file_obj)
@@ -131,8 +132,6 @@ def _set_repo_default_parent_epic_key(epic_key: str) -> bool:
     existing_config = {}
 
     if config_path.exists():
-        import tomllib
-
         try:
             with config_path.open("rb") as file_obj:
                 existing_config = tomllib.load(file_obj)
@@ -146,8 +145,6 @@ def _set_repo_default_parent_epic_key(epic_key: str) -> bool:
 
     existing_config["jira"]["issue_defaults"]["parent_epic_key"] = epic_key
 
-    import toml
-
     try:
         with config_path.open("w", encoding="utf-8") as file_obj:
             toml.dump(existing_config, file_obj)
@@ -168,9 +165,6 @@ def _clear_repo_default_parent_epic_key() -> bool:
     if not config_path.exists():
         return True
 
-    import tomllib
-    import toml
-
     try:
         with config_path.open("rb") as file_obj:
             existing_config = tomllib.load(file_obj)
@@ -1,15 +1,67 @@
 
 from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from string import Formatter
 from typing import Optional
 from rich import print as rprint
 from rich.table import Table
 
 from pwm.context.resolver import resolve_context, slugify
-from pwm.vcs.git_cli import current_branch, branch_exists, create_branch, switch_branch
+from pwm.vcs.git_cli import git_state, create_branch, switch_branch
 from pwm.jira.client import JiraClient
 from pwm.work.create_issue import create_new_issue
 
+def _assign_to_current_user(jira: JiraClient, issue_key: str) -> bool:
+    account_id = jira.get_current_account_id()
+    return bool(account_id and jira.assign_issue(issue_key, account_id))
+
+def _assign_then_transition(jira: JiraClient, issue_key: str, transition: bool) -> tuple[bool, bool]:
+    # Workflows may require an assignee to start work, so the transition
+    # only goes out once the assignment has finished
+    assigned = _assign_to_current_user(jira, issue_key)
+    transitioned = bool(transition and jira.transition_by_name(issue_key, "In Progress"))
+    return assigned, transitioned
+
+def _future_result(future: Optional[Future], default=False):
+    """Result of a Jira call, or default when it was not started or raised."""
+    if future is None:
+        return default
+    try:
+        return future.result()
+    except Exception as e:
+        rprint(f"[yellow]Jira request failed: {e}[/yellow]")
+        return default
+
+_YES_NO = ("no", "yes")
+
+def _render_result_table(
+    branch_name: str,
+    *,
+    created: bool,
+    switched: bool,
+    summary: Optional[str],
+    jira_results: Optional[tuple[bool, bool, bool]],
+) -> Table:
+    """Build the work-start summary table; jira_results is None when Jira is not configured."""
+    assigned, transitioned, commented = (
+        tuple(_YES_NO[bool(r)] for r in jira_results) if jira_results else ("<skipped>",) * 3
+    )
+    table = Table(title="pwm work start")
+    table.add_column("Action", style="bold cyan")
+    table.add_column("Result", style="white")
+    for action, result in (
+        ("Branch name", branch_name),
+        ("Branch created", _YES_NO[bool(created)]),
+        ("Switched to branch", _YES_NO[bool(switched)]),
+        ("Jira summary", summary or "<unknown>"),
+        ("Jira assigned to me", assigned),
+        ("Jira transitioned -> In Progress", transitioned),
+        ("Jira comment added", commented),
+    ):
+        table.add_row(action, result)
+    return table
+
 def work_start(
     issue_key: Optional[str] = None,
     create_new: bool = False,
@@ -80,55 +132,60 @@ def work_start(
                 event_details["error"] = "Issue creation cancelled or failed"
             return 1
 
-    # Get issue summary for branch naming
-    summary = jira.get_issue_summary(issue_key) if jira else None
-
-    slug = slugify(summary or issue_key)
-    pattern = ctx.config.get("branch", {}).get("pattern") or "{issue_key}-{slug}"
-    branch_name = pattern.format(issue_key=issue_key, slug=slug)
-
-    # Get configured remote
-    remote = ctx.config.get("git", {}).get("default_remote", "origin")
-
-    current = current_branch(repo_root)
-    created = False
-    switched = False
-    if current == branch_name:
-        pass
-    elif branch_exists(repo_root, branch_name):
-        switched = switch_branch(repo_root, branch_name)
-    else:
-        created = create_branch(repo_root, branch_name, remote=remote)
-        switched = True if created else False
-
-    transitioned = False
-    commented = False
-    assigned = False
-    repo_name = ctx.github_repo or repo_root.name
-    if jira:
-        # Assign issue to current user
-        account_id = jira.get_current_account_id()
-        if account_id:
-            assigned = jira.assign_issue(issue_key, account_id)
-        if transition:
-            transitioned = jira.transition_by_name(issue_key, "In Progress") or False
-        if comment:
+    # Jira calls overlap with each other and with the branch setup. The
+    # assignment and transition run in order on one worker; the summary
+    # lookup and comment are independent of them.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        summary_future = pool.submit(jira.get_issue_summary, issue_key) if jira else None
+        assign_future = (
+            pool.submit(_assign_then_transition, jira, issue_key, transition) if jira else None
+        )
+
+        # The summary only gates branch naming when the pattern uses {slug};
+        # otherwise it is just shown in the result table
+        pattern = ctx.config.get("branch", {}).get("pattern") or "{issue_key}-{slug}"
+        uses_slug = "slug" in {name for _, name, _, _ in Formatter().parse(pattern)}
+        if uses_slug:
+            summary = _future_result(summary_future, None)
+            slug = slugify(summary or issue_key)
+        else:
+            slug = ""
+        branch_name = pattern.format(issue_key=issue_key, slug=slug)
+
+        comment_future = None
+        repo_name = ctx.github_repo or repo_root.name
+        if jira and comment:
             comment_text = (
                 f"Started work on branch `{branch_name}` in repo `{repo_name}`"
             )
-            commented = jira.add_comment(issue_key, comment_text) or False
-
-    table = Table(title="pwm work start")
-    table.add_column("Action", style="bold cyan")
-    table.add_column("Result", style="white")
-    table.add_row("Branch name", branch_name)
-    table.add_row("Branch created", "yes" if created else "no")
-    table.add_row("Switched to branch", "yes" if (switched or current == branch_name) else "no")
-    table.add_row("Jira summary", summary or "<unknown>")
-    table.add_row("Jira assigned to me", ("yes" if assigned else "no") if jira else "<skipped>")
-    table.add_row("Jira transitioned -> In Progress", ("yes" if transitioned else "no") if jira else "<skipped>")
-    table.add_row("Jira comment added", ("yes" if commented else "no") if jira else "<skipped>")
-    rprint(table)
+            comment_future = pool.submit(jira.add_comment, issue_key, comment_text)
+
+        # Get configured remote
+        remote = ctx.config.get("git", {}).get("default_remote", "origin")
+
+        current, exists = git_state(repo_root, branch_name)
+        created = False
+        switched = False
+        if current == branch_name:
+            pass
+        elif exists:
+            switched = switch_branch(repo_root, branch_name)
+        else:
+            created = create_branch(repo_root, branch_name, remote=remote)
+            switched = True if created else False
+
+        if not uses_slug:
+            summary = _future_result(summary_future, None)
+        assigned, transitioned = _future_result(assign_future, (False, False))
+        commented = bool(_future_result(comment_future))
+
+    rprint(_render_result_table(
+        branch_name,
+        created=created,
+        switched=switched or current == branch_name,
+        summary=summary,
+        jira_results=(assigned, transitioned, commented) if jira else None,
+    ))
 
     if event_details is not None:
         event_details["issue_key"] = issue_key
@@ -1,6 +1,11 @@
 
 import contextlib
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
 
 class DummyRunResult:
     def __init__(self, returncode=0, stdout=""):
@@ -21,3 +26,49 @@ def temp_cwd(tmp_path):
 def make_git_repo(tmp_path):
     (tmp_path / ".git").mkdir(parents=True, exist_ok=True)
     return tmp_path
+
+
+@dataclass
+class FakeHTTPResponse:
+    status_code: int
+    json_data: Any = None
+    headers: dict = field(default_factory=dict)
+
+    def json(self):
+        return self.json_data
+
+
+class FakeHTTPClient:
+    """Stands in for httpx.Client: answers every request with one response."""
+
+    def __init__(self):
+        self.response = FakeHTTPResponse(200)
+        self.calls = []
+
+    def respond(self, status_code, json_data=None, headers=None):
+        self.response = FakeHTTPResponse(status_code, json_data, headers or {})
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def get(self, url, **kwargs):
+        self.calls.append(("get", url, kwargs))
+        return self.response
+
+    def post(self, url, **kwargs):
+        self.calls.append(("post", url, kwargs))
+        return self.response
+
+
+@pytest.fixture
+def fake_http(monkeypatch):
+    """Patch httpx.Client with a FakeHTTPClient and return it."""
+    client = FakeHTTPClient()
+    monkeypatch.setattr(httpx, "Client", client)
+    return client
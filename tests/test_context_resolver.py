@@ -1,6 +1,7 @@
 
 from pathlib import Path
 import pytest
+import pwm.context.resolver as resolver
 from pwm.context.resolver import slugify, find_git_root
 
 @pytest.mark.parametrize("text,expected", [
@@ -16,3 +17,26 @@ def test_find_git_root(tmp_path):
     child.mkdir(parents=True)
     (tmp_path / ".git").mkdir()
     assert find_git_root(child) == tmp_path
+
+def test_resolve_context_is_cached_until_project_config_changes(tmp_path, monkeypatch):
+    (tmp_path / ".git").mkdir()
+    monkeypatch.setattr(resolver.loader, "USER_CONFIG_PATH", tmp_path / "missing.toml")
+    calls = []
+    real_load = resolver.load_merged_config
+
+    def fake_load(repo_root):
+        calls.append(repo_root)
+        return real_load(repo_root)
+
+    monkeypatch.setattr(resolver, "load_merged_config", fake_load)
+    resolver._resolve_for_root.cache_clear()
+    monkeypatch.setattr(resolver, "infer_github_repo", lambda repo_root, config: "org/repo")
+
+    first = resolver.resolve_context(tmp_path)
+    assert resolver.resolve_context(tmp_path) is first
+    assert len(calls) == 1
+
+    (tmp_path / ".pwm.toml").write_text('[jira]\nproject_key = "ABC"\n')
+    assert resolver.resolve_context(tmp_path).jira_project_key == "ABC"
+    assert len(calls) == 2
+    resolver._resolve_for_root.cache_clear()
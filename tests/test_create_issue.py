@@ -1,9 +1,14 @@
+import tomllib
+
 import pwm.work.epic_history as epic_history_module
 from pwm.work.create_issue import (
     _resolve_epic_query_to_key,
     build_non_interactive_issue_details,
+    create_new_issue,
     parse_custom_field_values,
+    prompt_for_issue_details,
     record_epic_in_history,
+    save_issue_defaults,
 )
 
 
@@ -77,6 +82,33 @@ def test_build_non_interactive_issue_details_uses_defaults_and_overrides():
     assert details["custom_fields"]["customfield_extra"] == "x"
 
 
+def test_build_non_interactive_issue_details_maps_story_point_estimate_field():
+    class FakeJira:
+        def get_create_metadata(self, _project_key, _issue_type):
+            return {
+                "customfield_estimate": {
+                    "name": "Story point estimate",
+                    "required": False,
+                    "schema": {"type": "number"},
+                },
+            }
+
+    details = build_non_interactive_issue_details(
+        jira=FakeJira(),
+        project_key="ABC",
+        config={},
+        summary="Estimate field",
+        description="",
+        issue_type="Story",
+        labels=None,
+        story_points=3.0,
+        custom_fields={},
+    )
+
+    assert details is not None
+    assert details["custom_fields"]["customfield_estimate"] == 3.0
+
+
 def test_build_non_interactive_issue_details_fails_on_missing_required_fields():
     class FakeJira:
         def get_create_metadata(self, _project_key, _issue_type):
@@ -236,6 +268,50 @@ def test_record_epic_in_history_dedupes_and_updates_latest(monkeypatch, tmp_path
     assert data[0]["key"] == "ABC-1"
 
 
+def test_save_issue_defaults_replaces_section_and_keeps_other_config(tmp_path):
+    config_path = tmp_path / ".pwm.toml"
+    config_path.write_text(
+        '[jira]\nproject_key = "ABC"\n\n[jira.issue_defaults]\nissue_type = "Bug"\nlabels = ["old"]\n'
+    )
+
+    save_issue_defaults(tmp_path, "Task", [], parent_epic_key="ABC-9", custom_fields={"customfield_1": 3})
+
+    saved = tomllib.loads(config_path.read_text())
+    assert saved["jira"]["project_key"] == "ABC"
+    assert saved["jira"]["issue_defaults"] == {
+        "issue_type": "Task",
+        "parent_epic_key": "ABC-9",
+        "custom_fields": {"customfield_1": 3},
+    }
+
+
+def test_create_new_issue_saves_defaults_before_returning(tmp_path):
+    class FakeJira:
+        base_url = "https://example.atlassian.net"
+
+        def get_create_metadata(self, _project_key, _issue_type):
+            return {}
+
+        def create_issue(self, **_kwargs):
+            return "ABC-42"
+
+    issue_key = create_new_issue(
+        FakeJira(),
+        "ABC",
+        tmp_path,
+        {},
+        non_interactive=True,
+        summary="Add caching",
+        issue_type="Task",
+        save_defaults=True,
+    )
+    assert issue_key == "ABC-42"
+
+    with (tmp_path / ".pwm.toml").open("rb") as f:
+        config = tomllib.load(f)
+    assert config["jira"]["issue_defaults"]["issue_type"] == "Task"
+
+
 def test_resolve_epic_query_accepts_completion_label():
     history = [
         {
@@ -265,3 +341,59 @@ def test_resolve_epic_query_accepts_partial_unique_title():
     resolved = _resolve_epic_query_to_key("redshif", history)
 
     assert resolved == "ALLI-25002"
+
+
+def test_prompt_for_issue_details_skips_prompts_for_provided_values(monkeypatch):
+    class FakeJira:
+        def get_createmeta_bundle(self, _project_key):
+            return {
+                "Task": {
+                    "id": "1",
+                    "description": "",
+                    "fields": {
+                        "customfield_1": {
+                            "name": "Team",
+                            "required": True,
+                            "schema": {"type": "option"},
+                            "allowedValues": [{"value": "Core"}, {"value": "Web"}],
+                        },
+                        "customfield_2": {
+                            "name": "Component note",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    },
+                },
+            }
+
+    asked = []
+
+    def fake_ask(prompt, default=None):
+        asked.append(prompt)
+        return "typed note"
+
+    monkeypatch.setattr("pwm.work.create_issue.Prompt.ask", fake_ask)
+
+    details = prompt_for_issue_details(
+        FakeJira(),
+        "ABC",
+        summary="Add login",
+        description="",
+        issue_type="Task",
+        labels=["auth"],
+        story_points=None,
+        parent_epic_key="ABC-9",
+        custom_fields={"customfield_1": {"value": "Core"}},
+    )
+
+    # Only the story points prompt and the missing required string field remain
+    assert len(asked) == 2
+    assert "Component note" in asked[1]
+    assert details["summary"] == "Add login"
+    assert details["issue_type"] == "Task"
+    assert details["labels"] == ["auth"]
+    assert details["parent_epic_key"] == "ABC-9"
+    assert details["custom_fields"] == {
+        "customfield_1": {"value": "Core"},
+        "customfield_2": "typed note",
+    }
@@ -1,11 +1,21 @@
 
+from datetime import datetime, timezone
+import threading
+import time
+from types import MappingProxyType
+
 import httpx
+import pytest
 from pwm.github.client import GitHubClient
 
+# Shared read-only body for responses built without one
+EMPTY_JSON = MappingProxyType({})
+
 class FakeResp:
-    def __init__(self, status_code, json_data=None):
+    def __init__(self, status_code, json_data=None, headers=None):
         self.status_code = status_code
-        self._json = json_data or {}
+        self._json = EMPTY_JSON if json_data is None else json_data
+        self.headers = headers or {}
     def json(self):
         return self._json
 
@@ -17,31 +27,234 @@ class FakeClient:
     def get(self, url, headers=None):
         return self.resp
 
-def test_ping_ok(monkeypatch):
+@pytest.mark.parametrize("status,expected,message", [
+    (200, True, "ok (as me)"),
+    (401, False, "unauthorized"),
+])
+def test_ping(monkeypatch, status, expected, message):
     gh = GitHubClient(base_url="https://api.github.com", token="t")
-    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0: FakeClient(FakeResp(200, {"login": "me"})))
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FakeClient(FakeResp(status, {"login": "me"})))
     ok, msg = gh.ping()
-    assert ok is True
-    assert "ok" in msg
+    assert ok is expected
+    assert message in msg
 
-def test_ping_unauthorized(monkeypatch):
-    gh = GitHubClient(base_url="https://api.github.com", token="t")
-    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0: FakeClient(FakeResp(401, {})))
-    ok, msg = gh.ping()
-    assert ok is False
+def test_from_config_reuses_client_for_same_token():
+    gh = GitHubClient.from_config({"github": {"token": "t"}})
+    assert GitHubClient.from_config({"github": {"token": "t"}}) is gh
+    assert gh.base_url == "https://api.github.com"
+    assert GitHubClient.from_config({"github": {"token": "other"}}) is not gh
+    assert GitHubClient.from_config({"github": {}}) is None
+
+def test_requests_share_one_http_client(monkeypatch):
+    created = []
+    closed = []
+
+    class ClosingClient(FakeClient):
+        def close(self):
+            closed.append(self)
+
+    def make_client(timeout=10.0, **kwargs):
+        created.append(kwargs)
+        return ClosingClient(FakeResp(200, {"login": "me"}))
+
+    monkeypatch.setattr(httpx, "Client", make_client)
+    with GitHubClient(base_url="https://api.github.com", token="t") as gh:
+        gh.ping()
+        gh.list_prs("org/repo")
+        assert not closed
+    assert len(created) == 1
+    assert isinstance(created[0]["transport"], httpx.HTTPTransport)
+    assert len(closed) == 1
+
+def test_shared_transport_uses_http2_when_available(monkeypatch):
+    import pwm.github.client as client_module
+    transports = []
+
+    def make_transport(**kwargs):
+        transports.append(kwargs)
+        return None
+
+    monkeypatch.setattr(client_module, "_HTTP2", True)
+    monkeypatch.setattr(httpx, "HTTPTransport", make_transport)
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FakeClient(FakeResp(200, {"login": "me"})))
+    GitHubClient(base_url="https://api.github.com", token="t").ping()
+    assert transports[0]["http2"] is True
 
 def test_get_current_user_success(monkeypatch):
     gh = GitHubClient(base_url="https://api.github.com", token="t")
-    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0: FakeClient(FakeResp(200, {"login": "testuser"})))
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FakeClient(FakeResp(200, {"login": "testuser"})))
     username = gh.get_current_user()
     assert username == "testuser"
 
 def test_get_current_user_failure(monkeypatch):
     gh = GitHubClient(base_url="https://api.github.com", token="t")
-    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0: FakeClient(FakeResp(401, {})))
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FakeClient(FakeResp(401, {})))
     username = gh.get_current_user()
     assert username is None
 
+def test_get_current_user_is_cached(monkeypatch):
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    calls = []
+
+    def make_client(timeout=10.0, **kwargs):
+        calls.append(timeout)
+        return FakeClient(FakeResp(200, {"login": "testuser"}))
+
+    monkeypatch.setattr(httpx, "Client", make_client)
+    assert gh.get_current_user() == "testuser"
+    assert gh.get_current_user() == "testuser"
+    assert len(calls) == 1
+
+def test_get_pr_for_branch_graphql_returns_pr_with_review_requests(monkeypatch):
+    gh = GitHubClient(base_url="https://github.example.com/api/v3", token="t")
+    posted = []
+    node = {
+        "number": 7,
+        "title": "Fix",
+        "url": "https://github.example.com/org/repo/pull/7",
+        "headRepositoryOwner": {"login": "org"},
+        "reviewRequests": {"nodes": [
+            {"requestedReviewer": {"login": "alice"}},
+            {"requestedReviewer": {"slug": "platform"}},
+        ]},
+        "comments": {"nodes": [
+            {"body": "<!-- pwm:work-end -->\nOld", "createdAt": "2024-01-02T10:00:00Z"},
+            {"body": "<!-- pwm:work-end -->\nNew", "createdAt": "2024-01-04T15:30:00Z"},
+            {"body": "LGTM", "createdAt": "2024-01-05T00:00:00Z"},
+        ]},
+    }
+    fork = dict(node, number=3, headRepositoryOwner={"login": "someone"})
+
+    class GraphQLClient(FakeClient):
+        def post(self, url, headers=None, json=None):
+            posted.append((url, json["variables"]))
+            return self.resp
+
+    resp = FakeResp(200, {"data": {"repository": {"pullRequests": {"nodes": [fork, node]}}}})
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: GraphQLClient(resp))
+    pr = gh.get_pr_for_branch_graphql("org/repo", "ABC-1-fix")
+
+    assert posted == [("https://github.example.com/api/graphql",
+                       {"owner": "org", "name": "repo", "branch": "ABC-1-fix"})]
+    assert pr["number"] == 7
+    assert pr["requested_reviewers"] == ["alice"]
+    assert pr["requested_teams"] == ["platform"]
+    assert pr["last_pwm_comment_time"].day == 4
+
+@pytest.mark.parametrize("pull_requests,expected", [
+    # More than the last 100 comments and no marker among them: REST must look further back
+    pytest.param({"nodes": [{
+        "number": 7, "headRepositoryOwner": {"login": "org"},
+        "comments": {"pageInfo": {"hasPreviousPage": True}, "nodes": [{"body": "LGTM", "createdAt": "2024-01-05T00:00:00Z"}]},
+    }]}, {"number": 7, "title": "", "html_url": "", "requested_reviewers": [], "requested_teams": []},
+        id="older_comments_unread"),
+    pytest.param({"pageInfo": {"hasNextPage": False}, "nodes": []}, {}, id="no_pr"),
+    pytest.param({"pageInfo": {"hasNextPage": True}, "nodes": [
+        {"number": 3, "headRepositoryOwner": {"login": "someone"}},
+    ]}, None, id="only_forks_in_first_page"),
+])
+def test_get_pr_for_branch_graphql_partial_answers(monkeypatch, pull_requests, expected):
+    """Only a definitive GraphQL answer is returned; gaps are left to REST."""
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    monkeypatch.setattr(GitHubClient, "graphql",
+                        lambda self, q, v, **kwargs: {"repository": {"pullRequests": pull_requests}})
+
+    assert gh.get_pr_for_branch_graphql("org/repo", "ABC-1-fix") == expected
+
+@pytest.mark.parametrize("body", [
+    pytest.param({"data": {"repository": None},
+                  "errors": [{"type": "FORBIDDEN", "message": "SAML enforcement"}]}, id="forbidden"),
+    pytest.param({"data": {"repository": None}}, id="null_repository"),
+    pytest.param({"data": {"repository": {"pullRequests": {"nodes": []}}},
+                  "errors": [{"type": "NOT_FOUND", "message": "partial"}]}, id="errors_with_data"),
+])
+def test_get_pr_for_branch_graphql_defers_to_rest_on_errors(monkeypatch, body):
+    """GitHub reports access problems as HTTP 200 with errors; that is not a "no PR" answer."""
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FakeClient(None))
+    monkeypatch.setattr(GitHubClient, "_send", lambda self, c, method, url, **kwargs: FakeResp(200, body))
+
+    assert gh.get_pr_for_branch_graphql("org/repo", "ABC-1-fix") is None
+
+def test_get_pr_comments_revalidates_with_etag(monkeypatch):
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    seen = []
+    comments = [{"id": 1, "body": "hi"}]
+
+    class ETagClient(FakeClient):
+        def get(self, url, headers=None, params=None):
+            seen.append(headers.get("If-None-Match"))
+            if headers.get("If-None-Match") == 'W/"abc"':
+                return FakeResp(304)
+            return FakeResp(200, comments, headers={"ETag": 'W/"abc"'})
+
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: ETagClient(None))
+    assert gh.get_pr_comments("org/repo", 1) == comments
+    assert gh.get_pr_comments("org/repo", 1) == comments
+    assert seen == [None, 'W/"abc"']
+
+def test_rate_limit_backoff_retries_after_retry_after(monkeypatch):
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    responses = [
+        FakeResp(403, headers={"Retry-After": "0"}),
+        FakeResp(200, [{"number": 1}]),
+    ]
+
+    class RateLimitedClient(FakeClient):
+        def get(self, url, headers=None, params=None):
+            return responses.pop(0)
+
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: RateLimitedClient(None))
+    assert gh.list_prs("org/repo") == [{"number": 1}]
+    assert responses == []
+
+def test_list_prs_follows_next_links_at_max_page_size(monkeypatch):
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    next_url = "https://api.github.com/repos/org/repo/pulls?state=open&per_page=100&page=2"
+    requested = []
+
+    class PagedClient(FakeClient):
+        def get(self, url, headers=None, params=None):
+            requested.append((url, params))
+            if url == next_url:
+                return FakeResp(200, [{"number": 2}])
+            return FakeResp(200, [{"number": 1}], headers={"Link": f'<{next_url}>; rel="next", <{next_url}>; rel="last"'})
+
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: PagedClient(None))
+    assert gh.list_prs("org/repo") == [{"number": 1}, {"number": 2}]
+    assert requested == [
+        ("https://api.github.com/repos/org/repo/pulls", {"state": "open", "per_page": 100}),
+        (next_url, None),
+    ]
+
+def test_server_error_get_is_retried(monkeypatch):
+    import pwm.github.client as client_module
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    responses = [FakeResp(503, {}), FakeResp(200, {"number": 7})]
+
+    class FlakyClient(FakeClient):
+        def get(self, url, headers=None, params=None):
+            return responses.pop(0)
+
+    monkeypatch.setattr(client_module, "_BACKOFF_BASE", 0)
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FlakyClient(None))
+    assert gh.get_pr_details("org/repo", 7) == {"number": 7}
+    assert responses == []
+
+def test_rate_limit_gives_up_when_reset_is_far_away(monkeypatch):
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    calls = []
+    exhausted = FakeResp(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9999999999"})
+
+    class ExhaustedClient(FakeClient):
+        def get(self, url, headers=None, params=None):
+            calls.append(url)
+            return exhausted
+
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: ExhaustedClient(None))
+    assert gh.list_prs("org/repo") == []
+    assert len(calls) == 1
+
 def test_search_prs_by_date(monkeypatch):
     from datetime import datetime
     gh = GitHubClient(base_url="https://api.github.com", token="t")
@@ -51,7 +264,7 @@ def test_search_prs_by_date(monkeypatch):
             pass
         def __enter__(self): return self
         def __exit__(self, *args): pass
-        def get(self, url, headers=None, params=None):
+        def get(self, url, headers=None, params=None, timeout=None):
             # Verify query contains expected parameters
             if "/search/issues" in url and params:
                 query = params.get("q", "")
@@ -66,7 +279,7 @@ def test_search_prs_by_date(monkeypatch):
                 })
             return FakeResp(404, {})
 
-    monkeypatch.setattr(httpx, "Client", lambda timeout=30.0: FakeSearchClient())
+    monkeypatch.setattr(httpx, "Client", lambda timeout=30.0, **kwargs: FakeSearchClient())
     since = datetime(2025, 1, 10, 0, 0)
     results = gh.search_prs_by_date("org/repo", since)
 
@@ -74,6 +287,53 @@ def test_search_prs_by_date(monkeypatch):
     assert results[0]["number"] == 1
     assert results[1]["title"] == "Test PR 2"
 
+def test_search_prs_by_date_with_until_uses_range(monkeypatch):
+    from datetime import datetime
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    queries = []
+
+    class FakeSearchClient:
+        def __enter__(self): return self
+        def __exit__(self, *args): pass
+        def get(self, url, headers=None, params=None, timeout=None):
+            queries.append(params["q"])
+            return FakeResp(200, {"items": []})
+
+    monkeypatch.setattr(httpx, "Client", lambda timeout=30.0, **kwargs: FakeSearchClient())
+    gh.search_prs_by_date("org/repo", datetime(2025, 1, 10, tzinfo=timezone.utc),
+                          until=datetime(2025, 1, 13, 12, 0, tzinfo=timezone.utc))
+
+    assert "created:2025-01-10T00:00:00+00:00..2025-01-13T12:00:00+00:00" in queries[0]
+
+
+@pytest.fixture
+def local_tz(monkeypatch):
+    """Switch the process time zone for one test; naive datetimes follow it."""
+    def use(name):
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+    yield use
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_search_range_converts_local_times_to_utc(monkeypatch, local_tz):
+    """Naive local times are sent as UTC, so the window is not cut short west of UTC."""
+    local_tz("America/New_York")
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    queries = []
+
+    class FakeSearchClient:
+        def get(self, url, headers=None, params=None, timeout=None):
+            queries.append(params["q"])
+            return FakeResp(200, {"items": []})
+
+    monkeypatch.setattr(gh, "_client", FakeSearchClient)
+    gh.search_prs_by_date("org/repo", datetime(2025, 1, 10), until=datetime(2025, 1, 13, 12, 0))
+
+    # EST is UTC-5
+    assert "created:2025-01-10T05:00:00+00:00..2025-01-13T17:00:00+00:00" in queries[0]
+
 def test_search_prs_by_date_with_author(monkeypatch):
     from datetime import datetime
     gh = GitHubClient(base_url="https://api.github.com", token="t")
@@ -83,14 +343,14 @@ def test_search_prs_by_date_with_author(monkeypatch):
             pass
         def __enter__(self): return self
         def __exit__(self, *args): pass
-        def get(self, url, headers=None, params=None):
+        def get(self, url, headers=None, params=None, timeout=None):
             if "/search/issues" in url and params:
                 query = params.get("q", "")
                 assert "author:testuser" in query
                 return FakeResp(200, {"items": [{"number": 1, "title": "My PR"}]})
             return FakeResp(404, {})
 
-    monkeypatch.setattr(httpx, "Client", lambda timeout=30.0: FakeSearchClient())
+    monkeypatch.setattr(httpx, "Client", lambda timeout=30.0, **kwargs: FakeSearchClient())
     since = datetime(2025, 1, 10, 0, 0)
     results = gh.search_prs_by_date("org/repo", since, author="testuser")
 
@@ -101,17 +361,21 @@ def test_get_closed_prs(monkeypatch):
     from datetime import datetime
     gh = GitHubClient(base_url="https://api.github.com", token="t")
 
-    call_count = {"search": 0, "details": 0}
+    call_count = {"search": 0, "details": 0, "graphql": 0}
+    # Both searches run at once; each blocks until the other has started
+    both_searching = threading.Barrier(2, timeout=5)
 
     class FakeClosedPRClient:
         def __init__(self):
             pass
         def __enter__(self): return self
         def __exit__(self, *args): pass
-        def get(self, url, headers=None, params=None):
+        def get(self, url, headers=None, params=None, timeout=None):
             # Handle search API call - now expects 2 searches: merged and unmerged
             if "/search/issues" in url and params:
                 call_count["search"] += 1
+                if params["page"] == 1:
+                    both_searching.wait()
                 query = params.get("q", "")
                 # First search: merged PRs
                 if "is:merged" in query:
@@ -138,14 +402,112 @@ def test_get_closed_prs(monkeypatch):
                 elif "/pulls/2" in url:
                     return FakeResp(200, {"number": 2, "title": "Merged PR", "merged_at": "2025-01-11T10:00:00Z"})
             return FakeResp(404, {})
+        def post(self, url, headers=None, json=None):
+            # One batched GraphQL request per search page replaces the detail calls
+            assert url == "https://api.github.com/graphql"
+            call_count["graphql"] += 1
+            assert json["variables"] == {"o0": "org", "n0": "repo"}
+            merged = "p2: pullRequest(number: 2)" in json["query"]
+            number = 2 if merged else 1
+            return FakeResp(200, {"data": {"r0": {f"p{number}": {
+                "number": number,
+                "title": "Merged PR" if merged else "Closed PR",
+                "mergedAt": "2025-01-11T10:00:00Z" if merged else None,
+                "changedFiles": 3,
+            }}}})
 
-    monkeypatch.setattr(httpx, "Client", lambda timeout=30.0: FakeClosedPRClient())
+    monkeypatch.setattr(httpx, "Client", lambda timeout=30.0, **kwargs: FakeClosedPRClient())
     since = datetime(2025, 1, 10, 0, 0)
     results = gh.get_closed_prs("org/repo", since)
 
     assert len(results) == 2
     assert call_count["search"] == 2  # Now expects 2 searches (merged + unmerged)
-    assert call_count["details"] == 2  # Should fetch details for each PR
+    assert call_count["graphql"] == 2  # One batched details request per search
+    assert call_count["details"] == 0
+    assert results[0]["merged_at"] == "2025-01-11T10:00:00Z"
+    assert results[0]["changed_files"] == 3
+    assert results[1]["merged_at"] is None
+
+
+def test_get_closed_prs_falls_back_to_concurrent_rest_details(monkeypatch):
+    gh = GitHubClient(base_url="https://api.github.com", token="t")
+    items = [
+        {"number": n, "html_url": f"https://github.com/org/repo/pull/{n}"} for n in range(1, 4)
+    ]
+    # Every detail fetch waits until all three are in flight at once
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_search(self, c, url, params=None, **kwargs):
+        found = items if "is:merged" in params["q"] else []
+        return FakeResp(200, {"items": found})
+
+    def fake_details(self, repo, pr_number):
+        barrier.wait()
+        return {"number": pr_number, "repo": repo}
+
+    monkeypatch.setattr(GitHubClient, "_conditional_get", fake_search)
+    monkeypatch.setattr(GitHubClient, "get_pr_details", fake_details)
+    # GraphQL unavailable (e.g. an older GitHub Enterprise)
+    monkeypatch.setattr(GitHubClient, "get_pr_details_batch", lambda self, targets: None)
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FakeClient(None))
+    results = gh.get_closed_prs("org/repo", datetime(2025, 1, 10))
+
+    assert [pr["number"] for pr in results] == [1, 2, 3]
+
+
+REST_MERGED_PR = {
+    "number": 2,
+    "title": "Merged PR",
+    "html_url": "https://github.com/org/repo/pull/2",
+    "state": "closed",
+    "merged": True,
+    "merged_at": "2025-01-11T10:00:00Z",
+    "closed_at": "2025-01-11T10:00:00Z",
+    "created_at": "2025-01-09T08:00:00Z",
+    "updated_at": "2025-01-11T10:05:00Z",
+    "user": {"login": "dev", "id": 7},
+    "additions": 10,
+    "deletions": 4,
+    "changed_files": 3,
+    "body": "REST-only field",
+}
+GRAPHQL_MERGED_PR = {
+    "number": 2,
+    "title": "Merged PR",
+    "url": "https://github.com/org/repo/pull/2",
+    "state": "MERGED",
+    "merged": True,
+    "mergedAt": "2025-01-11T10:00:00Z",
+    "closedAt": "2025-01-11T10:00:00Z",
+    "createdAt": "2025-01-09T08:00:00Z",
+    "updatedAt": "2025-01-11T10:05:00Z",
+    "author": {"login": "dev"},
+    "additions": 10,
+    "deletions": 4,
+    "changedFiles": 3,
+}
+
+
+def test_get_closed_prs_graphql_and_rest_details_match(monkeypatch):
+    """Both detail paths return the same REST-shaped dict, merged PRs included."""
+    def fake_search(self, c, url, params=None, **kwargs):
+        found = [{"number": 2, "html_url": REST_MERGED_PR["html_url"]}] if "is:merged" in params["q"] else []
+        return FakeResp(200, {"items": found})
+
+    monkeypatch.setattr(GitHubClient, "_conditional_get", fake_search)
+    monkeypatch.setattr(GitHubClient, "get_pr_details", lambda self, repo, n: dict(REST_MERGED_PR))
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FakeClient(None))
+    since = datetime(2025, 1, 10)
+
+    monkeypatch.setattr(GitHubClient, "graphql", lambda self, q, v: {"r0": {"p2": GRAPHQL_MERGED_PR}})
+    via_graphql = GitHubClient(base_url="https://api.github.com", token="t").get_closed_prs("org/repo", since)
+    monkeypatch.setattr(GitHubClient, "graphql", lambda self, q, v: None)
+    via_rest = GitHubClient(base_url="https://api.github.com", token="t").get_closed_prs("org/repo", since)
+
+    assert via_graphql == via_rest
+    assert via_rest[0]["state"] == "closed"
+    assert via_rest[0]["user"] == {"login": "dev"}
+    assert "body" not in via_rest[0]
 
 
 def test_github_debug_logging_respects_pwm_debug(monkeypatch, capsys):
@@ -161,7 +523,7 @@ def test_github_debug_logging_respects_pwm_debug(monkeypatch, capsys):
         def get(self, *args, **kwargs):
             raise RuntimeError("boom")
 
-    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0: FailingClient())
+    monkeypatch.setattr(httpx, "Client", lambda timeout=10.0, **kwargs: FailingClient())
     monkeypatch.setenv("PWM_DEBUG", "1")
 
     assert gh.get_current_user() is None
@@ -1,252 +1,192 @@
 
-import httpx
-from unittest.mock import Mock, patch
 from pwm.github.client import GitHubClient
 
 
-def test_list_prs_success():
+def test_list_prs_success(fake_http):
     """Test listing pull requests."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = [
+    fake_http.respond(200, [
         {"number": 1, "title": "Test PR", "state": "open"},
         {"number": 2, "title": "Another PR", "state": "open"}
-    ]
+    ])
 
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+    prs = client.list_prs("owner/repo", state="open")
 
-        prs = client.list_prs("owner/repo", state="open")
+    assert len(prs) == 2
+    assert prs[0]["number"] == 1
+    assert prs[1]["title"] == "Another PR"
 
-        assert len(prs) == 2
-        assert prs[0]["number"] == 1
-        assert prs[1]["title"] == "Another PR"
 
-
-def test_list_prs_with_head_filter():
+def test_list_prs_with_head_filter(fake_http):
     """Test listing PRs filtered by head branch."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = [
+    fake_http.respond(200, [
         {"number": 1, "title": "Test PR", "head": {"ref": "feature-branch"}}
-    ]
-
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+    ])
 
-        prs = client.list_prs("owner/repo", head="owner:feature-branch")
+    prs = client.list_prs("owner/repo", head="owner:feature-branch")
 
-        assert len(prs) == 1
-        assert prs[0]["number"] == 1
+    assert len(prs) == 1
+    assert prs[0]["number"] == 1
 
 
-def test_create_pr_success():
+def test_create_pr_success(fake_http):
     """Test creating a pull request."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 201
-    mock_response.json.return_value = {
+    fake_http.respond(201, {
         "number": 42,
         "html_url": "https://github.com/owner/repo/pull/42",
         "title": "Test PR"
-    }
-
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+    })
 
-        pr = client.create_pr(
-            repo="owner/repo",
-            title="Test PR",
-            head="feature-branch",
-            base="main",
-            body="Test description"
-        )
+    pr = client.create_pr(
+        repo="owner/repo",
+        title="Test PR",
+        head="feature-branch",
+        base="main",
+        body="Test description"
+    )
 
-        assert pr is not None
-        assert pr["number"] == 42
-        assert pr["html_url"] == "https://github.com/owner/repo/pull/42"
+    assert pr is not None
+    assert pr["number"] == 42
+    assert pr["html_url"] == "https://github.com/owner/repo/pull/42"
 
 
-def test_create_pr_failure():
+def test_create_pr_failure(fake_http):
     """Test PR creation failure."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 422  # Unprocessable Entity
+    fake_http.respond(422)
 
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+    pr = client.create_pr(
+        repo="owner/repo",
+        title="Test PR",
+        head="feature-branch",
+        base="main"
+    )
 
-        pr = client.create_pr(
-            repo="owner/repo",
-            title="Test PR",
-            head="feature-branch",
-            base="main"
-        )
+    assert pr is None
 
-        assert pr is None
 
-
-def test_get_pr_for_branch_exists():
+def test_get_pr_for_branch_exists(fake_http):
     """Test getting PR for a specific branch when it exists."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = [
+    fake_http.respond(200, [
         {"number": 1, "title": "Test PR", "head": {"ref": "feature-branch"}}
-    ]
-
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+    ])
 
-        pr = client.get_pr_for_branch("owner/repo", "feature-branch")
+    pr = client.get_pr_for_branch("owner/repo", "feature-branch")
 
-        assert pr is not None
-        assert pr["number"] == 1
+    assert pr is not None
+    assert pr["number"] == 1
 
 
-def test_get_pr_for_branch_not_exists():
+def test_get_pr_for_branch_not_exists(fake_http):
     """Test getting PR for a branch when none exists."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = []
-
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+    fake_http.respond(200, [])
 
-        pr = client.get_pr_for_branch("owner/repo", "feature-branch")
+    pr = client.get_pr_for_branch("owner/repo", "feature-branch")
 
-        assert pr is None
+    assert pr is None
 
 
-def test_get_pr_for_branch_all_states():
+def test_get_pr_for_branch_all_states(fake_http):
     """Test getting PR for a branch including closed PRs."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = [
+    fake_http.respond(200, [
         {"number": 42, "title": "Test PR", "state": "closed", "head": {"ref": "feature-branch"}}
-    ]
+    ])
 
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+    pr = client.get_pr_for_branch("owner/repo", "feature-branch", state="all")
 
-        pr = client.get_pr_for_branch("owner/repo", "feature-branch", state="all")
+    assert pr is not None
+    assert pr["number"] == 42
+    assert pr["state"] == "closed"
 
-        assert pr is not None
-        assert pr["number"] == 42
-        assert pr["state"] == "closed"
 
-
-def test_get_pr_for_branch_defaults_to_open():
+def test_get_pr_for_branch_defaults_to_open(fake_http):
     """Test that get_pr_for_branch defaults to open PRs only."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = [
+    fake_http.respond(200, [
         {"number": 1, "title": "Open PR", "state": "open"}
-    ]
-
-    with patch("httpx.Client") as mock_client:
-        mock_instance = mock_client.return_value.__enter__.return_value
-        mock_instance.get.return_value = mock_response
+    ])
 
-        # Call without state parameter (should default to "open")
-        pr = client.get_pr_for_branch("owner/repo", "feature-branch")
+    # Call without state parameter (should default to "open")
+    pr = client.get_pr_for_branch("owner/repo", "feature-branch")
 
-        assert pr is not None
-        # Verify the API was called with state="open"
-        call_args = mock_instance.get.call_args
-        assert call_args[1]["params"]["state"] == "open"
+    assert pr is not None
+    # Verify the API was called with state="open"
+    method, url, kwargs = fake_http.calls[-1]
+    assert kwargs["params"]["state"] == "open"
 
 
-def test_get_pr_details():
+def test_get_pr_details(fake_http):
     """Test getting detailed PR information."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
+    fake_http.respond(200, {
         "number": 42,
         "title": "Test PR",
         "changed_files": 3,
         "additions": 150,
         "deletions": 25
-    }
-
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+    })
 
-        details = client.get_pr_details("owner/repo", 42)
+    details = client.get_pr_details("owner/repo", 42)
 
-        assert details is not None
-        assert details["number"] == 42
-        assert details["changed_files"] == 3
-        assert details["additions"] == 150
-        assert details["deletions"] == 25
+    assert details is not None
+    assert details["number"] == 42
+    assert details["changed_files"] == 3
+    assert details["additions"] == 150
+    assert details["deletions"] == 25
 
 
-def test_get_pr_reviews():
+def test_get_pr_reviews(fake_http):
     """Test getting PR reviews."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = [
+    fake_http.respond(200, [
         {"user": {"login": "reviewer1"}, "state": "APPROVED"},
         {"user": {"login": "reviewer2"}, "state": "COMMENTED"}
-    ]
+    ])
 
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+    reviews = client.get_pr_reviews("owner/repo", 42)
 
-        reviews = client.get_pr_reviews("owner/repo", 42)
+    assert len(reviews) == 2
+    assert reviews[0]["user"]["login"] == "reviewer1"
+    assert reviews[0]["state"] == "APPROVED"
+    assert reviews[1]["user"]["login"] == "reviewer2"
+    assert reviews[1]["state"] == "COMMENTED"
 
-        assert len(reviews) == 2
-        assert reviews[0]["user"]["login"] == "reviewer1"
-        assert reviews[0]["state"] == "APPROVED"
-        assert reviews[1]["user"]["login"] == "reviewer2"
-        assert reviews[1]["state"] == "COMMENTED"
 
-
-def test_add_issue_labels_success():
+def test_add_issue_labels_success(fake_http):
     """Test adding labels to PR/issue succeeds."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-
-    with patch("httpx.Client") as mock_client:
-        mock_instance = mock_client.return_value.__enter__.return_value
-        mock_instance.post.return_value = mock_response
+    fake_http.respond(200)
 
-        ok = client.add_issue_labels("owner/repo", 42, ["bug", "ai-assisted"])
+    ok = client.add_issue_labels("owner/repo", 42, ["bug", "ai-assisted"])
 
-        assert ok is True
-        call_args = mock_instance.post.call_args
-        assert call_args[1]["json"] == {"labels": ["bug", "ai-assisted"]}
+    assert ok is True
+    method, url, kwargs = fake_http.calls[-1]
+    assert method == "post"
+    assert kwargs["json"] == {"labels": ["bug", "ai-assisted"]}
 
 
-def test_add_issue_labels_failure():
+def test_add_issue_labels_failure(fake_http):
     """Test adding labels to PR/issue handles API failure."""
     client = GitHubClient(base_url="https://api.github.com", token="test-token")
 
-    mock_response = Mock()
-    mock_response.status_code = 422
-
-    with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+    fake_http.respond(422)
 
-        ok = client.add_issue_labels("owner/repo", 42, ["bug"])
+    ok = client.add_issue_labels("owner/repo", 42, ["bug"])
 
-        assert ok is False
+    assert ok is False
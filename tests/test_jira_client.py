@@ -1,18 +1,61 @@
+from datetime import datetime
+import os
+import time
+from types import MappingProxyType
+
+import pytest
+
+import pwm.jira.client as jira_client_module
 from pwm.jira.client import JiraClient
 
 
+@pytest.fixture(autouse=True)
+def isolated_createmeta_cache(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "jira-meta"
+    monkeypatch.setattr(jira_client_module, "CREATEMETA_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(jira_client_module, "_summary_cache", {})
+    return cache_dir
+
+
+@pytest.fixture
+def jc():
+    return JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
+
+
+@pytest.fixture
+def use_client(monkeypatch):
+    """Route every JiraClient request through the given fake client."""
+    def install(fake):
+        monkeypatch.setattr(JiraClient, "_client", lambda self: fake)
+    return install
+
+
+# Shared read-only body for responses built without one
+EMPTY_JSON = MappingProxyType({})
+
+
 class FakeResp:
     def __init__(self, status_code, json_data=None):
         self.status_code = status_code
-        self._json = json_data or {}
+        self._json = EMPTY_JSON if json_data is None else json_data
 
     def json(self):
         return self._json
 
 
 class FakeClient:
-    def __init__(self, routes):
+    """Serves GETs by URL suffix and records every request.
+
+    POSTs get post_resp when given, otherwise the route for their URL.
+    """
+
+    def __init__(self, routes, post_resp=None):
         self.routes = routes
+        self.post_resp = post_resp
+        self.gets = []
+        self.posts = []
+        # Longest suffix first, so the most specific route wins
+        self._suffix_lens = sorted({len(suffix) for suffix in routes}, reverse=True)
 
     def __enter__(self):
         return self
@@ -20,56 +63,173 @@ class FakeClient:
     def __exit__(self, *args):
         pass
 
-    def get(self, url):
-        for suffix, resp in self.routes.items():
-            if url.endswith(suffix):
+    def get(self, url, params=None):
+        self.gets.append((url, params))
+        for length in self._suffix_lens:
+            resp = self.routes.get(url[-length:])
+            if resp is not None:
                 return resp
         return FakeResp(404, {})
 
     def post(self, url, json=None):
+        self.posts.append((url, json))
+        if self.post_resp is not None:
+            return self.post_resp
         return self.get(url)
 
 
-def test_ping_ok(monkeypatch):
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
+class FailingClient:
+    """Raises on every request, like a dropped network connection."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def get(self, *args, **kwargs):
+        raise RuntimeError("boom")
+
+    def post(self, *args, **kwargs):
+        raise RuntimeError("boom")
+
+    def put(self, *args, **kwargs):
+        raise RuntimeError("boom")
+
+
+def search_issue(key, summary, status, created, updated, assignee="123"):
+    """Build a raw /search issue; timestamps are given without seconds."""
+    return {
+        "key": key,
+        "fields": {
+            "summary": summary,
+            "status": {"name": status},
+            "created": f"{created}:00.000+0000",
+            "updated": f"{updated}:00.000+0000",
+            "assignee": {"accountId": assignee} if assignee else None,
+        },
+    }
+
+
+# Built once at import; the client copies fields out and never mutates these
+ABC_SEARCH_ISSUES = (
+    search_issue("ABC-1", "Issue 1", "In Progress", "2025-01-10T09:00", "2025-01-11T10:00"),
+    search_issue("ABC-2", "Issue 2", "Done", "2025-01-10T10:00", "2025-01-11T11:00", assignee=None),
+)
+
+
+class FakeSearchClient:
+    """Answers /search with the given issues once every JQL part is present."""
+
+    def __init__(self, jql_parts, issues):
+        self.jql_parts = jql_parts
+        self.issues = issues
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def get(self, url, params=None):
+        if "/rest/api/3/search" in url and params:
+            jql = params.get("jql", "")
+            missing = [part for part in self.jql_parts if part not in jql]
+            assert not missing, f"JQL {jql!r} lacks {missing}"
+            return FakeResp(200, {"issues": list(self.issues)})
+        return FakeResp(404, {})
+
+
+def test_ping_ok(jc, use_client):
     routes = {"/rest/api/3/myself": FakeResp(200, {"displayName": "User"})}
-    monkeypatch.setattr(JiraClient, "_client", lambda self: FakeClient(routes))
+    use_client(FakeClient(routes))
     ok, msg = jc.ping()
     assert ok is True
     assert "ok" in msg
 
 
-def test_get_issue_summary(monkeypatch):
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
+def test_from_config_reuses_client_for_same_credentials():
+    cfg = {"jira": {"base_url": "https://example.atlassian.net/", "email": "u", "token": "t"}}
+    jc = JiraClient.from_config(cfg)
+    assert JiraClient.from_config(cfg) is jc
+    assert jc.base_url == "https://example.atlassian.net"
+
+    other = {"jira": dict(cfg["jira"], token="t2")}
+    assert JiraClient.from_config(other) is not jc
+    assert JiraClient.from_config({"jira": {}}) is None
+
+
+def test_get_issue_summary(jc, use_client):
     routes = {
         "/rest/api/3/issue/ABC-1": FakeResp(
             200, {"fields": {"summary": "Do the thing"}}
         )
     }
-    monkeypatch.setattr(JiraClient, "_client", lambda self: FakeClient(routes))
+    use_client(FakeClient(routes))
     assert jc.get_issue_summary("ABC-1") == "Do the thing"
 
 
-def test_add_comment_with_link(monkeypatch):
-    """Test that add_comment_with_link creates proper ADF structure with clickable links."""
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
+def test_get_issue_summary_is_cached_across_clients(monkeypatch):
+    calls = []
+
+    def fake_get_issue(self, key):
+        calls.append(key)
+        return {"fields": {"summary": "Do the thing"}}
 
-    # Capture the actual payload sent
-    captured_payload = None
+    monkeypatch.setattr(JiraClient, "get_issue", fake_get_issue)
+    for _ in range(2):
+        jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
+        assert jc.get_issue_summary("ABC-1") == "Do the thing"
+    assert calls == ["ABC-1"]
 
-    class CaptureClient:
-        def __enter__(self):
-            return self
+    other = JiraClient(base_url="https://other.atlassian.net", email="u", token="t")
+    other.get_issue_summary("ABC-1")
+    assert calls == ["ABC-1", "ABC-1"]
 
-        def __exit__(self, *args):
-            pass
 
-        def post(self, url, json=None):
-            nonlocal captured_payload
-            captured_payload = json
-            return FakeResp(201, {"id": "12345"})
+def test_get_createmeta_bundle_fetches_once_and_feeds_metadata(jc, use_client):
+    fake = FakeClient({"/rest/api/3/issue/createmeta": FakeResp(200, {"projects": [{"issuetypes": [
+        {"id": "1", "name": "Story", "fields": {"summary": {"required": True}}},
+        {"id": "2", "name": "Bug", "fields": {}},
+    ]}]})})
+    use_client(fake)
 
-    monkeypatch.setattr(JiraClient, "_client", lambda self: CaptureClient())
+    bundle = jc.get_createmeta_bundle("ABC")
+    assert list(bundle) == ["Story", "Bug"]
+    assert bundle["Story"]["id"] == "1"
+    assert jc.get_createmeta_bundle("ABC") is bundle
+    assert jc.get_create_metadata("ABC", "Story") == {"summary": {"required": True}}
+    assert len(fake.gets) == 1
+    assert fake.gets[0][1]["expand"] == "projects.issuetypes.fields"
+
+
+def test_createmeta_bundle_is_reused_from_disk_until_expired(use_client, isolated_createmeta_cache):
+    fake = FakeClient({"/rest/api/3/issue/createmeta": FakeResp(200, {"projects": [{"issuetypes": [
+        {"id": "1", "name": "Story", "fields": {"summary": {"required": True}}},
+    ]}]})})
+    use_client(fake)
+    JiraClient(base_url="https://example.atlassian.net", email="u", token="t").get_createmeta_bundle("ABC")
+
+    # A new client (next CLI run) reads the disk cache without a request
+    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
+    assert jc.get_issue_types("ABC") == [{"id": "1", "name": "Story", "description": ""}]
+    assert jc.get_create_metadata("ABC", "Story") == {"summary": {"required": True}}
+    assert len(fake.gets) == 1
+
+    cache_file = isolated_createmeta_cache / "example.atlassian.net-ABC.json"
+    stale = time.time() - jira_client_module.CREATEMETA_CACHE_TTL - 1
+    os.utime(cache_file, (stale, stale))
+    JiraClient(base_url="https://example.atlassian.net", email="u", token="t").get_createmeta_bundle("ABC")
+    assert len(fake.gets) == 2
+
+    jc.invalidate_createmeta("ABC")
+    assert not cache_file.exists()
+
+
+def test_add_comment_with_link(jc, use_client):
+    """Test that add_comment_with_link creates proper ADF structure with clickable links."""
+    fake = FakeClient({}, post_resp=FakeResp(201, {"id": "12345"}))
+    use_client(fake)
 
     result = jc.add_comment_with_link(
         "ABC-1",
@@ -79,10 +239,10 @@ def test_add_comment_with_link(monkeypatch):
     )
 
     assert result is True
-    assert captured_payload is not None
+    assert len(fake.posts) == 1
 
-    # Validate ADF structure
-    body = captured_payload["body"]
+    # Validate ADF structure of the payload actually sent
+    body = fake.posts[0][1]["body"]
     assert body["type"] == "doc"
     assert body["version"] == 1
     assert len(body["content"]) == 2  # Two paragraphs
@@ -106,50 +266,8 @@ def test_add_comment_with_link(monkeypatch):
     assert marks[0]["attrs"]["href"] == "https://github.com/org/repo/pull/42"
 
 
-def test_search_issues_by_date(monkeypatch):
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
-
-    class FakeSearchClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
-        def get(self, url, params=None):
-            if "/rest/api/3/search" in url and params:
-                jql = params.get("jql", "")
-                assert "project = ABC" in jql
-                return FakeResp(
-                    200,
-                    {
-                        "issues": [
-                            {
-                                "key": "ABC-1",
-                                "fields": {
-                                    "summary": "Issue 1",
-                                    "status": {"name": "In Progress"},
-                                    "created": "2025-01-10T09:00:00.000+0000",
-                                    "updated": "2025-01-11T10:00:00.000+0000",
-                                    "assignee": {"accountId": "123"},
-                                },
-                            },
-                            {
-                                "key": "ABC-2",
-                                "fields": {
-                                    "summary": "Issue 2",
-                                    "status": {"name": "Done"},
-                                    "created": "2025-01-10T10:00:00.000+0000",
-                                    "updated": "2025-01-11T11:00:00.000+0000",
-                                    "assignee": None,
-                                },
-                            },
-                        ]
-                    },
-                )
-            return FakeResp(404, {})
-
-    monkeypatch.setattr(JiraClient, "_client", lambda self: FakeSearchClient())
+def test_search_issues_by_date(jc, use_client):
+    use_client(FakeSearchClient(["project = ABC"], ABC_SEARCH_ISSUES))
     results = jc.search_issues_by_date('project = ABC AND created >= "2025-01-10"')
 
     assert len(results) == 2
@@ -160,124 +278,36 @@ def test_search_issues_by_date(monkeypatch):
     assert results[1]["summary"] == "Issue 2"
 
 
-def test_get_issues_created_since(monkeypatch):
-    from datetime import datetime
-
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
-
-    class FakeSearchClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
-        def get(self, url, params=None):
-            if "/rest/api/3/search" in url and params:
-                jql = params.get("jql", "")
-                assert "project = ABC" in jql
-                assert "created >=" in jql
-                assert "assignee = currentUser()" in jql
-                return FakeResp(
-                    200,
-                    {
-                        "issues": [
-                            {
-                                "key": "ABC-1",
-                                "fields": {
-                                    "summary": "New issue",
-                                    "status": {"name": "To Do"},
-                                    "created": "2025-01-11T09:00:00.000+0000",
-                                    "updated": "2025-01-11T09:00:00.000+0000",
-                                    "assignee": {"accountId": "123"},
-                                },
-                            }
-                        ]
-                    },
-                )
-            return FakeResp(404, {})
-
-    monkeypatch.setattr(JiraClient, "_client", lambda self: FakeSearchClient())
-    since = datetime(2025, 1, 10, 0, 0)
-    results = jc.get_issues_created_since("ABC", since)
+@pytest.mark.parametrize("method,jql_parts,issue", [
+    (
+        "get_issues_created_since",
+        ["project = ABC", "created >=", "assignee = currentUser()"],
+        search_issue("ABC-1", "New issue", "To Do", "2025-01-11T09:00", "2025-01-11T09:00"),
+    ),
+    (
+        "get_issues_updated_since",
+        # Updated issues exclude ones created in the window
+        ["project = ABC", "updated >=", "created <", "assignee = currentUser()"],
+        search_issue("ABC-5", "Updated issue", "In Review", "2025-01-05T09:00", "2025-01-11T14:00"),
+    ),
+])
+def test_get_issues_since(jc, use_client, method, jql_parts, issue):
+    use_client(FakeSearchClient(jql_parts, [issue]))
+    results = getattr(jc, method)("ABC", datetime(2025, 1, 10, 0, 0))
 
     assert len(results) == 1
-    assert results[0]["key"] == "ABC-1"
-    assert results[0]["summary"] == "New issue"
-
+    assert results[0]["key"] == issue["key"]
+    assert results[0]["summary"] == issue["fields"]["summary"]
+    assert results[0]["status"]["name"] == issue["fields"]["status"]["name"]
 
-def test_get_issues_updated_since(monkeypatch):
-    from datetime import datetime
 
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
-
-    class FakeSearchClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
-        def get(self, url, params=None):
-            if "/rest/api/3/search" in url and params:
-                jql = params.get("jql", "")
-                assert "project = ABC" in jql
-                assert "updated >=" in jql
-                assert "created <" in jql  # Should exclude newly created
-                assert "assignee = currentUser()" in jql
-                return FakeResp(
-                    200,
-                    {
-                        "issues": [
-                            {
-                                "key": "ABC-5",
-                                "fields": {
-                                    "summary": "Updated issue",
-                                    "status": {"name": "In Review"},
-                                    "created": "2025-01-05T09:00:00.000+0000",
-                                    "updated": "2025-01-11T14:00:00.000+0000",
-                                    "assignee": {"accountId": "123"},
-                                },
-                            }
-                        ]
-                    },
-                )
-            return FakeResp(404, {})
-
-    monkeypatch.setattr(JiraClient, "_client", lambda self: FakeSearchClient())
-    since = datetime(2025, 1, 10, 0, 0)
-    results = jc.get_issues_updated_since("ABC", since)
-
-    assert len(results) == 1
-    assert results[0]["key"] == "ABC-5"
-    assert results[0]["summary"] == "Updated issue"
-    assert results[0]["status"]["name"] == "In Review"
-
-
-def test_network_errors_gracefully_degrade(monkeypatch):
+def test_network_errors_gracefully_degrade(jc, use_client):
     """Network errors should not crash Jira client helper methods."""
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
-
-    class FailingClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
-        def get(self, *args, **kwargs):
-            raise RuntimeError("boom")
-
-        def post(self, *args, **kwargs):
-            raise RuntimeError("boom")
-
-        def put(self, *args, **kwargs):
-            raise RuntimeError("boom")
-
-    monkeypatch.setattr(JiraClient, "_client", lambda self: FailingClient())
+    use_client(FailingClient())
 
     assert jc.get_issue("ABC-1") is None
     assert jc.get_issue_types("ABC") == []
+    assert jc.get_createmeta_bundle("ABC") == {}
     assert jc.get_create_metadata("ABC", "Story") == {}
     assert jc.transition_by_name("ABC-1", "In Progress") is False
     assert jc.assign_issue("ABC-1", "account-id") is False
@@ -285,32 +315,12 @@ def test_network_errors_gracefully_degrade(monkeypatch):
     assert jc.add_comment_with_link("ABC-1", "hello", "PR", "https://example") is False
 
 
-def test_create_issue_debug_output_is_sanitized(monkeypatch, capsys):
+def test_create_issue_debug_output_is_sanitized(jc, use_client, capsys):
     """Debug logging should avoid printing raw API response body."""
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
-
-    class ErrorResp:
-        status_code = 400
-
-        def json(self):
-            return {}
-
-    class ErrorClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
-        def get(self, url):
-            if url.endswith("/rest/api/3/myself"):
-                return FakeResp(200, {"accountId": "abc"})
-            return FakeResp(404, {})
-
-        def post(self, url, json=None):
-            return ErrorResp()
-
-    monkeypatch.setattr(JiraClient, "_client", lambda self: ErrorClient())
+    use_client(FakeClient(
+        {"/rest/api/3/myself": FakeResp(200, {"accountId": "abc"})},
+        post_resp=FakeResp(400, {}),
+    ))
 
     assert jc.create_issue(project_key="ABC", summary="Test") is None
     captured = capsys.readouterr()
@@ -318,20 +328,8 @@ def test_create_issue_debug_output_is_sanitized(monkeypatch, capsys):
     assert "{" not in captured.err
 
 
-def test_jira_debug_logging_respects_pwm_debug(monkeypatch, capsys):
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
-
-    class FailingClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
-        def get(self, *args, **kwargs):
-            raise RuntimeError("boom")
-
-    monkeypatch.setattr(JiraClient, "_client", lambda self: FailingClient())
+def test_jira_debug_logging_respects_pwm_debug(monkeypatch, jc, use_client, capsys):
+    use_client(FailingClient())
     monkeypatch.setenv("PWM_DEBUG", "1")
 
     assert jc.get_issue("ABC-1") is None
@@ -339,48 +337,33 @@ def test_jira_debug_logging_respects_pwm_debug(monkeypatch, capsys):
     assert "[DEBUG] JiraClient: get_issue ABC-1 request raised exception" in captured.err
 
 
-def test_create_issue_uses_parent_field_when_available(monkeypatch):
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
-    captured_payload = {}
-
-    class CaptureClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
-        def get(self, url, params=None):
-            if url.endswith("/rest/api/3/myself"):
-                return FakeResp(200, {"accountId": "acct-1"})
-            if url.endswith("/rest/api/3/issue/createmeta"):
-                return FakeResp(
-                    200,
-                    {
-                        "projects": [
-                            {
-                                "issuetypes": [
-                                    {
-                                        "fields": {
-                                            "parent": {
-                                                "name": "Parent",
-                                                "schema": {"type": "issuelink"},
-                                            }
+def test_create_issue_uses_parent_field_when_available(jc, use_client):
+    fake = FakeClient(
+        {
+            "/rest/api/3/myself": FakeResp(200, {"accountId": "acct-1"}),
+            "/rest/api/3/issue/createmeta": FakeResp(
+                200,
+                {
+                    "projects": [
+                        {
+                            "issuetypes": [
+                                {
+                                    "fields": {
+                                        "parent": {
+                                            "name": "Parent",
+                                            "schema": {"type": "issuelink"},
                                         }
                                     }
-                                ]
-                            }
-                        ]
-                    },
-                )
-            return FakeResp(404, {})
-
-        def post(self, url, json=None):
-            nonlocal captured_payload
-            captured_payload = json
-            return FakeResp(201, {"key": "ABC-12"})
-
-    monkeypatch.setattr(JiraClient, "_client", lambda self: CaptureClient())
+                                }
+                            ]
+                        }
+                    ]
+                },
+            ),
+        },
+        post_resp=FakeResp(201, {"key": "ABC-12"}),
+    )
+    use_client(fake)
 
     issue_key = jc.create_issue(
         project_key="ABC",
@@ -390,54 +373,39 @@ def test_create_issue_uses_parent_field_when_available(monkeypatch):
     )
 
     assert issue_key == "ABC-12"
-    assert captured_payload["fields"]["parent"] == {"key": "ABC-1"}
-
-
-def test_create_issue_uses_epic_link_custom_field(monkeypatch):
-    jc = JiraClient(base_url="https://example.atlassian.net", email="u", token="t")
-    captured_payload = {}
-
-    class CaptureClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
-        def get(self, url, params=None):
-            if url.endswith("/rest/api/3/myself"):
-                return FakeResp(200, {"accountId": "acct-1"})
-            if url.endswith("/rest/api/3/issue/createmeta"):
-                return FakeResp(
-                    200,
-                    {
-                        "projects": [
-                            {
-                                "issuetypes": [
-                                    {
-                                        "fields": {
-                                            "customfield_12345": {
-                                                "name": "Epic Link",
-                                                "schema": {
-                                                    "type": "any",
-                                                    "custom": "com.pyxis.greenhopper.jira:gh-epic-link",
-                                                },
-                                            }
+    assert fake.posts[-1][1]["fields"]["parent"] == {"key": "ABC-1"}
+
+
+def test_create_issue_uses_epic_link_custom_field(jc, use_client):
+    fake = FakeClient(
+        {
+            "/rest/api/3/myself": FakeResp(200, {"accountId": "acct-1"}),
+            "/rest/api/3/issue/createmeta": FakeResp(
+                200,
+                {
+                    "projects": [
+                        {
+                            "issuetypes": [
+                                {
+                                    "fields": {
+                                        "customfield_12345": {
+                                            "name": "Epic Link",
+                                            "schema": {
+                                                "type": "any",
+                                                "custom": "com.pyxis.greenhopper.jira:gh-epic-link",
+                                            },
                                         }
                                     }
-                                ]
-                            }
-                        ]
-                    },
-                )
-            return FakeResp(404, {})
-
-        def post(self, url, json=None):
-            nonlocal captured_payload
-            captured_payload = json
-            return FakeResp(201, {"key": "ABC-15"})
-
-    monkeypatch.setattr(JiraClient, "_client", lambda self: CaptureClient())
+                                }
+                            ]
+                        }
+                    ]
+                },
+            ),
+        },
+        post_resp=FakeResp(201, {"key": "ABC-15"}),
+    )
+    use_client(fake)
 
     issue_key = jc.create_issue(
         project_key="ABC",
@@ -447,4 +415,4 @@ def test_create_issue_uses_epic_link_custom_field(monkeypatch):
     )
 
     assert issue_key == "ABC-15"
-    assert captured_payload["fields"]["customfield_12345"] == "ABC-1"
+    assert fake.posts[-1][1]["fields"]["customfield_12345"] == "ABC-1"
@@ -40,6 +40,12 @@ def test_openai_client_from_config_with_full_config():
     assert client.max_tokens == 1000
     assert client.temperature == 0.5
 
+def test_openai_client_from_config_reuses_client_for_same_settings():
+    config = {"openai": {"api_key": "sk-test123"}}
+    client = OpenAIClient.from_config(config)
+    assert OpenAIClient.from_config({"openai": {"api_key": "sk-test123"}}) is client
+    assert OpenAIClient.from_config({"openai": {"api_key": "sk-test123", "model": "gpt-4o"}}) is not client
+
 def test_openai_client_headers():
     """Test that headers are correctly formatted."""
     config = {"openai": {"api_key": "sk-test123"}}
@@ -0,0 +1,48 @@
+import threading
+
+from pwm.shared_http import SharedHTTPClient
+
+
+class FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_opens_client_once_across_threads():
+    shared = SharedHTTPClient()
+    opened = []
+    start = threading.Barrier(4, timeout=5)
+
+    def open_client():
+        opened.append(FakeClient())
+        return opened[-1]
+
+    def worker(results):
+        start.wait()
+        results.append(shared.get(open_client))
+
+    results = []
+    threads = [threading.Thread(target=worker, args=(results,)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(opened) == 1
+    assert all(client is opened[0] for client in results)
+
+
+def test_close_closes_and_reopens_on_next_use():
+    shared = SharedHTTPClient()
+    first = shared.get(FakeClient)
+
+    shared.close()
+    shared.close()  # closing twice is harmless
+
+    assert first.closed
+    second = shared.get(FakeClient)
+    assert second is not first
+    assert not second.closed
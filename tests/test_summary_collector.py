@@ -1,48 +1,95 @@
 """Tests for work summary data collection."""
 
 from datetime import datetime, timedelta
-from unittest.mock import Mock
 
 import pytest
 
-from pwm.summary.collector import collect_work_data, WorkSummaryData
+from pwm.summary.collector import collect_work_data, JiraRow, PRRow, WorkSummaryData
+
+
+# Report window shared by the collector tests; datetimes are immutable
+SINCE = datetime(2025, 1, 10, 0, 0)
+END_TIME = datetime(2025, 1, 13, 12, 0)
+
+
+def assert_window(result, since):
+    """Check the summary shape and report window shared by every collector result."""
+    assert isinstance(result, WorkSummaryData)
+    assert result.start_time == since
+    assert isinstance(result.end_time, datetime)
+    return result
+
+
+def call(*args, **kwargs):
+    """Shape one recorded call the way RecordingFake.called() reports it."""
+    return (args, kwargs)
+
+
+class RecordingFake:
+    """Returns canned results per method and records every call made."""
+
+    def __init__(self, **results):
+        self.results = results
+        self.calls = []
+
+    def _record(self, name, *args, **kwargs):
+        self.calls.append((name, args, kwargs))
+        return self.results[name]
+
+    def called(self, name):
+        return [(args, kwargs) for called_name, args, kwargs in self.calls if called_name == name]
+
+
+class FakeGitHub(RecordingFake):
+    def get_current_user(self):
+        return self._record("get_current_user")
+
+    def search_prs_by_date(self, *args, **kwargs):
+        return self._record("search_prs_by_date", *args, **kwargs)
+
+    def get_closed_prs(self, *args, **kwargs):
+        return self._record("get_closed_prs", *args, **kwargs)
+
+
+class FakeJira(RecordingFake):
+    def get_issues_created_since(self, *args, **kwargs):
+        return self._record("get_issues_created_since", *args, **kwargs)
+
+    def get_issues_updated_since(self, *args, **kwargs):
+        return self._record("get_issues_updated_since", *args, **kwargs)
 
 
 @pytest.fixture
-def mock_github_client():
-    """Create a mock GitHub client."""
-    client = Mock()
-    client.get_current_user.return_value = "testuser"
-    client.search_prs_by_date.return_value = [
-        {"number": 1, "title": "PR 1", "state": "open"},
-        {"number": 2, "title": "PR 2", "state": "open"}
-    ]
-    client.get_closed_prs.return_value = [
-        {"number": 3, "title": "Closed PR", "merged_at": None},
-        {"number": 4, "title": "Merged PR", "merged_at": "2025-01-11T10:00:00Z"}
-    ]
-    return client
+def github_client():
+    """Create a fake GitHub client."""
+    return FakeGitHub(
+        get_current_user="testuser",
+        search_prs_by_date=[
+            {"number": 1, "title": "PR 1", "state": "open"},
+            {"number": 2, "title": "PR 2", "state": "open"}
+        ],
+        get_closed_prs=[
+            {"number": 3, "title": "Closed PR", "merged_at": None},
+            {"number": 4, "title": "Merged PR", "merged_at": "2025-01-11T10:00:00Z"}
+        ],
+    )
 
 
 @pytest.fixture
-def mock_jira_client():
-    """Create a mock Jira client."""
-    client = Mock()
-    client.get_issues_created_since.return_value = [
-        {"key": "ABC-1", "summary": "New issue"}
-    ]
-    client.get_issues_updated_since.return_value = [
-        {"key": "ABC-5", "summary": "Updated issue"}
-    ]
-    return client
+def jira_client():
+    """Create a fake Jira client."""
+    return FakeJira(
+        get_issues_created_since=[{"key": "ABC-1", "summary": "New issue"}],
+        get_issues_updated_since=[{"key": "ABC-5", "summary": "Updated issue"}],
+    )
 
 
 class TestCollectWorkData:
     """Tests for collect_work_data function."""
 
-    def test_collects_github_and_jira_data(self, mock_github_client, mock_jira_client):
+    def test_collects_github_and_jira_data(self, github_client, jira_client):
         """Should collect data from both GitHub and Jira."""
-        since = datetime(2025, 1, 10, 0, 0)
+        since = SINCE
         config = {
             "daily_summary": {
                 "include_own_prs_only": True,
@@ -54,23 +101,22 @@ class TestCollectWorkData:
             github_repo="org/repo",
             jira_project="ABC",
             since=since,
-            github_client=mock_github_client,
-            jira_client=mock_jira_client,
+            github_client=github_client,
+            jira_client=jira_client,
             config=config
         )
 
-        assert isinstance(result, WorkSummaryData)
+        assert_window(result, since)
         assert len(result.prs_opened) == 2
         assert len(result.prs_closed) == 1
         assert len(result.prs_merged) == 1
         assert len(result.jira_created) == 1
         assert len(result.jira_updated) == 1
-        assert result.start_time == since
-        assert isinstance(result.end_time, datetime)
 
-    def test_filters_by_current_user_when_configured(self, mock_github_client, mock_jira_client):
+    def test_filters_by_current_user_when_configured(self, github_client, jira_client):
         """Should filter by current user when include_own_*_only is True."""
-        since = datetime(2025, 1, 10, 0, 0)
+        since = SINCE
+        end_time = END_TIME
         config = {
             "daily_summary": {
                 "include_own_prs_only": True,
@@ -82,44 +128,52 @@ class TestCollectWorkData:
             github_repo="org/repo",
             jira_project="ABC",
             since=since,
-            github_client=mock_github_client,
-            jira_client=mock_jira_client,
-            config=config
+            github_client=github_client,
+            jira_client=jira_client,
+            config=config,
+            end_time=end_time
         )
 
         # Should get current user
-        mock_github_client.get_current_user.assert_called_once()
+        assert len(github_client.called("get_current_user")) == 1
 
         # Should pass user to PR search
-        mock_github_client.search_prs_by_date.assert_called_once_with(
+        assert github_client.called("search_prs_by_date") == [call(
             repo="org/repo",
             since=since,
             author="testuser",
-            state="all"
-        )
+            state="all",
+            until=end_time,
+            per_page=100
+        )]
 
-        mock_github_client.get_closed_prs.assert_called_once_with(
+        assert github_client.called("get_closed_prs") == [call(
             repo="org/repo",
             since=since,
-            author="testuser"
-        )
+            author="testuser",
+            until=end_time,
+            per_page=100
+        )]
 
         # Should pass currentUser() to Jira
-        mock_jira_client.get_issues_created_since.assert_called_once_with(
+        assert jira_client.called("get_issues_created_since") == [call(
             "ABC",
             since,
-            assignee="currentUser()"
-        )
+            assignee="currentUser()",
+            max_results=100
+        )]
 
-        mock_jira_client.get_issues_updated_since.assert_called_once_with(
+        assert jira_client.called("get_issues_updated_since") == [call(
             "ABC",
             since,
-            assignee="currentUser()"
-        )
+            assignee="currentUser()",
+            max_results=100
+        )]
 
-    def test_does_not_filter_when_configured(self, mock_github_client, mock_jira_client):
+    def test_does_not_filter_when_configured(self, github_client, jira_client):
         """Should not filter by user when include_own_*_only is False."""
-        since = datetime(2025, 1, 10, 0, 0)
+        since = SINCE
+        end_time = END_TIME
         config = {
             "daily_summary": {
                 "include_own_prs_only": False,
@@ -131,44 +185,51 @@ class TestCollectWorkData:
             github_repo="org/repo",
             jira_project="ABC",
             since=since,
-            github_client=mock_github_client,
-            jira_client=mock_jira_client,
-            config=config
+            github_client=github_client,
+            jira_client=jira_client,
+            config=config,
+            end_time=end_time
         )
 
         # Should NOT get current user
-        mock_github_client.get_current_user.assert_not_called()
+        assert github_client.called("get_current_user") == []
 
         # Should pass None for author
-        mock_github_client.search_prs_by_date.assert_called_once_with(
+        assert github_client.called("search_prs_by_date") == [call(
             repo="org/repo",
             since=since,
             author=None,
-            state="all"
-        )
+            state="all",
+            until=end_time,
+            per_page=100
+        )]
 
-        mock_github_client.get_closed_prs.assert_called_once_with(
+        assert github_client.called("get_closed_prs") == [call(
             repo="org/repo",
             since=since,
-            author=None
-        )
+            author=None,
+            until=end_time,
+            per_page=100
+        )]
 
         # Should pass None for assignee
-        mock_jira_client.get_issues_created_since.assert_called_once_with(
+        assert jira_client.called("get_issues_created_since") == [call(
             "ABC",
             since,
-            assignee=None
-        )
+            assignee=None,
+            max_results=100
+        )]
 
-        mock_jira_client.get_issues_updated_since.assert_called_once_with(
+        assert jira_client.called("get_issues_updated_since") == [call(
             "ABC",
             since,
-            assignee=None
-        )
+            assignee=None,
+            max_results=100
+        )]
 
-    def test_handles_missing_github_client(self, mock_jira_client):
+    def test_handles_missing_github_client(self, jira_client):
         """Should handle gracefully when GitHub is not configured."""
-        since = datetime(2025, 1, 10, 0, 0)
+        since = SINCE
         config = {"daily_summary": {}}
 
         result = collect_work_data(
@@ -176,7 +237,7 @@ class TestCollectWorkData:
             jira_project="ABC",
             since=since,
             github_client=None,
-            jira_client=mock_jira_client,
+            jira_client=jira_client,
             config=config
         )
 
@@ -189,16 +250,16 @@ class TestCollectWorkData:
         assert len(result.jira_created) == 1
         assert len(result.jira_updated) == 1
 
-    def test_handles_missing_jira_client(self, mock_github_client):
+    def test_handles_missing_jira_client(self, github_client):
         """Should handle gracefully when Jira is not configured."""
-        since = datetime(2025, 1, 10, 0, 0)
+        since = SINCE
         config = {"daily_summary": {}}
 
         result = collect_work_data(
             github_repo="org/repo",
             jira_project=None,
             since=since,
-            github_client=mock_github_client,
+            github_client=github_client,
             jira_client=None,
             config=config
         )
@@ -212,7 +273,7 @@ class TestCollectWorkData:
 
     def test_handles_no_services_configured(self):
         """Should handle gracefully when neither service is configured."""
-        since = datetime(2025, 1, 10, 0, 0)
+        since = SINCE
         config = {"daily_summary": {}}
 
         result = collect_work_data(
@@ -224,22 +285,21 @@ class TestCollectWorkData:
             config=config
         )
 
+        assert_window(result, since)
         # Should have all empty lists
         assert result.prs_opened == []
         assert result.prs_closed == []
         assert result.prs_merged == []
         assert result.jira_created == []
         assert result.jira_updated == []
-        assert result.start_time == since
-        assert isinstance(result.end_time, datetime)
 
-    def test_separates_closed_and_merged_prs(self, mock_github_client, mock_jira_client):
+    def test_separates_closed_and_merged_prs(self, github_client, jira_client):
         """Should correctly separate closed vs merged PRs."""
-        since = datetime(2025, 1, 10, 0, 0)
+        since = SINCE
         config = {"daily_summary": {}}
 
-        # Mock with multiple closed PRs
-        mock_github_client.get_closed_prs.return_value = [
+        # Multiple closed PRs
+        github_client.results["get_closed_prs"] = [
             {"number": 1, "title": "Just closed", "merged_at": None},
             {"number": 2, "title": "Merged PR 1", "merged_at": "2025-01-11T10:00:00Z"},
             {"number": 3, "title": "Another closed", "merged_at": None},
@@ -250,34 +310,101 @@ class TestCollectWorkData:
             github_repo="org/repo",
             jira_project="ABC",
             since=since,
-            github_client=mock_github_client,
-            jira_client=mock_jira_client,
+            github_client=github_client,
+            jira_client=jira_client,
             config=config
         )
 
         assert len(result.prs_closed) == 2
         assert len(result.prs_merged) == 2
-        assert result.prs_closed[0]["title"] == "Just closed"
-        assert result.prs_closed[1]["title"] == "Another closed"
-        assert result.prs_merged[0]["title"] == "Merged PR 1"
-        assert result.prs_merged[1]["title"] == "Merged PR 2"
+        assert result.prs_closed[0].title == "Just closed"
+        assert result.prs_closed[1].title == "Another closed"
+        assert result.prs_merged[0].title == "Merged PR 1"
+        assert result.prs_merged[1].title == "Merged PR 2"
 
-    def test_uses_default_config_values(self, mock_github_client, mock_jira_client):
+    def test_uses_default_config_values(self, github_client, jira_client):
         """Should use default values when config is missing daily_summary section."""
-        since = datetime(2025, 1, 10, 0, 0)
+        since = SINCE
         config = {}  # No daily_summary config
 
         result = collect_work_data(
             github_repo="org/repo",
             jira_project="ABC",
             since=since,
-            github_client=mock_github_client,
-            jira_client=mock_jira_client,
+            github_client=github_client,
+            jira_client=jira_client,
             config=config
         )
 
         # Should default to include_own_*_only = True
-        mock_github_client.get_current_user.assert_called_once()
-        mock_jira_client.get_issues_created_since.assert_called_once()
-        call_args = mock_jira_client.get_issues_created_since.call_args
+        assert len(github_client.called("get_current_user")) == 1
+        assert len(jira_client.called("get_issues_created_since")) == 1
+        call_args = jira_client.called("get_issues_created_since")[-1]
         assert call_args[1]["assignee"] == "currentUser()"
+
+    def test_uses_provided_end_time(self):
+        """Should report the caller's end_time snapshot instead of re-reading the clock."""
+        since = SINCE
+        end_time = END_TIME
+
+        result = collect_work_data(
+            github_repo=None,
+            jira_project=None,
+            since=since,
+            github_client=None,
+            jira_client=None,
+            config={},
+            end_time=end_time
+        )
+
+        assert result.end_time == end_time
+
+    def test_passes_configured_page_size(self, github_client, jira_client):
+        """Should forward daily_summary.page_size to the GitHub and Jira searches."""
+        collect_work_data(
+            github_repo="org/repo",
+            jira_project="ABC",
+            since=SINCE,
+            github_client=github_client,
+            jira_client=jira_client,
+            config={"daily_summary": {"page_size": 50}}
+        )
+
+        assert github_client.called("search_prs_by_date")[-1][1]["per_page"] == 50
+        assert github_client.called("get_closed_prs")[-1][1]["per_page"] == 50
+        assert jira_client.called("get_issues_created_since")[-1][1]["max_results"] == 50
+        assert jira_client.called("get_issues_updated_since")[-1][1]["max_results"] == 50
+
+
+class TestRows:
+    """Tests for the row types built from API payloads."""
+
+    def test_pr_row_defaults_missing_fields(self):
+        """Should fall back to 'Untitled' and an empty URL."""
+        row = PRRow.from_api({"number": 7, "html_url": None})
+
+        assert row == PRRow(title="Untitled", number=7, html_url="")
+        assert not hasattr(row, "__dict__")
+
+    def test_jira_row_round_trips_to_dict(self):
+        """Should expose the same keys the summarizer reads."""
+        issue = {"key": "ABC-1", "summary": "Task", "status": {"name": "Done"}}
+
+        assert JiraRow.from_api(issue).as_dict() == issue
+
+    def test_jira_row_flattens_status_name(self):
+        """Should resolve the status name once, defaulting to 'Unknown'."""
+        assert JiraRow.from_api({"key": "ABC-1", "status": {"name": "Done"}}).status_name == "Done"
+        assert JiraRow.from_api({"key": "ABC-2", "status": None}).status_name == "Unknown"
+
+
+    def test_has_work_reflects_collected_items(self):
+        """Should report work only when some PR or issue was collected."""
+        empty = WorkSummaryData([], [], [], [], [], datetime(2025, 1, 10), datetime(2025, 1, 13))
+        with_issue = WorkSummaryData(
+            [], [], [], [], [JiraRow(key="ABC-1", summary="Task")],
+            datetime(2025, 1, 10), datetime(2025, 1, 13)
+        )
+
+        assert empty.has_work is False
+        assert with_issue.has_work is True
@@ -1,119 +1,137 @@
 """Tests for work summary formatting."""
 
+import dataclasses
+import re
 from datetime import datetime
 
 import pytest
 
-from pwm.summary.collector import WorkSummaryData
+from pwm.summary.collector import JiraRow, PRRow, WorkSummaryData
 from pwm.summary.formatter import format_markdown, format_text
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
-    """Create sample work summary data for testing."""
+    """Create sample work summary data; the formatters only read it, so build it once."""
     return WorkSummaryData(
         prs_opened=[
-            {"number": 1, "title": "Add new feature", "html_url": "https://github.com/org/repo/pull/1"},
-            {"number": 2, "title": "Fix bug in auth", "html_url": "https://github.com/org/repo/pull/2"}
+            PRRow(number=1, title="Add new feature", html_url="https://github.com/org/repo/pull/1"),
+            PRRow(number=2, title="Fix bug in auth", html_url="https://github.com/org/repo/pull/2")
         ],
         prs_closed=[
-            {"number": 3, "title": "Old PR closed", "html_url": "https://github.com/org/repo/pull/3"}
+            PRRow(number=3, title="Old PR closed", html_url="https://github.com/org/repo/pull/3")
         ],
         prs_merged=[
-            {"number": 4, "title": "Merged feature", "html_url": "https://github.com/org/repo/pull/4"},
-            {"number": 5, "title": "Another merge", "html_url": "https://github.com/org/repo/pull/5"}
+            PRRow(number=4, title="Merged feature", html_url="https://github.com/org/repo/pull/4"),
+            PRRow(number=5, title="Another merge", html_url="https://github.com/org/repo/pull/5")
         ],
         jira_created=[
-            {"key": "ABC-1", "summary": "New task for feature"},
-            {"key": "ABC-2", "summary": "Bug report"}
+            JiraRow(key="ABC-1", summary="New task for feature"),
+            JiraRow(key="ABC-2", summary="Bug report")
         ],
         jira_updated=[
-            {"key": "ABC-5", "summary": "Old task", "status": {"name": "In Progress"}},
-            {"key": "ABC-6", "summary": "Another task", "status": {"name": "Done"}}
+            JiraRow(key="ABC-5", summary="Old task", status_name="In Progress"),
+            JiraRow(key="ABC-6", summary="Another task", status_name="Done")
         ],
         start_time=datetime(2025, 1, 10, 0, 0),
         end_time=datetime(2025, 1, 13, 12, 0)
     )
 
 
-@pytest.fixture
-def empty_data():
-    """Create empty work summary data."""
-    return WorkSummaryData(
-        prs_opened=[],
-        prs_closed=[],
-        prs_merged=[],
-        jira_created=[],
-        jira_updated=[],
-        start_time=datetime(2025, 1, 10, 0, 0),
-        end_time=datetime(2025, 1, 13, 12, 0)
-    )
+# The formatters never mutate their input, so derived datasets may share its empty lists
+EMPTY_DATA = WorkSummaryData(
+    prs_opened=[],
+    prs_closed=[],
+    prs_merged=[],
+    jira_created=[],
+    jira_updated=[],
+    start_time=datetime(2025, 1, 10, 0, 0),
+    end_time=datetime(2025, 1, 13, 12, 0)
+)
 
 
-class TestFormatMarkdown:
-    """Tests for format_markdown function."""
+def make_data(**fields):
+    """Build summary data that differs from EMPTY_DATA only in the given fields."""
+    return dataclasses.replace(EMPTY_DATA, **fields)
 
-    def test_includes_header_and_period(self, sample_data):
-        """Should include title and date range."""
-        result = format_markdown(sample_data)
 
-        assert "# Daily Work Summary" in result
-        assert "**Period:**" in result
-        assert "Friday, Jan 10 2025" in result
-        assert "Monday, Jan 13 2025" in result
-
-    def test_formats_opened_prs(self, sample_data):
-        """Should format opened PRs with markdown links when show_links=True."""
-        result = format_markdown(sample_data, show_links=True)
+@pytest.fixture(scope="module")
+def empty_data():
+    """Create empty work summary data."""
+    return EMPTY_DATA
 
-        assert "## Pull Requests" in result
-        assert "### Opened (2)" in result
-        assert "[#1](https://github.com/org/repo/pull/1) Add new feature" in result
-        assert "[#2](https://github.com/org/repo/pull/2) Fix bug in auth" in result
 
-    def test_formats_merged_prs(self, sample_data):
-        """Should format merged PRs with links when show_links=True."""
-        result = format_markdown(sample_data, show_links=True)
+@pytest.fixture(scope="module")
+def markdown(sample_data):
+    """Render sample_data once; the section tests below only search the output."""
+    return format_markdown(sample_data)
 
-        assert "### Merged (2)" in result
-        assert "[#4](https://github.com/org/repo/pull/4) Merged feature" in result
-        assert "[#5](https://github.com/org/repo/pull/5) Another merge" in result
 
-    def test_formats_closed_prs(self, sample_data):
-        """Should format closed PRs with links when show_links=True."""
-        result = format_markdown(sample_data, show_links=True)
+@pytest.fixture(scope="module")
+def linked_markdown(sample_data):
+    return format_markdown(sample_data, show_links=True)
 
-        assert "### Closed (1)" in result
-        assert "[#3](https://github.com/org/repo/pull/3) Old PR closed" in result
 
-    def test_formats_created_jira_issues(self, sample_data):
-        """Should format created Jira issues."""
-        result = format_markdown(sample_data)
+@pytest.fixture(scope="module")
+def text(sample_data):
+    return format_text(sample_data)
 
-        assert "## Jira Issues" in result
-        assert "### Created (2)" in result
-        assert "- ABC-1: New task for feature" in result
-        assert "- ABC-2: Bug report" in result
 
-    def test_formats_updated_jira_issues(self, sample_data):
-        """Should format updated Jira issues with status."""
-        result = format_markdown(sample_data)
+class TestFormatMarkdown:
+    """Tests for format_markdown function."""
 
-        assert "### Updated (2)" in result
-        assert "- ABC-5: Old task → In Progress" in result
-        assert "- ABC-6: Another task → Done" in result
+    @pytest.mark.parametrize("expected", [
+        pytest.param([
+            "# Daily Work Summary",
+            "**Period:**",
+            "Friday, Jan 10 2025",
+            "Monday, Jan 13 2025",
+        ], id="header_and_period"),
+        pytest.param([
+            "## Jira Issues",
+            "### Created (2)",
+            "- ABC-1: New task for feature",
+            "- ABC-2: Bug report",
+        ], id="created_jira_issues"),
+        pytest.param([
+            "### Updated (2)",
+            "- ABC-5: Old task → In Progress",
+            "- ABC-6: Another task → Done",
+        ], id="updated_jira_issues"),
+    ])
+    def test_formats_section(self, markdown, expected):
+        """Should render each section of the summary."""
+        assert [line for line in expected if line not in markdown] == []
+
+    @pytest.mark.parametrize("expected", [
+        pytest.param([
+            "## Pull Requests",
+            "### Opened (2)",
+            "[#1](https://github.com/org/repo/pull/1) Add new feature",
+            "[#2](https://github.com/org/repo/pull/2) Fix bug in auth",
+        ], id="opened"),
+        pytest.param([
+            "### Merged (2)",
+            "[#4](https://github.com/org/repo/pull/4) Merged feature",
+            "[#5](https://github.com/org/repo/pull/5) Another merge",
+        ], id="merged"),
+        pytest.param([
+            "### Closed (1)",
+            "[#3](https://github.com/org/repo/pull/3) Old PR closed",
+        ], id="closed"),
+    ])
+    def test_formats_linked_prs(self, linked_markdown, expected):
+        """Should format PRs with markdown links when show_links=True."""
+        assert [line for line in expected if line not in linked_markdown] == []
 
     def test_includes_ai_summary_at_top(self, sample_data):
         """Should include AI summary at the top if provided."""
         ai_summary = "Made significant progress on authentication and new features."
         result = format_markdown(sample_data, ai_summary=ai_summary)
 
-        assert "## Summary" in result
         assert ai_summary in result
-        # Summary should come before Pull Requests
-        summary_pos = result.index("## Summary")
-        pr_pos = result.index("## Pull Requests")
-        assert summary_pos < pr_pos
+        # Summary should come before Pull Requests; one scan finds both headings in order
+        assert re.findall(r"^## (Summary|Pull Requests)$", result, re.M) == ["Summary", "Pull Requests"]
 
     def test_handles_empty_data(self, empty_data):
         """Should handle empty data gracefully."""
@@ -126,30 +144,14 @@ class TestFormatMarkdown:
 
     def test_handles_missing_html_url(self):
         """Should handle PRs without html_url."""
-        data = WorkSummaryData(
-            prs_opened=[{"number": 1, "title": "Test PR"}],
-            prs_closed=[],
-            prs_merged=[],
-            jira_created=[],
-            jira_updated=[],
-            start_time=datetime(2025, 1, 10, 0, 0),
-            end_time=datetime(2025, 1, 13, 12, 0)
-        )
+        data = make_data(prs_opened=[PRRow(number=1, title="Test PR")])
 
         result = format_markdown(data)
         assert "- #1 Test PR" in result
 
     def test_handles_only_prs(self):
         """Should format correctly with only PR data."""
-        data = WorkSummaryData(
-            prs_opened=[{"number": 1, "title": "Test", "html_url": "https://example.com"}],
-            prs_closed=[],
-            prs_merged=[],
-            jira_created=[],
-            jira_updated=[],
-            start_time=datetime(2025, 1, 10, 0, 0),
-            end_time=datetime(2025, 1, 13, 12, 0)
-        )
+        data = make_data(prs_opened=[PRRow(number=1, title="Test", html_url="https://example.com")])
 
         result = format_markdown(data)
         assert "## Pull Requests" in result
@@ -157,15 +159,7 @@ class TestFormatMarkdown:
 
     def test_handles_only_jira(self):
         """Should format correctly with only Jira data."""
-        data = WorkSummaryData(
-            prs_opened=[],
-            prs_closed=[],
-            prs_merged=[],
-            jira_created=[{"key": "ABC-1", "summary": "Test"}],
-            jira_updated=[],
-            start_time=datetime(2025, 1, 10, 0, 0),
-            end_time=datetime(2025, 1, 13, 12, 0)
-        )
+        data = make_data(jira_created=[JiraRow(key="ABC-1", summary="Test")])
 
         result = format_markdown(data)
         assert "## Jira Issues" in result
@@ -175,36 +169,34 @@ class TestFormatMarkdown:
 class TestFormatText:
     """Tests for format_text function."""
 
-    def test_includes_header_and_period(self, sample_data):
-        """Should include title and date range in text format."""
-        result = format_text(sample_data)
-
-        assert "DAILY WORK SUMMARY" in result
-        assert "=" * 60 in result
-        assert "Period:" in result
-        assert "Friday, Jan 10 2025" in result
-
-    def test_formats_pull_requests(self, sample_data):
-        """Should format pull requests in text format."""
-        result = format_text(sample_data)
-
-        assert "PULL REQUESTS" in result
-        assert "Opened (2):" in result
-        assert "  • #1 Add new feature" in result
-        assert "Merged (2):" in result
-        assert "  • #4 Merged feature" in result
-        assert "Closed (1):" in result
-        assert "  • #3 Old PR closed" in result
-
-    def test_formats_jira_issues(self, sample_data):
-        """Should format Jira issues in text format."""
-        result = format_text(sample_data)
-
-        assert "JIRA ISSUES" in result
-        assert "Created (2):" in result
-        assert "  • ABC-1: New task for feature" in result
-        assert "Updated (2):" in result
-        assert "  • ABC-5: Old task → In Progress" in result
+    @pytest.mark.parametrize("expected", [
+        pytest.param([
+            "DAILY WORK SUMMARY",
+            "=" * 60,
+            "Period:",
+            "Friday, Jan 10 2025",
+        ], id="header_and_period"),
+        pytest.param([
+            "PULL REQUESTS",
+            "Opened (2):",
+            "  • #1 Add new feature",
+            "Merged (2):",
+            "  • #4 Merged feature",
+            "Closed (1):",
+            "  • #3 Old PR closed",
+        ], id="pull_requests"),
+        pytest.param([
+            "JIRA ISSUES",
+            "Created (2):",
+            "  • ABC-1: New task for feature",
+            "Updated (2):",
+            "  • ABC-5: Old task → In Progress",
+        ], id="jira_issues"),
+        pytest.param(["-" * 60], id="separators"),
+    ])
+    def test_formats_section(self, text, expected):
+        """Should render each section with bullet points and separators."""
+        assert [line for line in expected if line not in text] == []
 
     def test_includes_ai_summary(self, sample_data):
         """Should include AI summary in text format."""
@@ -222,16 +214,3 @@ class TestFormatText:
         assert "No work activity found for this period" in result
         assert "PULL REQUESTS" not in result
         assert "JIRA ISSUES" not in result
-
-    def test_uses_bullet_points(self, sample_data):
-        """Should use bullet points (•) for list items."""
-        result = format_text(sample_data)
-
-        assert "  • #1 Add new feature" in result
-        assert "  • ABC-1: New task for feature" in result
-
-    def test_uses_separators(self, sample_data):
-        """Should use dashes for section separators."""
-        result = format_text(sample_data)
-
-        assert "-" * 60 in result
@@ -1,81 +1,162 @@
 
+import contextlib
+import io
+import types
 from pathlib import Path
-from unittest.mock import patch, Mock
-from pwm.vcs.git_cli import get_commits_since_base, push_branch
+from unittest.mock import Mock, patch
 
+import pytest
 
-def test_get_commits_since_base():
+from pwm.vcs import git_cli
+from pwm.vcs.git_cli import (
+    get_commit_count_and_latest_subject,
+    get_commits_and_diff_since_base,
+    get_commits_since_base,
+    get_diff_since_base,
+    push_branch,
+)
+
+
+@pytest.fixture
+def git_run(monkeypatch):
+    """Replace git_cli._run for one test; set return_value or side_effect on the result."""
+    run = Mock()
+    monkeypatch.setattr(git_cli, "_run", run)
+    return run
+
+
+def fake_stream(stdout):
+    """Build a _stream replacement that serves stdout from memory."""
+    @contextlib.contextmanager
+    def _stream(args, repo_root):
+        yield io.StringIO(stdout)
+    return _stream
+
+
+# (hash, subject, body, timestamp) records and the git log output that encodes them
+SAMPLE_COMMITS = (
+    ("abc123", "Add feature X", "Detailed description", 1700000000),
+    ("def456", "Fix bug Y", "", 1700000100),
+    ("ghi789", "Update docs", "Added examples", 1700000200),
+    ("jkl012", "Résumé les entrées", "Unicode body ✓", 1700000300),
+)
+SAMPLE_LOG = "".join(f"{h}\x00{s}\x00{b}\x00{t}\x00" for h, s, b, t in SAMPLE_COMMITS)
+
+
+@pytest.mark.parametrize("limit", [None, 1, 2, len(SAMPLE_COMMITS)])
+def test_get_commits_since_base(limit):
     """Test getting commits since base branch."""
-    mock_result = Mock()
-    mock_result.returncode = 0
-    # Simulated git log output with format markers
-    mock_result.stdout = (
-        "abc123\x00Add feature X\x00Detailed description\x1e"
-        "def456\x00Fix bug Y\x00\x1e"
-        "ghi789\x00Update docs\x00Added examples\x1e"
-    )
-
-    with patch("pwm.vcs.git_cli._run", return_value=mock_result):
-        commits = get_commits_since_base(Path("/repo"), "origin/main")
+    with patch("pwm.vcs.git_cli._stream", fake_stream(SAMPLE_LOG)):
+        commits = get_commits_since_base(Path("/repo"), "origin/main", limit=limit)
 
-        assert len(commits) == 3
-        assert commits[0]["hash"] == "abc123"
-        assert commits[0]["subject"] == "Add feature X"
-        assert commits[0]["body"] == "Detailed description"
-        assert commits[1]["hash"] == "def456"
-        assert commits[1]["subject"] == "Fix bug Y"
-        assert commits[1]["body"] == ""
+    records = [(c["hash"], c["subject"], c["body"], int(c["timestamp"].timestamp())) for c in commits]
+    assert records == list(SAMPLE_COMMITS[:limit])
 
 
 def test_get_commits_since_base_no_commits():
     """Test when there are no commits."""
-    mock_result = Mock()
-    mock_result.returncode = 0
-    mock_result.stdout = ""
-
-    with patch("pwm.vcs.git_cli._run", return_value=mock_result):
+    with patch("pwm.vcs.git_cli._stream", fake_stream("")):
         commits = get_commits_since_base(Path("/repo"), "origin/main")
 
         assert len(commits) == 0
 
 
-def test_push_branch_success():
+def test_get_commit_count_and_latest_subject(git_run):
+    """Count and newest subject come from rev-list --count and log -1."""
+    git_run.side_effect = [
+        types.SimpleNamespace(returncode=0, stdout="12\n"),
+        types.SimpleNamespace(returncode=0, stdout="Newest change\n"),
+    ]
+
+    result = get_commit_count_and_latest_subject(Path("/repo"), "origin/main")
+
+    assert result == (12, "Newest change")
+    assert git_run.call_args_list[0].args[0] == ["rev-list", "--count", "origin/main..HEAD"]
+    assert git_run.call_args_list[1].args[0] == ["log", "-1", "--format=%s", "origin/main..HEAD"]
+
+
+def test_get_commit_count_and_latest_subject_no_commits(git_run):
+    """An empty range skips the log call."""
+    git_run.return_value = types.SimpleNamespace(returncode=0, stdout="0\n")
+    assert get_commit_count_and_latest_subject(Path("/repo"), "origin/main") == (0, None)
+    git_run.assert_called_once()
+
+
+def test_get_commits_since_base_limit():
+    """Test stopping after a limited number of commits."""
+    stdout = "".join(f"sha{i}\x00Commit {i}\x00\x001700000000\x00" for i in range(5))
+
+    with patch("pwm.vcs.git_cli._stream", fake_stream(stdout)):
+        commits = get_commits_since_base(Path("/repo"), "origin/main", limit=2)
+
+    assert [c["hash"] for c in commits] == ["sha0", "sha1"]
+    assert commits[0]["timestamp"].timestamp() == 1700000000
+
+
+def test_get_commits_and_diff_since_base(git_run):
+    """Test fetching commits and diff together against one base branch."""
+    def fake_run(args, repo_root, capture=True, text=True):
+        assert args == ["diff", "origin/main...HEAD"]
+        return types.SimpleNamespace(returncode=0, stdout=b"diff --git a/x.py b/x.py")
+    git_run.side_effect = fake_run
+
+    with patch("pwm.vcs.git_cli._stream", fake_stream("abc123\x00Add feature X\x00\x001700000000\x00")):
+        commits, diff = get_commits_and_diff_since_base(Path("/repo"), "origin/main")
+
+    assert [c["hash"] for c in commits] == ["abc123"]
+    assert diff == "diff --git a/x.py b/x.py"
+
+
+def test_get_diff_since_base_replaces_undecodable_bytes(git_run):
+    """Test that non-UTF-8 diff content is decoded with replacement characters."""
+    git_run.return_value = types.SimpleNamespace(returncode=0, stdout=b"+caf\xe9\n")
+
+    diff = get_diff_since_base(Path("/repo"), "origin/main")
+
+    assert diff == "+caf\ufffd\n"
+    assert git_run.call_args.kwargs["text"] is False
+
+
+def test_push_branch_success(git_run):
     """Test successful branch push."""
-    mock_result = Mock()
-    mock_result.returncode = 0
+    git_run.return_value = types.SimpleNamespace(returncode=0)
 
-    with patch("pwm.vcs.git_cli._run", return_value=mock_result) as mock_run:
-        result = push_branch(Path("/repo"), "feature-branch", "origin", set_upstream=True)
+    result = push_branch(Path("/repo"), "feature-branch", "origin", set_upstream=True)
 
-        assert result is True
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert "push" in args
-        assert "-u" in args
-        assert "origin" in args
-        assert "feature-branch" in args
+    assert result is True
+    git_run.assert_called_once()
+    args = set(git_run.call_args.args[0])
+    assert {"push", "-u", "origin", "feature-branch"} <= args
 
 
-def test_push_branch_failure():
+def test_push_branch_failure(git_run):
     """Test failed branch push."""
-    mock_result = Mock()
-    mock_result.returncode = 1
+    git_run.return_value = types.SimpleNamespace(returncode=1, stderr="")
+
+    assert push_branch(Path("/repo"), "feature-branch") is False
+
+
+def test_push_branch_quiet_when_not_a_tty(git_run, monkeypatch, capsys):
+    """Non-TTY callers get a quiet, captured push with errors forwarded."""
+    monkeypatch.setattr("sys.stdout.isatty", lambda: False)
+    git_run.return_value = types.SimpleNamespace(returncode=1, stderr="rejected\n")
 
-    with patch("pwm.vcs.git_cli._run", return_value=mock_result):
-        result = push_branch(Path("/repo"), "feature-branch")
+    result = push_branch(Path("/repo"), "feature-branch")
 
-        assert result is False
+    assert result is False
+    args = git_run.call_args.args[0]
+    assert args[-2:] == ["--quiet", "--no-progress"]
+    assert git_run.call_args.kwargs.get("capture", True) is True
+    assert capsys.readouterr().err == "rejected\n"
 
 
-def test_push_branch_without_upstream():
+def test_push_branch_without_upstream(git_run):
     """Test pushing without setting upstream."""
-    mock_result = Mock()
-    mock_result.returncode = 0
+    git_run.return_value = types.SimpleNamespace(returncode=0)
 
-    with patch("pwm.vcs.git_cli._run", return_value=mock_result) as mock_run:
-        result = push_branch(Path("/repo"), "feature-branch", set_upstream=False)
+    result = push_branch(Path("/repo"), "feature-branch", set_upstream=False)
 
-        assert result is True
-        args = mock_run.call_args[0][0]
-        assert "push" in args
-        assert "-u" not in args
+    assert result is True
+    args = set(git_run.call_args.args[0])
+    assert "push" in args
+    assert "-u" not in args
@@ -1,6 +1,11 @@
 
+import shutil
+import subprocess
 import types
 from pathlib import Path
+
+import pytest
+
 from pwm.vcs import git_cli
 
 def test_infer_github_repo_from_remote_ssh(monkeypatch, tmp_path):
@@ -18,3 +23,92 @@ def test_infer_github_repo_from_remote_https(monkeypatch, tmp_path):
         return types.SimpleNamespace(returncode=0, stdout="https://github.com/org/repo.git")
     monkeypatch.setattr(git_cli, "_run", fake_run)
     assert git_cli.infer_github_repo_from_remote(repo) == "org/repo"
+
+def test_get_default_branch_reads_remote_head_in_one_call(monkeypatch, tmp_path):
+    calls = []
+    def fake_run(args, repo_root: Path, capture: bool=True, input=None):
+        calls.append(args)
+        return types.SimpleNamespace(
+            returncode=0,
+            stdout="refs/remotes/origin/HEAD refs/remotes/origin/develop\nrefs/remotes/origin/main \n",
+        )
+    monkeypatch.setattr(git_cli, "_run", fake_run)
+    assert git_cli.get_default_branch(tmp_path) == "origin/develop"
+    assert len(calls) == 1
+    assert calls[0][0] == "for-each-ref"
+
+def test_get_default_branch_falls_back_to_existing_candidate(monkeypatch, tmp_path):
+    calls = []
+    def fake_run(args, repo_root: Path, capture: bool=True, input=None):
+        calls.append(args)
+        if args[0] == "for-each-ref":
+            return types.SimpleNamespace(
+                returncode=0,
+                stdout="refs/remotes/origin/develop \nrefs/remotes/origin/master \n",
+            )
+        return types.SimpleNamespace(returncode=1, stdout="")
+    monkeypatch.setattr(git_cli, "_run", fake_run)
+    assert git_cli.get_default_branch(tmp_path) == "origin/master"
+    assert [c[0] for c in calls] == ["for-each-ref", "remote"]
+
+def test_get_default_branch_is_cached_until_invalidated(monkeypatch, tmp_path):
+    calls = []
+    def fake_run(args, repo_root: Path, capture: bool=True, input=None):
+        calls.append(args)
+        return types.SimpleNamespace(
+            returncode=0, stdout="refs/remotes/origin/HEAD refs/remotes/origin/main\n"
+        )
+    monkeypatch.setattr(git_cli, "_run", fake_run)
+    assert git_cli.get_default_branch(tmp_path) == "origin/main"
+    assert git_cli.get_default_branch(tmp_path) == "origin/main"
+    assert len(calls) == 1
+    git_cli._invalidate_git_cache()
+    git_cli.get_default_branch(tmp_path)
+    assert len(calls) == 2
+
+def test_git_state_reads_current_and_existing_branch(monkeypatch, tmp_path):
+    def fake_run(args, repo_root: Path, capture: bool=True, input=None):
+        return types.SimpleNamespace(returncode=0, stdout="  main\n* ABC-1-fix\n  ABC-2-feat\n")
+    monkeypatch.setattr(git_cli, "_run", fake_run)
+    assert git_cli.git_state(tmp_path, "ABC-2-feat") == ("ABC-1-fix", True)
+    assert git_cli.git_state(tmp_path, "ABC-3-new") == ("ABC-1-fix", False)
+
+def test_git_state_reads_head_and_refs_without_git(monkeypatch, tmp_path):
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads" / "feature").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/ABC-1-fix\n")
+    (git_dir / "refs" / "heads" / "feature" / "ABC-2").write_text("0" * 40 + "\n")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        + "1" * 40 + " refs/heads/ABC-3-packed\n"
+        + "^" + "2" * 40 + "\n"
+    )
+    monkeypatch.setattr(git_cli, "_run", lambda *args, **kwargs: pytest.fail("git should not run"))
+
+    assert git_cli.git_state(tmp_path, "feature/ABC-2") == ("ABC-1-fix", True)
+    assert git_cli.git_state(tmp_path, "ABC-3-packed") == ("ABC-1-fix", True)
+    assert git_cli.git_state(tmp_path, "feature") == ("ABC-1-fix", False)
+
+    (git_dir / "HEAD").write_text("0" * 40 + "\n")
+    assert git_cli.git_state(tmp_path, "ABC-4") == (None, False)
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_git_session_reuses_one_process(tmp_path):
+    subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True)
+    subprocess.run(
+        ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@example.com",
+         "commit", "-q", "--allow-empty", "-m", "init"],
+        check=True,
+    )
+    session = git_cli.GitSession(tmp_path)
+    try:
+        assert session.ref_exists("main") is True
+        pid = session._proc.pid
+        assert session.refs_exist(["main", "missing-branch", "bad\nname"]) == {
+            "main": True, "missing-branch": False, "bad\nname": False,
+        }
+        subprocess.run(["git", "-C", str(tmp_path), "branch", "feature"], check=True)
+        assert session.ref_exists("feature") is True
+        assert session._proc.pid == pid
+    finally:
+        session.close()
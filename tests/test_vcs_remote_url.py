@@ -11,3 +11,12 @@ def test_parse_repo_from_remote_url_https():
 
 def test_parse_repo_from_remote_url_invalid():
     assert parse_repo_from_remote_url("file:///tmp/repo") is None
+
+
+def test_parse_repo_from_remote_url_without_git_suffix():
+    assert parse_repo_from_remote_url("https://github.com/org/repo") == "org/repo"
+    assert parse_repo_from_remote_url("git@github.com:org/repo") == "org/repo"
+
+
+def test_parse_repo_from_remote_url_requires_owner():
+    assert parse_repo_from_remote_url("https://github.com/repo.git") is None
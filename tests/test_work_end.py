@@ -1,5 +1,7 @@
 
 from unittest.mock import Mock
+import pwm.work.end as we
+from pwm.context.resolver import Context, ContextMeta
 from pwm.work.end import generate_work_summary
 
 
@@ -48,3 +50,91 @@ def test_generate_work_summary_no_commits():
     summary = generate_work_summary(commits)
 
     assert summary == "No new changes since last update."
+
+
+def test_work_end_posts_updates_and_requests_reviewers(monkeypatch, tmp_path):
+    calls = []
+
+    class FakeGitHub:
+        def get_pr_for_branch_graphql(self, repo, branch):
+            return {
+                "number": 7,
+                "html_url": "https://github.com/org/repo/pull/7",
+                "title": "Fix",
+                "requested_reviewers": ["bob"],
+                "requested_teams": [],
+                "last_pwm_comment_time": None,
+            }
+
+        def add_pr_comment(self, repo, pr_number, body):
+            calls.append(("pr", pr_number))
+            return {"id": 1}
+
+        def request_reviewers(self, repo, pr_number, reviewers, team_reviewers):
+            calls.append(("review", tuple(reviewers)))
+            return False
+
+    class FakeJira:
+        def add_comment_with_link(self, key, text, link_text, url):
+            calls.append(("jira", key))
+            return True
+
+    config = {"github": {"pr_defaults": {"reviewers": ["alice", "bob"]}}}
+    meta = ContextMeta(user_config_path=None, project_config_path=None, source_summary="defaults")
+    ctx = Context(repo_root=tmp_path, config=config, github_repo="org/repo", jira_project_key="ABC", meta=meta)
+    monkeypatch.setattr(we, "resolve_context", lambda: ctx)
+    monkeypatch.setattr(we, "current_branch", lambda repo_root: "ABC-1-fix")
+    monkeypatch.setattr(we, "get_commit_count_and_latest_subject", lambda *args, **kwargs: (0, None))
+    monkeypatch.setattr(we.GitHubClient, "from_config", classmethod(lambda cls, cfg: FakeGitHub()))
+    monkeypatch.setattr(we.JiraClient, "from_config", classmethod(lambda cls, cfg: FakeJira()))
+
+    rc = we.work_end(message="Done", request_review=True)
+
+    assert rc == 0
+    assert sorted(calls) == [("jira", "ABC-1"), ("pr", 7), ("review", ("alice",))]
+
+
+def test_work_end_trusts_graphql_when_no_pr_exists(monkeypatch, tmp_path):
+    """A definitive GraphQL "no PR" skips the REST lookup."""
+    class FakeGitHub:
+        def get_pr_for_branch_graphql(self, repo, branch):
+            return {}
+
+        def get_pr_for_branch(self, repo, branch, state="open"):
+            raise AssertionError("REST lookup should be skipped")
+
+    meta = ContextMeta(user_config_path=None, project_config_path=None, source_summary="defaults")
+    ctx = Context(repo_root=tmp_path, config={}, github_repo="org/repo", jira_project_key="ABC", meta=meta)
+    monkeypatch.setattr(we, "resolve_context", lambda: ctx)
+    monkeypatch.setattr(we, "current_branch", lambda repo_root: "ABC-1-fix")
+    monkeypatch.setattr(we.GitHubClient, "from_config", classmethod(lambda cls, cfg: FakeGitHub()))
+
+    assert we.work_end(message="Done") == 1
+
+
+def test_work_end_falls_back_to_rest_when_graphql_reports_errors(monkeypatch, tmp_path):
+    """A FORBIDDEN/SAML GraphQL answer (HTTP 200, null repository) still gets the REST lookup."""
+    rest_lookups = []
+
+    class GitHub(we.GitHubClient):
+        def _send(self, c, method, url, **kwargs):
+            return Mock(status_code=200, json=lambda: {
+                "data": {"repository": None},
+                "errors": [{"type": "FORBIDDEN", "message": "Resource protected by SAML enforcement"}],
+            })
+
+        def get_pr_for_branch(self, repo, branch, state="open"):
+            rest_lookups.append((repo, branch, state))
+            return None
+
+    gh = GitHub(base_url="https://api.github.com", token="t")
+    monkeypatch.setattr(gh, "_client", lambda: None)
+    meta = ContextMeta(user_config_path=None, project_config_path=None, source_summary="defaults")
+    ctx = Context(repo_root=tmp_path, config={}, github_repo="org/repo", jira_project_key="ABC", meta=meta)
+    monkeypatch.setattr(we, "resolve_context", lambda: ctx)
+    monkeypatch.setattr(we, "current_branch", lambda repo_root: "ABC-1-fix")
+    monkeypatch.setattr(we.GitHubClient, "from_config", classmethod(lambda cls, cfg: gh))
+
+    we.work_end(message="Done")
+
+    assert rest_lookups == [("org/repo", "ABC-1-fix", "all")]
@@ -1,77 +1,116 @@
 
+import time
 from pathlib import Path
+
+import pytest
+
 import pwm.work.start as ws
 import pwm.vcs.git_cli as git_cli
 from pwm.jira import client as jira_client_module
 from pwm.context.resolver import Context, ContextMeta
 from pwm.work import create_issue as create_issue_module
 
-def test_work_start_creates_branch(monkeypatch, tmp_path):
-    created = []
-    switched = []
-    comment_bodies = []
-
-    monkeypatch.setattr(ws, "current_branch", lambda repo_root: None)
-    def fake_create(repo_root: Path, branch_name: str, from_ref: str | None = None, remote: str = "origin"):
-        created.append(branch_name); return True
-    monkeypatch.setattr(ws, "create_branch", fake_create)
-    monkeypatch.setattr(ws, "branch_exists", lambda repo_root, name: False)
-    def fake_switch(repo_root: Path, name: str): switched.append(name); return True
-    monkeypatch.setattr(ws, "switch_branch", fake_switch)
-
-    class FakeJira:
-        def get_issue_summary(self, key): return "Implement feature X"
-        def transition_by_name(self, key, name): return True
-        def add_comment(self, key, body):
-            comment_bodies.append(body)
-            return True
-        def get_current_account_id(self): return "test-account-id-123"
-        def assign_issue(self, key, account_id): return True
-    monkeypatch.setattr(jira_client_module.JiraClient, "from_config", classmethod(lambda cls, cfg: FakeJira()))
-
-    repo_root = tmp_path
-    (repo_root / ".git").mkdir()
-    config = {"branch": {"pattern": "{issue_key}-{slug}"}}
-    meta = ContextMeta(user_config_path=None, project_config_path=None, source_summary="defaults")
-    fake_ctx = Context(repo_root=repo_root, config=config, github_repo="org/repo", jira_project_key="ABC", meta=meta)
+# work_start only reads the meta, so every fake context shares one
+DEFAULT_META = ContextMeta(user_config_path=None, project_config_path=None, source_summary="defaults")
+# git and issue creation are faked, so nothing touches the repo root on disk
+REPO_ROOT = Path("/nonexistent/repo")
+
+
+def use_context(monkeypatch, config, jira_project_key="ABC"):
+    """Point work_start's resolve_context at a fixed Context."""
+    fake_ctx = Context(repo_root=REPO_ROOT, config=config, github_repo="org/repo",
+                      jira_project_key=jira_project_key, meta=DEFAULT_META)
     monkeypatch.setattr(ws, "resolve_context", lambda: fake_ctx)
+    return fake_ctx
+
+
+class FakeJira:
+    """Jira stand-in for work_start; records the comments and issue updates it receives."""
+
+    def __init__(self, summary="Implement feature X", account_id="test-account-id"):
+        self.summary = summary
+        self.account_id = account_id
+        self.comments = []
+        self.updates = []
+
+    def get_issue_summary(self, key):
+        return self.summary
+
+    def transition_by_name(self, key, name):
+        self.updates.append(("transition", name))
+        return True
+
+    def add_comment(self, key, body):
+        self.comments.append(body)
+        return True
+
+    def get_issue_types(self, project_key):
+        return [{"id": "1", "name": "Story", "description": ""}]
+
+    def get_current_account_id(self):
+        return self.account_id
+
+    def assign_issue(self, key, account_id):
+        self.updates.append(("assign", account_id))
+        return True
+
+
+class FakeGit:
+    """git stand-in for work_start: no branch exists yet; records the branches it creates."""
+
+    def __init__(self):
+        self.created = []
+        self.switched = []
+
+    def git_state(self, repo_root, name):
+        return None, False
+
+    def create_branch(self, repo_root, branch_name, from_ref=None, remote="origin"):
+        self.created.append(branch_name)
+        return True
+
+    def switch_branch(self, repo_root, name):
+        self.switched.append(name)
+        return True
+
+
+def use_git(monkeypatch):
+    """Route work_start's git helpers to a fresh FakeGit."""
+    git = FakeGit()
+    for name in ("git_state", "create_branch", "switch_branch"):
+        monkeypatch.setattr(ws, name, getattr(git, name))
+    return git
+
+
+def use_jira(monkeypatch, jira):
+    """Make JiraClient.from_config hand work_start the given fake."""
+    monkeypatch.setattr(jira_client_module.JiraClient, "from_config", classmethod(lambda cls, cfg: jira))
+    return jira
+
+
+def test_work_start_creates_branch(monkeypatch):
+    git = use_git(monkeypatch)
+
+    jira = use_jira(monkeypatch, FakeJira())
+
+    config = {"branch": {"pattern": "{issue_key}-{slug}"}}
+    use_context(monkeypatch, config)
 
     rc = ws.work_start(issue_key="ABC-123", transition=True, comment=True)
     assert rc == 0
-    assert created, "branch should be created"
-    assert any(b.startswith("ABC-123-implement-feature-x") for b in created)
-    assert comment_bodies
-    assert "repo `org/repo`" in comment_bodies[0]
+    assert git.created, "branch should be created"
+    assert any(b.startswith("ABC-123-implement-feature-x") for b in git.created)
+    assert jira.comments
+    assert "repo `org/repo`" in jira.comments[0]
     # Note: when create_branch is called, it uses git checkout -b which automatically switches
     # to the new branch, so switch_branch is not called separately
+    assert git.switched == []
 
-def test_work_start_with_new_flag(monkeypatch, tmp_path):
+def test_work_start_with_new_flag(monkeypatch):
     """Test work-start --new creates a Jira issue and branch."""
-    created = []
-    created_issue_key = None
-
-    # Mock git operations
-    monkeypatch.setattr(ws, "current_branch", lambda repo_root: None)
-    def fake_create(repo_root: Path, branch_name: str, from_ref: str | None = None, remote: str = "origin"):
-        created.append(branch_name); return True
-    monkeypatch.setattr(ws, "create_branch", fake_create)
-    monkeypatch.setattr(ws, "branch_exists", lambda repo_root, name: False)
-
-    # Mock Jira client
-    class FakeJira:
-        def get_issue_summary(self, key):
-            return "Test issue summary"
-        def transition_by_name(self, key, name):
-            return True
-        def add_comment(self, key, body):
-            return True
-        def get_issue_types(self, project_key):
-            return [{"id": "1", "name": "Story", "description": ""}]
-        def get_current_account_id(self):
-            return "test-account-id-456"
-        def assign_issue(self, key, account_id):
-            return True
-    monkeypatch.setattr(jira_client_module.JiraClient, "from_config", classmethod(lambda cls, cfg: FakeJira()))
+    git = use_git(monkeypatch)
+
+    use_jira(monkeypatch, FakeJira(summary="Test issue summary"))
 
     # Mock create_new_issue (patch where it's used, not where it's defined)
     def fake_create_issue(jira, project_key, repo_root, config, **kwargs):
@@ -79,52 +118,22 @@ def test_work_start_with_new_flag(monkeypatch, tmp_path):
     monkeypatch.setattr(ws, "create_new_issue", fake_create_issue)
 
     # Setup context
-    repo_root = tmp_path
-    (repo_root / ".git").mkdir()
     config = {"branch": {"pattern": "{issue_key}-{slug}"}, "jira": {"issue_defaults": {}}}
-    meta = ContextMeta(user_config_path=None, project_config_path=None, source_summary="defaults")
-    fake_ctx = Context(repo_root=repo_root, config=config, github_repo="org/repo", jira_project_key="TEST", meta=meta)
-    monkeypatch.setattr(ws, "resolve_context", lambda: fake_ctx)
+    use_context(monkeypatch, config, "TEST")
 
     # Run work_start with create_new flag
     rc = ws.work_start(create_new=True, transition=True, comment=True)
     assert rc == 0
-    assert created, "branch should be created"
-    assert any(b.startswith("TEST-456-") for b in created), f"Expected branch starting with TEST-456, got {created}"
+    assert git.created, "branch should be created"
+    assert any(b.startswith("TEST-456-") for b in git.created), f"Expected branch starting with TEST-456, got {git.created}"
 
 
-def test_work_start_new_non_interactive_forwards_issue_args(monkeypatch, tmp_path):
+def test_work_start_new_non_interactive_forwards_issue_args(monkeypatch):
     captured_create_issue_kwargs = {}
 
-    monkeypatch.setattr(ws, "current_branch", lambda repo_root: None)
-    monkeypatch.setattr(
-        ws,
-        "create_branch",
-        lambda repo_root, branch_name, from_ref=None, remote="origin": True,
-    )
-    monkeypatch.setattr(ws, "branch_exists", lambda repo_root, name: False)
-
-    class FakeJira:
-        def get_issue_summary(self, key):
-            return "Test issue summary"
-
-        def transition_by_name(self, key, name):
-            return True
+    use_git(monkeypatch)
 
-        def add_comment(self, key, body):
-            return True
-
-        def get_current_account_id(self):
-            return "test-account-id-789"
-
-        def assign_issue(self, key, account_id):
-            return True
-
-    monkeypatch.setattr(
-        jira_client_module.JiraClient,
-        "from_config",
-        classmethod(lambda cls, cfg: FakeJira()),
-    )
+    use_jira(monkeypatch, FakeJira(summary="Test issue summary"))
 
     def fake_create_issue(jira, project_key, repo_root, config, **kwargs):
         nonlocal captured_create_issue_kwargs
@@ -133,22 +142,8 @@ def test_work_start_new_non_interactive_forwards_issue_args(monkeypatch, tmp_pat
 
     monkeypatch.setattr(ws, "create_new_issue", fake_create_issue)
 
-    repo_root = tmp_path
-    (repo_root / ".git").mkdir()
     config = {"branch": {"pattern": "{issue_key}-{slug}"}, "jira": {}}
-    meta = ContextMeta(
-        user_config_path=None,
-        project_config_path=None,
-        source_summary="defaults",
-    )
-    fake_ctx = Context(
-        repo_root=repo_root,
-        config=config,
-        github_repo="org/repo",
-        jira_project_key="TEST",
-        meta=meta,
-    )
-    monkeypatch.setattr(ws, "resolve_context", lambda: fake_ctx)
+    use_context(monkeypatch, config, "TEST")
 
     rc = ws.work_start(
         create_new=True,
@@ -176,26 +171,67 @@ def test_work_start_new_non_interactive_forwards_issue_args(monkeypatch, tmp_pat
     }
     assert captured_create_issue_kwargs["save_defaults"] is False
 
-def test_work_start_errors_with_both_new_and_issue_key(monkeypatch, tmp_path):
-    """Test that providing both --new and issue_key returns error."""
-    repo_root = tmp_path
-    (repo_root / ".git").mkdir()
-    config = {}
-    meta = ContextMeta(user_config_path=None, project_config_path=None, source_summary="defaults")
-    fake_ctx = Context(repo_root=repo_root, config=config, github_repo="org/repo", jira_project_key="TEST", meta=meta)
-    monkeypatch.setattr(ws, "resolve_context", lambda: fake_ctx)
-
-    rc = ws.work_start(issue_key="ABC-123", create_new=True)
+@pytest.mark.parametrize("kwargs,error", [
+    pytest.param({"issue_key": "ABC-123", "create_new": True},
+                 "Cannot specify both --new and issue_key", id="both_new_and_issue_key"),
+    pytest.param({}, "Must specify issue_key or --new", id="neither_new_nor_issue_key"),
+])
+def test_work_start_rejects_issue_arguments(monkeypatch, kwargs, error):
+    """Test that --new and an issue key are mutually exclusive but one is required."""
+    use_context(monkeypatch, {}, "TEST")
+    event_details = {}
+
+    rc = ws.work_start(**kwargs, event_details=event_details)
     assert rc == 1
+    assert event_details["error"] == error
 
-def test_work_start_errors_with_neither_new_nor_issue_key(monkeypatch, tmp_path):
-    """Test that providing neither --new nor issue_key returns error."""
-    repo_root = tmp_path
-    (repo_root / ".git").mkdir()
-    config = {}
-    meta = ContextMeta(user_config_path=None, project_config_path=None, source_summary="defaults")
-    fake_ctx = Context(repo_root=repo_root, config=config, github_repo="org/repo", jira_project_key="TEST", meta=meta)
-    monkeypatch.setattr(ws, "resolve_context", lambda: fake_ctx)
+def test_work_start_pattern_without_slug_still_reports_summary(monkeypatch, capsys):
+    git = use_git(monkeypatch)
 
-    rc = ws.work_start()
-    assert rc == 1
+    use_jira(monkeypatch, FakeJira(account_id=None))
+
+    config = {"branch": {"pattern": "feature/{issue_key}"}}
+    use_context(monkeypatch, config)
+
+    rc = ws.work_start(issue_key="ABC-9", transition=False, comment=False)
+    assert rc == 0
+    assert git.created == ["feature/ABC-9"]
+    assert "Implement feature X" in capsys.readouterr().out
+
+
+class SlowAssignJira(FakeJira):
+    def get_current_account_id(self):
+        time.sleep(0.05)  # long enough for a concurrent transition to overtake it
+        return super().get_current_account_id()
+
+
+def test_work_start_assigns_before_transition(monkeypatch):
+    """Workflows may only let the assignee start work, so assignment must land first."""
+    use_git(monkeypatch)
+    jira = use_jira(monkeypatch, SlowAssignJira())
+    use_context(monkeypatch, {})
+
+    assert ws.work_start(issue_key="ABC-1", transition=True, comment=True) == 0
+    assert jira.updates == [("assign", "test-account-id"), ("transition", "In Progress")]
+
+
+class FailingCommentJira(FakeJira):
+    def add_comment(self, key, body):
+        raise RuntimeError("comment endpoint down")
+
+
+def test_work_start_reports_failed_jira_call(monkeypatch, capsys):
+    """One failing Jira call is reported as not done without losing the others."""
+    git = use_git(monkeypatch)
+    use_jira(monkeypatch, FailingCommentJira())
+    use_context(monkeypatch, {})
+    event_details = {}
+
+    rc = ws.work_start(issue_key="ABC-1", transition=True, comment=True, event_details=event_details)
+
+    assert rc == 0
+    assert git.created == ["ABC-1-implement-feature-x"]
+    assert event_details["jira_assigned"] is True
+    assert event_details["jira_transitioned"] is True
+    assert event_details["jira_commented"] is False
+    assert "comment endpoint down" in capsys.readouterr().out